@@ -1,7 +1,7 @@
-def generate_next_actions(readiness, roles):
+def next_actions(status, roles):
     actions = []
 
-    if readiness["status"] != "Ready":
+    if status != "Ready":
         actions.append("Delay placements and focus on skill improvement")
 
     if roles:
@@ -9,4 +9,8 @@ def generate_next_actions(readiness, roles):
 
     actions.append("Schedule mock interview after 7 days")
 
-    return actions
+    return tuple(actions)
+
+
+def generate_next_actions(readiness, roles):
+    return list(next_actions(readiness["status"], roles))
@@ -1,112 +1,223 @@
 import re
+from functools import lru_cache
+from types import MappingProxyType
 
-def analyze_feedback(feedback_text):
-    text = feedback_text.lower()
+from agents.models import FeedbackAnalysis
+from agents.preparation_plan import build_plan
 
-    strengths = set()
-    gaps = set()
-
-    skill_map = {
-        "communication": {
-            "keywords": ["communication"],
-            "positive": ["confident", "clear", "articulate", "well explained"],
-            "negative": ["nervous", "hesitant", "unclear", "rambling","weak","bad"],
-            "strength_label": "Clear and confident communication",
-            "gap_label": "Communication clarity and confidence"
-        },
-        "sql": {
-            "keywords": ["sql"],
-            "positive": ["strong", "good", "excellent"],
-            "negative": ["weak", "struggled", "basic","bad"],
-            "strength_label": "Strong SQL fundamentals",
-            "gap_label": "SQL fundamentals"
-        },
-        "python": {
-            "keywords": ["python"],
-            "positive": ["strong", "good", "clean"],
-            "negative": ["weak", "slow", "confused"],
-            "strength_label": "Good Python problem-solving skills",
-            "gap_label": "Python problem-solving"
-        },
-        "statistics": {
-            "keywords": ["statistics", "probability"],
-            "positive": ["strong", "clear"],
-            "negative": ["average", "weak", "confused"],
-            "strength_label": "Solid understanding of statistics",
-            "gap_label": "Statistical reasoning"
-        },
-        "machine learning": {
-            "keywords": ["machine learning", "ml"],
-            "positive": ["strong", "good", "hands-on"],
-            "negative": ["theoretical", "weak", "no hands-on","bad"],
-            "strength_label": "Practical machine learning knowledge",
-            "gap_label": "Practical machine learning application"
-        },
-        "dashboard": {
-            "keywords": ["dashboard", "power bi", "tableau"],
-            "positive": ["strong", "good", "impressive"],
-            "negative": ["basic", "weak","bad"],
-            "strength_label": "Strong data visualization skills",
-            "gap_label": "Advanced dashboarding skills"
-        }
+# Compiled into one matcher on first use; analyze_feedback() only runs it.
+# Read-only, like the matcher built from it, so both can be shared by
+# concurrent requests.
+SKILL_MAP = {
+    "communication": {
+        "keywords": ("communication",),
+        "positive": ("confident", "clear", "articulate", "well explained"),
+        "negative": ("nervous", "hesitant", "unclear", "rambling","weak","bad"),
+        "strength_label": "Clear and confident communication",
+        "gap_label": "Communication clarity and confidence"
+    },
+    "sql": {
+        "keywords": ("sql",),
+        "positive": ("strong", "good", "excellent"),
+        "negative": ("weak", "struggled", "basic","bad"),
+        "strength_label": "Strong SQL fundamentals",
+        "gap_label": "SQL fundamentals"
+    },
+    "python": {
+        "keywords": ("python",),
+        "positive": ("strong", "good", "clean"),
+        "negative": ("weak", "slow", "confused"),
+        "strength_label": "Good Python problem-solving skills",
+        "gap_label": "Python problem-solving"
+    },
+    "statistics": {
+        "keywords": ("statistics", "probability"),
+        "positive": ("strong", "clear"),
+        "negative": ("average", "weak", "confused"),
+        "strength_label": "Solid understanding of statistics",
+        "gap_label": "Statistical reasoning"
+    },
+    "machine learning": {
+        "keywords": ("machine learning", "ml"),
+        "positive": ("strong", "good", "hands-on"),
+        "negative": ("theoretical", "weak", "no hands-on","bad"),
+        "strength_label": "Practical machine learning knowledge",
+        "gap_label": "Practical machine learning application"
+    },
+    "dashboard": {
+        "keywords": ("dashboard", "power bi", "tableau"),
+        "positive": ("strong", "good", "impressive"),
+        "negative": ("basic", "weak","bad"),
+        "strength_label": "Strong data visualization skills",
+        "gap_label": "Advanced dashboarding skills"
     }
+}
+SKILL_MAP = MappingProxyType({skill: MappingProxyType(rules) for skill, rules in SKILL_MAP.items()})
+
+POLARITIES = ("keywords", "positive", "negative")
+
+# Words, with inner apostrophes ("wasn't"), and the punctuation that ends
+# a clause. Hyphens separate words, so "sql-strong" reads as "sql strong"
+# and "machine-learning" as "machine learning"; terms are tokenized the
+# same way, so "hands-on" also matches "hands on".
+TOKEN = re.compile(r"\w+(?:'\w+)*|[,.;!?\n]")
+
+# Clause boundaries: punctuation, and "and"/"but" as whole words only
+# (not inside "understanding" or "standard")
+CLAUSE_BREAKS = (",", ".", ";", "!", "?", "\n", "and", "but")
+
+# Words that flip the polarity of a term up to NEGATION_WINDOW words after
+# them in the same clause ("not confident", "wasn't very strong")
+NEGATIONS = frozenset({
+    "not", "no", "never", "without", "hardly", "cannot", "lacks", "lacking",
+    "isn't", "wasn't", "aren't", "weren't", "don't", "doesn't", "didn't", "can't",
+    "couldn't", "won't", "wouldn't", "hasn't", "haven't", "hadn't"
+})
+NEGATION_WINDOW = 3
+
+# Longer feedback is cut (at a word boundary) before analysis, so one huge
+# paste cannot hold a worker for long
+MAX_FEEDBACK_CHARS = 20000
+
+# Reported as the only gap when no skill gap was found
+NO_GAPS_LABEL = "No major technical gaps identified"
+
+# Polarity of a negated term: "not confident" is a gap, but "not weak" is
+# no praise, so a negated negative term counts as neither (None)
+NEGATED = MappingProxyType({"keywords": "keywords", "positive": "negative", "negative": None})
+
+# Matcher entries of the words that are not the start of a term
+CLAUSE_BREAK = "clause break"
+NEGATION = "negation"
+
+
+def compile_skill_matcher(skill_map):
+    """
+    Compile a skill map into a read-only word -> entry table for
+    scan_clauses().
+
+    A word that starts terms maps to its candidates, (term tokens,
+    (skill, polarity) hits, hits when negated) longest term first, so
+    "no hands-on" wins over "no"; other clause breaks and negations map
+    to CLAUSE_BREAK and NEGATION. Terms are tokenized like the feedback,
+    so they only match whole words ("ml" does not match inside "html",
+    "clear" not inside "unclear").
+    """
+    term_hits = {}
+    for skill, rules in skill_map.items():
+        for polarity in POLARITIES:
+            for term in rules[polarity]:
+                term_hits.setdefault(tuple(TOKEN.findall(term)), set()).add((skill, polarity))
+
+    candidates = {}
+    for words in sorted(term_hits, key=len, reverse=True):
+        hits = term_hits[words]
+        negated = frozenset(
+            (skill, NEGATED[polarity]) for skill, polarity in hits if NEGATED[polarity] is not None
+        )
+        candidates.setdefault(words[0], []).append((words, frozenset(hits), negated))
+
+    matcher = dict.fromkeys(NEGATIONS, NEGATION)
+    matcher.update(dict.fromkeys(CLAUSE_BREAKS, CLAUSE_BREAK))
+    matcher.update((first, tuple(terms)) for first, terms in candidates.items())
+    return MappingProxyType(matcher)
 
-    # Split feedback into clauses to link sentiment with skill
-    clauses = re.split(r",|and|but|\.", text)
 
-    for clause in clauses:
-        for skill, rules in skill_map.items():
-            if any(k in clause for k in rules["keywords"]):
-                if any(p in clause for p in rules["positive"]):
-                    strengths.add(rules["strength_label"])
-                if any(n in clause for n in rules["negative"]):
-                    gaps.add(rules["gap_label"])
+@lru_cache(maxsize=None)
+def get_skill_matcher():
+    """The matcher for SKILL_MAP, compiled on first use to keep imports cheap."""
+    return compile_skill_matcher(SKILL_MAP)
+
+
+def scan_clauses(text):
+    """
+    Yield the set of (skill, polarity) hits of each clause of lowercase
+    `text`, with negated terms mapped through NEGATED. One pass over
+    the tokens, so the cost is linear in the length of the text.
+    """
+    matcher = get_skill_matcher()
+    tokens = TOKEN.findall(text.replace("\u2019", "'"))
+    hits = set()
+    negated_until = -1
+    next_token = 0
+    for i, token in enumerate(tokens):
+        # "in" and [] on a mappingproxy are as fast as on a dict; .get() is not
+        if token not in matcher:
+            continue
+        entry = matcher[token]
+        if entry is CLAUSE_BREAK:
+            if hits:
+                yield hits
+                hits = set()
+            negated_until = -1
+            continue
+        if entry is NEGATION:
+            negated_until = i + NEGATION_WINDOW
+            continue
+        if i < next_token:
+            continue  # inside a multi-word term
+
+        for words, term_hits, negated_hits in entry:
+            if len(words) == 1 or tuple(tokens[i:i + len(words)]) == words:
+                break
+        else:
+            if token in NEGATIONS:
+                negated_until = i + NEGATION_WINDOW
+            continue
+
+        next_token = i + len(words)
+        if i <= negated_until:
+            hits |= negated_hits
+        else:
+            hits |= term_hits
+    if hits:
+        yield hits
+
+
+def truncate_feedback(feedback_text):
+    """Cut feedback longer than MAX_FEEDBACK_CHARS back to the last whole word."""
+    if len(feedback_text) <= MAX_FEEDBACK_CHARS:
+        return feedback_text
+    head = feedback_text[:MAX_FEEDBACK_CHARS]
+    if feedback_text[MAX_FEEDBACK_CHARS].isspace():
+        return head
+    cut = max(head.rfind(" "), head.rfind("\n"))
+    return head[:cut] if cut > 0 else head
+
+
+def assess_feedback(feedback_text):
+    """Strengths, gaps and 7-day plan for one feedback text, as a FeedbackAnalysis."""
+    text = truncate_feedback(feedback_text).lower()
+
+    strengths = set()
+    gaps = set()
+
+    # Link sentiment with skill within each clause
+    for hits in scan_clauses(text):
+        for skill, polarity in hits:
+            if polarity == "keywords":
+                continue
+            if (skill, "keywords") in hits:
+                if polarity == "positive":
+                    strengths.add(SKILL_MAP[skill]["strength_label"])
+                else:
+                    gaps.add(SKILL_MAP[skill]["gap_label"])
 
     # Fallbacks
     if not strengths:
         strengths.add("Basic understanding of core concepts")
 
     if not gaps:
-        gaps.add("No major technical gaps identified")
+        gaps.add(NO_GAPS_LABEL)
 
     # ---------------- DYNAMIC 7-DAY PLAN ---------------- 
     # Always generate all 7 days, but customize based on gaps
-    plan = []
-
-    # Day 1: Communication (always include, customize if gap exists)
-    if "Communication clarity and confidence" in gaps:
-        plan.append("Day 1: Communication drills and mock explanations")
-    else:
-        plan.append("Day 1: Communication and fundamentals mastery")
-
-    # Day 2: SQL (always include, customize if gap exists)
-    if "SQL fundamentals" in gaps:
-        plan.append("Day 2: SQL joins, subqueries, and optimization")
-    else:
-        plan.append("Day 2: SQL mastery and database skills")
-
-    # Day 3: Python (always include, customize if gap exists)
-    if "Python problem-solving" in gaps:
-        plan.append("Day 3: Python DSA and debugging exercises")
-    else:
-        plan.append("Day 3: Python and problem-solving mastery")
-
-    # Day 4: Statistics (always include, customize if gap exists)
-    if "Statistical reasoning" in gaps:
-        plan.append("Day 4: Probability, distributions, and case questions")
-    else:
-        plan.append("Day 4: Statistics and probability mastery")
-
-    # Day 5: ML (always include, customize if gap exists)
-    if "Practical machine learning application" in gaps:
-        plan.append("Day 5: ML mini-project and model evaluation")
-    else:
-        plan.append("Day 5: Machine learning and advanced skills")
-
-    # Day 6: Mock Interview (always included)
-    plan.append("Day 6: Full mock interview (technical + HR)")
-    
-    # Day 7: Resume & Final Prep (always included)
-    plan.append("Day 7: Resume refinement and confidence preparation")
-
-    return list(strengths), list(gaps), plan
+    plan = build_plan(gaps)
+
+    return FeedbackAnalysis(tuple(strengths), tuple(gaps), tuple(plan))
+
+
+def analyze_feedback(feedback_text):
+    """Legacy interface: lists of strengths and gaps, and the plan as "Day N: ..." strings."""
+    strengths, gaps, plan = assess_feedback(feedback_text)
+    return list(strengths), list(gaps), [str(day) for day in plan]
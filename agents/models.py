@@ -0,0 +1,108 @@
+from typing import NamedTuple, Optional, Tuple
+
+# Display names of the six assessed skills, in CandidateScores field order
+SKILL_NAMES = (
+    "Excel",
+    "SQL",
+    "Python",
+    "Statistics & Probability",
+    "Machine Learning",
+    "Tableau & Power BI"
+)
+
+# Request field names, in CandidateScores field order
+REQUEST_FIELDS = ("excel", "sql", "python", "stats", "ml", "bi")
+
+# Valid range of a skill score
+MIN_SCORE, MAX_SCORE = 0, 100
+
+
+class CandidateScores(NamedTuple):
+    """The six skill scores of one candidate (0-100)."""
+    excel: int
+    sql: int
+    python: int
+    stats: int
+    ml: int
+    bi: int
+
+    @classmethod
+    def from_request(cls, data):
+        """
+        Build from an /api/evaluate payload (missing scores count as 0).
+        Raises ValueError when a score cannot be converted to an integer
+        or is outside MIN_SCORE..MAX_SCORE.
+        """
+        scores = cls._make(int(data.get(field, 0)) for field in REQUEST_FIELDS)
+        for field, score in zip(REQUEST_FIELDS, scores):
+            if not MIN_SCORE <= score <= MAX_SCORE:
+                raise ValueError(f"{field} must be between {MIN_SCORE} and {MAX_SCORE}, got {score}")
+        return scores
+
+    def as_dict(self):
+        return dict(zip(SKILL_NAMES, self))
+
+
+class ReadinessResult(NamedTuple):
+    status: str
+    final_score: float
+    reasons: Tuple[str, ...]
+    suggestions: Tuple[str, ...]
+
+    def as_dict(self):
+        return {
+            "status": self.status,
+            "final_score": self.final_score,
+            "reasons": list(self.reasons),
+            "suggestions": list(self.suggestions)
+        }
+
+
+class RoleMatch(NamedTuple):
+    """
+    recommended: role names
+    rejected: (role, blocking skills) pairs
+    role_gaps: (role, ((skill, required, actual, gap), ...)) pairs
+    """
+    recommended: Tuple[str, ...]
+    rejected: Tuple[Tuple[str, Tuple[str, ...]], ...]
+    role_gaps: Tuple[Tuple[str, tuple], ...]
+
+    def rejected_dict(self):
+        return {role: list(gaps) for role, gaps in self.rejected}
+
+    def role_gaps_dict(self):
+        return {role: list(details) for role, details in self.role_gaps}
+
+
+class FeedbackAnalysis(NamedTuple):
+    strengths: Tuple[str, ...]
+    gaps: Tuple[str, ...]
+    plan: tuple  # PlanDay records
+
+
+class ImprovementPlan(NamedTuple):
+    """
+    Smallest score increase that reaches one target (a readiness tier or a
+    role). points is the total number of points added, None when the target
+    cannot be reached within the 0-100 scale; increments are (skill, points)
+    pairs; status is the readiness status after applying them.
+    """
+    target: str
+    points: Optional[int]
+    increments: Tuple[Tuple[str, int], ...]
+    status: str
+
+
+class WhatIf(NamedTuple):
+    """
+    status, score: current readiness status and weighted score
+    tiers: an ImprovementPlan per readiness tier above "Not Ready"
+    single_skill: per tier, an ImprovementPlan per skill improving alone
+    roles: an ImprovementPlan per role, in catalogue order
+    """
+    status: str
+    score: float
+    tiers: Tuple[ImprovementPlan, ...]
+    single_skill: Tuple[Tuple[ImprovementPlan, ...], ...]
+    roles: Tuple[ImprovementPlan, ...]
@@ -0,0 +1,134 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class PlanDay(NamedTuple):
+    """One day of the 7-day preparation plan."""
+    day: int
+    focus_key: str
+    focus: str
+
+    def __str__(self):
+        return f"Day {self.day}: {self.focus}"
+
+
+# (day, focus key, gap label that customizes the day, focus if gap, default focus)
+PLAN_TEMPLATE = (
+    (1, "communication", "Communication clarity and confidence",
+     "Communication drills and mock explanations", "Communication and fundamentals mastery"),
+    (2, "sql", "SQL fundamentals",
+     "SQL joins, subqueries, and optimization", "SQL mastery and database skills"),
+    (3, "python", "Python problem-solving",
+     "Python DSA and debugging exercises", "Python and problem-solving mastery"),
+    (4, "statistics", "Statistical reasoning",
+     "Probability, distributions, and case questions", "Statistics and probability mastery"),
+    (5, "machine_learning", "Practical machine learning application",
+     "ML mini-project and model evaluation", "Machine learning and advanced skills"),
+    (6, "mock_interview", None,
+     "Full mock interview (technical + HR)", "Full mock interview (technical + HR)"),
+    (7, "resume", None,
+     "Resume refinement and confidence preparation", "Resume refinement and confidence preparation"),
+)
+
+# Precomputed (gap_label, day if gap, default day) per plan day
+_PLAN_DAYS = tuple(
+    (gap_label, PlanDay(day, key, gap_focus), PlanDay(day, key, default_focus))
+    for day, key, gap_label, gap_focus, default_focus in PLAN_TEMPLATE
+)
+
+DEFAULT_PLAN = tuple(default_day for _, _, default_day in _PLAN_DAYS)
+
+DAY_ACTIVITIES = MappingProxyType({
+    "mock_interview": (
+        "Review technical concepts and coding problems",
+        "Practice STAR method for behavioral questions",
+        "Prepare questions to ask the interviewer",
+        "Set up interview environment and test equipment",
+        "Review your projects and be ready to explain them"
+    ),
+    "sql": (
+        "Practice complex joins and subqueries",
+        "Work on query optimization techniques",
+        "Solve SQL problems on LeetCode/HackerRank",
+        "Build a mini-project using SQL"
+    ),
+    "python": (
+        "Solve data structures and algorithms problems",
+        "Practice debugging and code review",
+        "Work on Python-specific projects",
+        "Review Python best practices and patterns"
+    ),
+    "communication": (
+        "Practice explaining technical concepts clearly",
+        "Record yourself and review for improvement",
+        "Practice STAR method storytelling",
+        "Work on clarity and structure in explanations"
+    ),
+    "statistics": (
+        "Review core statistical concepts",
+        "Practice probability problems",
+        "Work on case studies and analysis",
+        "Apply statistics to real-world scenarios"
+    ),
+    "machine_learning": (
+        "Review ML algorithms and concepts",
+        "Work on a mini ML project",
+        "Practice model evaluation techniques",
+        "Study real-world ML applications"
+    ),
+    "resume": (
+        "Update resume with recent projects",
+        "Prepare portfolio and GitHub profile",
+        "Practice confidence-building exercises",
+        "Review and refine your preparation"
+    ),
+    "general": (
+        "Review core concepts related to today's focus",
+        "Practice hands-on exercises and problems",
+        "Apply learning through mini-projects",
+        "Document progress and plan next steps"
+    )
+})
+
+# Keyword cascade for free-text focus descriptions, checked in order
+FOCUS_KEYWORDS = (
+    ("mock_interview", ("mock interview", "interview")),
+    ("sql", ("sql",)),
+    ("python", ("python",)),
+    ("communication", ("communication", "explain")),
+    ("statistics", ("statistics", "probability")),
+    ("machine_learning", ("machine learning", "ml")),
+    ("resume", ("resume", "confidence")),
+)
+
+
+def build_plan(gaps):
+    """Build the 7-day plan for a set of gap labels (pure table lookup)."""
+    return [
+        gap_day if gap_label in gaps else default_day
+        for gap_label, gap_day, default_day in _PLAN_DAYS
+    ]
+
+
+def focus_key_for(focus_text):
+    """Classify a free-text focus into a DAY_ACTIVITIES key."""
+    focus_lower = focus_text.lower()
+    for key, keywords in FOCUS_KEYWORDS:
+        if any(keyword in focus_lower for keyword in keywords):
+            return key
+    return "general"
+
+
+def parse_plan_item(plan_item, position):
+    """
+    Convert a legacy "Day N: focus" string into a PlanDay.
+    Items without a "Day N:" prefix take their 1-based position as the day.
+    """
+    if ":" in plan_item:
+        day_part, activity_part = plan_item.split(":", 1)
+        day = int(day_part.replace("Day", "").strip())
+        focus = activity_part.strip()
+    else:
+        day = position
+        focus = plan_item
+    return PlanDay(day, focus_key_for(focus), focus)
@@ -1,33 +1,41 @@
-from rules.scoring_rules import (
-    SKILL_WEIGHTS,
-    READINESS_THRESHOLDS,
-    MIN_SKILL_SCORE
-)
+from agents import scoring_engine
+from agents.feedback_agent import truncate_feedback
+from agents.models import ReadinessResult, SKILL_NAMES
+from rules.rule_store import rule_store
 
-def evaluate_readiness(scores, feedback_text):
-    reasons = []
-    suggestions = []
+def assess_readiness(candidate, feedback_text, tables=None):
+    """
+    Readiness of one CandidateScores record, as a ReadinessResult.
+    `tables`: scoring_engine tables to use (default: the active rules).
+    """
+    if tables is None:
+        tables = scoring_engine.get_tables()
+
+    return readiness_from_result(candidate, feedback_text, scoring_engine.evaluate_candidate(candidate, tables), tables)
+
+
+def readiness_from_result(candidate, feedback_text, result, tables):
+    """ReadinessResult of one candidate from its scoring_engine.CandidateResult."""
+    below_minimum = result.below_minimum
+    weak_skills = [
+        skill
+        for skill, score, j in zip(SKILL_NAMES, candidate, tables.model_columns)
+        if (below_minimum[j] if j >= 0 else score < tables.min_skill_score)
+    ]
+    return build_readiness(scoring_engine.STATUS_LABELS[result.status], result.weighted, weak_skills, feedback_text)
 
-    # Weighted score calculation
-    weighted_score = 0
-    for skill, score in scores.items():
-        weight = SKILL_WEIGHTS.get(skill, 0)
-        weighted_score += score * weight
 
-        if score < MIN_SKILL_SCORE:
-            reasons.append(f"{skill} score is below minimum expected level")
-            suggestions.append(f"Revise fundamentals of {skill}")
+def build_readiness(status, weighted_score, weak_skills, feedback_text):
+    """ReadinessResult with the reasons and suggestions for skills below the minimum and the feedback."""
+    reasons = []
+    suggestions = []
 
-    # Readiness classification
-    if weighted_score >= READINESS_THRESHOLDS["READY"]:
-        status = "Ready"
-    elif weighted_score >= READINESS_THRESHOLDS["ALMOST_READY"]:
-        status = "Almost Ready"
-    else:
-        status = "Not Ready"
+    for skill in weak_skills:
+        reasons.append(f"{skill} score is below minimum expected level")
+        suggestions.append(f"Revise fundamentals of {skill}")
 
     # Feedback-based reasoning
-    feedback = feedback_text.lower()
+    feedback = truncate_feedback(feedback_text).lower()
 
     if "communication" in feedback or "explain" in feedback:
         reasons.append("Communication clarity needs improvement")
@@ -36,9 +44,30 @@ def evaluate_readiness(scores, feedback_text):
     if not reasons:
         reasons.append("Strong and balanced performance across skills")
 
-    return {
-        "status": status,
-        "final_score": round(weighted_score, 2),
-        "reasons": reasons,
-        "suggestions": list(set(suggestions))[:3]
-    }
+    return ReadinessResult(
+        status=status,
+        final_score=round(weighted_score, 2),
+        reasons=tuple(reasons),
+        suggestions=tuple(list(set(suggestions))[:3])
+    )
+
+
+def evaluate_readiness(scores, feedback_text):
+    """
+    Dict interface: `scores` maps skill names to scores. Only the skills
+    given are weighted and checked against the minimum, in the caller's
+    order; names the rules do not weight count with weight 0.
+    """
+    rules = rule_store.current
+    weighted_score = 0
+    weak_skills = []
+    for skill, score in scores.items():
+        weighted_score += score * rules.skill_weights.get(skill, 0)
+        if score < rules.min_skill_score:
+            weak_skills.append(skill)
+
+    thresholds = rules.readiness_thresholds
+    status = scoring_engine.STATUS_LABELS[
+        (weighted_score >= thresholds["ALMOST_READY"]) + (weighted_score >= thresholds["READY"])
+    ]
+    return build_readiness(status, weighted_score, weak_skills, feedback_text).as_dict()
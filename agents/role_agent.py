@@ -1,19 +1,92 @@
-from rules.role_requirements import ROLE_REQUIREMENTS
+from agents import scoring_engine
+from agents.models import RoleMatch
+from rules.rule_store import rule_store
 
-def recommend_roles(scores):
+def match_roles(candidate, tables=None):
+    """
+    Role eligibility of one CandidateScores record, as a RoleMatch with
+    (skill, required, actual, gap) details for every rejected role.
+    `tables`: scoring_engine tables to use (default: the active rules).
+    """
+    if tables is None:
+        tables = scoring_engine.get_tables()
+
+    return roles_from_result(candidate, scoring_engine.evaluate_candidate(candidate, tables), tables)
+
+
+def roles_from_result(candidate, result, tables):
+    """RoleMatch of one candidate from its scoring_engine.CandidateResult."""
     recommended = []
-    not_recommended = {}
+    rejected = []
+    role_gaps = []
+
+    skills = tables.skills
+    fields = tables.column_fields
+
+    for role, blocking in zip(tables.roles, result.blocking):
+        if not blocking:
+            recommended.append(role)
+            continue
+
+        details = []
+        for j, min_score in blocking:
+            if fields[j] >= 0:
+                actual = candidate[fields[j]]
+                details.append((skills[j], min_score, actual, min_score - actual))
+
+        rejected.append((role, tuple(skills[j] for j, _ in blocking)))
+        role_gaps.append((role, tuple(details)))
+
+    return RoleMatch(tuple(recommended), tuple(rejected), tuple(role_gaps))
 
-    for role, requirements in ROLE_REQUIREMENTS.items():
-        gaps = []
 
+def recommend_roles_detailed(scores):
+    """
+    Like recommend_roles(), plus per-role gap details for the rejected roles:
+    {role: [(skill, required, actual, gap), ...]} in requirement order.
+    `scores` maps skill names to scores (missing skills count as 0).
+    """
+    recommended = []
+    not_recommended = {}
+    role_gaps = {}
+
+    for role, requirements in rule_store.current.role_requirements.items():
+        details = []
         for skill, min_score in requirements.items():
-            if scores.get(skill, 0) < min_score:
-                gaps.append(skill)
+            actual = scores.get(skill, 0)
+            if actual < min_score:
+                details.append((skill, min_score, actual, min_score - actual))
 
-        if not gaps:
-            recommended.append(role)
+        if details:
+            not_recommended[role] = [skill for skill, _, _, _ in details]
+            role_gaps[role] = details
         else:
-            not_recommended[role] = gaps
+            recommended.append(role)
 
+    return recommended, not_recommended, role_gaps
+
+
+def recommend_roles(scores):
+    recommended, not_recommended, _ = recommend_roles_detailed(scores)
     return recommended, not_recommended
+
+
+def role_gap_details(scores, rejected, rules):
+    """
+    Gap details for a (recommended, rejected) result computed elsewhere
+    with the RuleSet `rules`. Skill names come from the canonical rule set,
+    so they are looked up directly instead of fuzzy-matched against the
+    score keys.
+    """
+    role_requirements = rules.role_requirements
+    role_gaps = {}
+    for role, gap_list in rejected.items():
+        requirements = role_requirements.get(role)
+        if requirements is None:
+            continue
+        role_gaps[role] = [
+            (skill, requirements[skill], scores[skill], requirements[skill] - scores[skill])
+            for skill in gap_list
+            if skill in scores and skill in requirements
+        ]
+    return role_gaps
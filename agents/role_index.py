@@ -0,0 +1,123 @@
+from bisect import bisect_right
+from types import MappingProxyType
+
+from rules.rule_store import compiled
+
+
+def _iter_bits(mask):
+    """Yield the indexes of the set bits of `mask`, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class RoleIndex:
+    """
+    Role catalogue index for matching candidates against many roles.
+
+    Built once from {role: {skill: minimum}}. Per skill it keeps the role
+    thresholds in sorted order with prefix bitmasks (bit r = role r), so the
+    roles a score satisfies for that skill are one bisect away. Eligibility
+    is the AND of one mask per skill: O(skills * log(roles)) bisects plus
+    word-sized bitwise ANDs, instead of scanning every (role, skill) pair.
+    Read-only once built, so one index is shared by concurrent requests.
+    """
+
+    def __init__(self, requirements):
+        self.roles = tuple(requirements)
+        self.skills = tuple(dict.fromkeys(
+            skill for skill_minimums in requirements.values() for skill in skill_minimums
+        ))
+        self.requirements = tuple(tuple(skill_minimums.items()) for skill_minimums in requirements.values())
+        self.role_ids = MappingProxyType({role: r for r, role in enumerate(self.roles)})
+        self.all_roles = (1 << len(self.roles)) - 1
+
+        # skill -> (ascending thresholds, prefix masks, mask of roles without a requirement)
+        by_skill = {}
+        for skill in self.skills:
+            entries = sorted(
+                (skill_minimums[skill], r)
+                for r, skill_minimums in enumerate(requirements.values())
+                if skill in skill_minimums
+            )
+            prefix = [0]
+            for _, r in entries:
+                prefix.append(prefix[-1] | (1 << r))
+            by_skill[skill] = (
+                tuple(minimum for minimum, _ in entries),
+                tuple(prefix),
+                self.all_roles & ~prefix[-1]
+            )
+        self._by_skill = MappingProxyType(by_skill)
+        self._max_minimum = max((m for reqs in self.requirements for _, m in reqs), default=0)
+
+    def _mask(self, scores, slack=0):
+        """Bitmask of the roles whose every minimum is at most score + slack."""
+        mask = self.all_roles
+        for skill, (thresholds, prefix, unconstrained) in self._by_skill.items():
+            mask &= prefix[bisect_right(thresholds, scores.get(skill, 0) + slack)] | unconstrained
+            if not mask:
+                break
+        return mask
+
+    def _names(self, mask):
+        return [self.roles[r] for r in _iter_bits(mask)]
+
+    def eligible(self, scores):
+        """Roles whose minimums `scores` ({skill: score}, missing = 0) all meet."""
+        return self._names(self._mask(scores))
+
+    def within(self, scores, points):
+        """Roles where no requirement is more than `points` above the candidate's score."""
+        return self._names(self._mask(scores, points))
+
+    def total_gaps(self, scores, role_ids):
+        """Summed shortfall below the minimums (as floats), for the given role indexes."""
+        return [
+            float(sum(max(minimum - scores.get(skill, 0), 0) for skill, minimum in self.requirements[r]))
+            for r in role_ids
+        ]
+
+    def closest(self, scores, n):
+        """
+        The `n` roles with the smallest total gap, as [(role, total gap)]
+        (ties in catalogue order).
+
+        A role's total gap is at least its largest single gap, so every role
+        outside within(k) has a total above k. Widening k geometrically, the
+        exact totals are only computed for the roles inside the window, and
+        the search stops as soon as n of them have a total of at most k.
+        """
+        if n <= 0 or not self.roles:
+            return []
+
+        k = 0
+        while True:
+            complete = k >= self._max_minimum
+            if complete:
+                role_ids = list(range(len(self.roles)))
+            else:
+                role_ids = list(_iter_bits(self._mask(scores, k)))
+
+            totals = self.total_gaps(scores, role_ids) if role_ids else ()
+            ranked = sorted((total, r) for total, r in zip(totals, role_ids) if complete or total <= k)
+            if complete or len(ranked) >= n:
+                return [(self.roles[r], int(total) if total.is_integer() else float(total)) for total, r in ranked[:n]]
+            k = max(1, k * 2)
+
+    def match_score(self, role, scores):
+        """
+        0-100 fit of a candidate for one role: the candidate's scores on the
+        role's skills, averaged with the role minimums as weights.
+        """
+        skill_minimums = self.requirements[self.role_ids[role]]
+        weight = sum(minimum for _, minimum in skill_minimums)
+        if not weight:
+            return 100
+        fit = sum(minimum * min(scores.get(skill, 0), 100) for skill, minimum in skill_minimums)
+        return round(fit / weight)
+
+
+# Index of the active rules' roles (or a given RuleSet's), rebuilt once per snapshot
+get_role_index = compiled(lambda rules: RoleIndex(rules.role_requirements))
@@ -0,0 +1,262 @@
+from itertools import compress
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
+
+from rules.rule_store import compiled
+from agents.models import SKILL_NAMES
+
+# Status codes returned by the engine index into this tuple
+STATUS_LABELS = ("Not Ready", "Almost Ready", "Ready")
+
+# Smallest cohort worth one matrix evaluation: below it, scoring candidates
+# one by one in plain Python is cheaper (see benchmarks/bench_batch_engine.py)
+MATRIX_MIN_CANDIDATES = 16
+
+
+# NumPy is imported by the matrix functions on first use, not here: the
+# per-candidate path is plain Python and should not pay for it at cold start
+
+
+# ---------------- PRECOMPUTED TABLES ----------------
+class ScoringTables:
+    """
+    Engine tables compiled from one rule-set snapshot; read-only once built.
+    Two tables objects compare equal when built from the same rule version.
+    """
+
+    __slots__ = (
+        "rules", "skills", "skill_index", "weights", "roles", "_role_minimums",
+        "role_skill_minimums", "thresholds", "min_skill_score",
+        "model_columns", "column_fields", "model_layout_is_identity"
+    )
+
+    def __init__(self, rules):
+        skill_weights = rules.skill_weights
+        role_requirements = rules.role_requirements
+
+        # Fixed column order: weighted skills first, then any skill that only
+        # appears in a role requirement (weight 0).
+        skills = tuple(dict.fromkeys([
+            *skill_weights,
+            *(skill for requirements in role_requirements.values() for skill in requirements)
+        ]))
+        skill_index = {skill: i for i, skill in enumerate(skills)}
+
+        weights = tuple(float(skill_weights.get(skill, 0)) for skill in skills)
+
+        self.rules = rules
+        self.skills, self.skill_index, self.weights = skills, MappingProxyType(skill_index), weights
+        self.roles = tuple(role_requirements)
+        self._role_minimums = None
+
+        # (column index, minimum) of each role's requirements, in declaration order
+        self.role_skill_minimums = tuple(
+            tuple((skill_index[skill], min_score) for skill, min_score in requirements.items())
+            for requirements in role_requirements.values()
+        )
+        self.thresholds = (
+            rules.readiness_thresholds["ALMOST_READY"],
+            rules.readiness_thresholds["READY"]
+        )
+        self.min_skill_score = rules.min_skill_score
+
+        # CandidateScores field -> column (-1 if the rules do not use the skill),
+        # and column -> CandidateScores field (-1 for skills outside the model)
+        self.model_columns = tuple(skill_index.get(skill, -1) for skill in SKILL_NAMES)
+        self.column_fields = tuple(
+            SKILL_NAMES.index(skill) if skill in SKILL_NAMES else -1 for skill in skills
+        )
+        self.model_layout_is_identity = self.model_columns == tuple(range(len(skills)))
+
+    @property
+    def role_minimums(self):
+        """
+        roles x skills array of minimums (-inf where a role has no
+        requirement on a skill), built on first use by evaluate_matrix().
+        """
+        if self._role_minimums is None:
+            import numpy as np
+
+            role_minimums = np.full((len(self.roles), len(self.skills)), -np.inf)
+            for r, requirements in enumerate(self.role_skill_minimums):
+                for j, min_score in requirements:
+                    role_minimums[r, j] = min_score
+            role_minimums.flags.writeable = False
+            # Concurrent first calls build equal arrays; either one may win
+            self._role_minimums = role_minimums
+        return self._role_minimums
+
+    @property
+    def version(self):
+        return self.rules.version
+
+    def __eq__(self, other):
+        return isinstance(other, ScoringTables) and other.rules.version == self.rules.version
+
+    def __hash__(self):
+        return hash(self.rules.version)
+
+
+# Tables for the active rules (or a given RuleSet), rebuilt once per snapshot
+get_tables = compiled(ScoringTables)
+
+
+class CandidateResult(NamedTuple):
+    """
+    The engine result for one candidate, in plain Python values.
+
+    weighted: weighted readiness score (unrounded)
+    status: status code, see STATUS_LABELS
+    below_minimum: per column, True where the skill is below min_skill_score
+    blocking: per role, the (column, minimum) requirements the candidate
+    misses, in declaration order; empty when the role is recommended
+    """
+    weighted: float
+    status: int
+    below_minimum: Tuple[bool, ...]
+    blocking: Tuple[Tuple[Tuple[int, float], ...], ...]
+
+
+def evaluate_candidate(candidate, tables=None):
+    """
+    Score one CandidateScores record in plain Python: for a single
+    candidate this is several times cheaper than building a one-row matrix.
+    Same floating-point operations, in the same order, as evaluate_matrix().
+    """
+    if tables is None:
+        tables = get_tables()
+
+    if tables.model_layout_is_identity:
+        row = candidate
+    else:
+        row = [candidate[field] if field >= 0 else 0 for field in tables.column_fields]
+
+    weighted = 0.0
+    for score, weight in zip(row, tables.weights):
+        weighted += score * weight
+    almost_ready, ready = tables.thresholds
+    min_skill_score = tables.min_skill_score
+
+    return CandidateResult(
+        weighted,
+        (weighted >= almost_ready) + (weighted >= ready),
+        tuple(score < min_skill_score for score in row),
+        tuple(
+            tuple(requirement for requirement in requirements if row[requirement[0]] < requirement[1])
+            for requirements in tables.role_skill_minimums
+        )
+    )
+
+
+def candidate_results(result, tables=None):
+    """
+    Split an evaluate_matrix() result into one CandidateResult per row.
+    Each array is converted to Python values once (tolist) rather than
+    indexed element by element.
+    """
+    if tables is None:
+        tables = get_tables()
+
+    role_gaps = result["role_gaps"]
+    blocking = zip(*(
+        [tuple(compress(requirements, flags)) for flags in role_gaps[:, r, [j for j, _ in requirements]].tolist()]
+        for r, requirements in enumerate(tables.role_skill_minimums)
+    ))
+    return [
+        CandidateResult(weighted, status, tuple(below_minimum), row_blocking)
+        for weighted, status, below_minimum, row_blocking in zip(
+            result["weighted"].tolist(), result["status"].tolist(), result["below_minimum"].tolist(), blocking
+        )
+    ]
+
+
+def evaluate_candidates(candidates, tables=None):
+    """
+    CandidateResult of each CandidateScores record, in input order: one
+    matrix evaluation for a cohort, the plain Python path for fewer than
+    MATRIX_MIN_CANDIDATES.
+    """
+    if tables is None:
+        tables = get_tables()
+
+    if len(candidates) < MATRIX_MIN_CANDIDATES:
+        return [evaluate_candidate(candidate, tables) for candidate in candidates]
+    return candidate_results(evaluate_matrix(candidate_matrix(candidates, tables), tables), tables)
+
+
+def candidate_matrix(candidates, tables=None):
+    """
+    Build an N x len(skills) float matrix from CandidateScores records.
+    With the default rules the record layout already matches the column
+    order, so this is a single array conversion.
+    """
+    import numpy as np
+
+    if tables is None:
+        tables = get_tables()
+
+    rows = np.array(candidates, dtype=float).reshape(len(candidates), len(SKILL_NAMES))
+    if tables.model_layout_is_identity:
+        return rows
+
+    matrix = np.zeros((len(candidates), len(tables.skills)))
+    for field, j in enumerate(tables.model_columns):
+        if j >= 0:
+            matrix[:, j] = rows[:, field]
+    return matrix
+
+
+def weighted_scores(matrix, tables=None):
+    """
+    Weighted readiness score per row.
+    Accumulated column by column so every row sees exactly the same
+    floating-point operations as the per-candidate loop.
+    """
+    import numpy as np
+
+    if tables is None:
+        tables = get_tables()
+
+    weights = tables.weights
+    total = np.zeros(matrix.shape[0])
+    for j in range(matrix.shape[1]):
+        total += matrix[:, j] * weights[j]
+    return total
+
+
+def readiness_codes(weighted, tables=None):
+    """Readiness status per row as an index into STATUS_LABELS."""
+    import numpy as np
+
+    if tables is None:
+        tables = get_tables()
+
+    almost_ready, ready = tables.thresholds
+    return (weighted >= almost_ready).astype(np.int8) + (weighted >= ready)
+
+
+def evaluate_matrix(matrix, tables=None):
+    """
+    Score a whole cohort in a few array operations, against one set of
+    tables (default: the active rules).
+
+    Returns a dict with:
+    - weighted: (N,) weighted readiness scores (unrounded)
+    - status: (N,) status codes, see STATUS_LABELS
+    - below_minimum: (N, skills) True where a skill is below min_skill_score
+    - role_gaps: (N, roles, skills) True where a skill blocks a role
+    - eligible: (N, roles) True where a role is recommended
+    """
+    if tables is None:
+        tables = get_tables()
+
+    weighted = weighted_scores(matrix, tables)
+    role_gaps = matrix[:, None, :] < tables.role_minimums[None, :, :]
+
+    return {
+        "weighted": weighted,
+        "status": readiness_codes(weighted, tables),
+        "below_minimum": matrix < tables.min_skill_score,
+        "role_gaps": role_gaps,
+        "eligible": ~role_gaps.any(axis=2)
+    }
@@ -0,0 +1,160 @@
+from math import ceil
+
+from agents import scoring_engine
+from agents.models import ImprovementPlan, SKILL_NAMES, WhatIf
+
+MAX_SCORE = 100
+
+# Slack for float noise in the point counts (the engine check below has
+# the final word)
+EPSILON = 1e-9
+
+
+def _field_weights(tables):
+    """Readiness weight of each CandidateScores field (0 if the rules do not use it)."""
+    return tuple(tables.weights[j] if j >= 0 else 0.0 for j in tables.model_columns)
+
+
+def _headroom(candidate):
+    return [max(0, MAX_SCORE - score) for score in candidate]
+
+
+def _evaluate(rows, tables):
+    return scoring_engine.evaluate_matrix(scoring_engine.candidate_matrix(rows, tables), tables)
+
+
+def _apply(candidate, increments):
+    return candidate._make(score + points for score, points in zip(candidate, increments))
+
+
+def _greedy_points(gap, weights, headroom):
+    """
+    Fewest whole points whose weighted sum covers `gap`, as per-field
+    increments (None if even maxing out every skill is not enough).
+
+    Every point in a skill is worth that skill's weight, so the best n
+    points are always the n highest-valued ones: fill skills in order of
+    weight, each up to its headroom, and stop once the gap is covered.
+    """
+    increments = [0] * len(weights)
+    for i in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        if gap <= EPSILON:
+            break
+        if weights[i] <= 0:
+            return None
+        increments[i] = min(headroom[i], ceil(gap / weights[i] - EPSILON))
+        gap -= increments[i] * weights[i]
+    return increments if gap <= EPSILON else None
+
+
+def _top_up(candidate, increments, weights, headroom, threshold, tables):
+    """
+    Add single points (highest weight first) until the engine's own
+    weighted score reaches `threshold`; covers float rounding right at the
+    threshold. Returns (increments, status code), or None if the headroom
+    runs out first.
+    """
+    order = sorted(range(len(weights)), key=lambda i: -weights[i])
+    while True:
+        result = _evaluate([_apply(candidate, increments)], tables)
+        if result["weighted"][0] >= threshold:
+            return increments, result["status"][0]
+        room = [i for i in order if weights[i] > 0 and increments[i] < headroom[i]]
+        if not room:
+            return None
+        increments[room[0]] += 1
+
+
+def role_increments(candidate, role, tables):
+    """
+    Per-field increments that meet every minimum of one role (each skill
+    raised exactly to its minimum), or None if a minimum is above the scale
+    or on a skill the candidate has no score for.
+    """
+    increments = [0] * len(candidate)
+    for j, min_score in tables.role_skill_minimums[tables.roles.index(role)]:
+        field = tables.column_fields[j]
+        actual = candidate[field] if field >= 0 else 0
+        if actual >= min_score:
+            continue
+        if field < 0 or min_score > MAX_SCORE:
+            return None
+        increments[field] = ceil(min_score - actual)
+    return increments
+
+
+def _checked_plans(candidate, scenarios, current_status, tables):
+    """
+    ImprovementPlans for [(target, threshold or None, weights, increments)]:
+    every proposed candidate is re-scored by the engine in one matrix, and
+    the rare readiness plan that float rounding leaves just short of its
+    threshold is topped up.
+    """
+    headroom = _headroom(candidate)
+    proposed = [k for k, (_, _, _, increments) in enumerate(scenarios) if increments is not None]
+    result = _evaluate([_apply(candidate, scenarios[k][3]) for k in proposed], tables) if proposed else None
+    checked = {k: (result["weighted"][n], result["status"][n]) for n, k in enumerate(proposed)}
+
+    plans = []
+    for k, (target, threshold, weights, increments) in enumerate(scenarios):
+        status = current_status
+        if increments is not None:
+            weighted, code = checked[k]
+            if threshold is not None and weighted < threshold:
+                topped_up = _top_up(candidate, increments, weights, headroom, threshold, tables)
+                increments, code = topped_up if topped_up is not None else (None, None)
+            if increments is not None:
+                status = scoring_engine.STATUS_LABELS[code]
+
+        if increments is None:
+            plans.append(ImprovementPlan(target, None, (), status))
+        else:
+            plans.append(ImprovementPlan(
+                target,
+                sum(increments),
+                tuple((skill, points) for skill, points in zip(SKILL_NAMES, increments) if points),
+                status
+            ))
+    return plans
+
+
+def improvement_plans(candidate, tables=None):
+    """
+    What-if analysis for one CandidateScores record against one rule set,
+    as a WhatIf: the fewest points (and where) to reach each readiness tier,
+    per skill if it improved alone, and the points to qualify for each role.
+    """
+    if tables is None:
+        tables = scoring_engine.get_tables()
+
+    current = _evaluate([candidate], tables)
+    weighted = float(current["weighted"][0])
+    current_status = scoring_engine.STATUS_LABELS[current["status"][0]]
+    weights = _field_weights(tables)
+    headroom = _headroom(candidate)
+
+    def only(field):
+        return tuple(w if i == field else 0.0 for i, w in enumerate(weights))
+
+    tier_labels = scoring_engine.STATUS_LABELS[1:]
+    scenarios = [
+        (label, threshold, weights, _greedy_points(threshold - weighted, weights, headroom))
+        for label, threshold in zip(tier_labels, tables.thresholds)
+    ]
+    for threshold in tables.thresholds:
+        scenarios.extend(
+            (skill, threshold, only(i), _greedy_points(threshold - weighted, only(i), headroom))
+            for i, skill in enumerate(SKILL_NAMES)
+        )
+    scenarios.extend((role, None, None, role_increments(candidate, role, tables)) for role in tables.roles)
+
+    plans = _checked_plans(candidate, scenarios, current_status, tables)
+
+    tier_count, skill_count = len(tier_labels), len(SKILL_NAMES)
+    tiers = tuple(plans[:tier_count])
+    single_skill = tuple(
+        tuple(plans[tier_count + t * skill_count:tier_count + (t + 1) * skill_count])
+        for t in range(tier_count)
+    )
+    roles = tuple(plans[tier_count * (1 + skill_count):])
+    return WhatIf(current_status, round(weighted, 2), tiers, single_skill, roles)
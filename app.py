@@ -1,21 +1,142 @@
-from flask import Flask, request, jsonify
+import hashlib
+import os
+from itertools import chain
+from time import perf_counter
+
+from flask import Flask, g, request, jsonify
 from flask_cors import CORS
 
-from agents.readiness_agent import evaluate_readiness
-from agents.role_agent import recommend_roles
-from agents.feedback_agent import analyze_feedback
-from agents.action_agent import generate_next_actions
-from rules.scoring_rules import SKILL_WEIGHTS
-from rules.role_requirements import ROLE_REQUIREMENTS
+from agents.models import CandidateScores, REQUEST_FIELDS
+from agents import role_index
+from agents.feedback_agent import get_skill_matcher
+from agents.what_if import improvement_plans
+from agents import scoring_engine
+from rules.rule_store import compiled, rule_store
+from services.compression import COMPRESSIBLE_MIMETYPES, choose_encoding, compress, compress_stream
+from services.eval_cache import EvaluationCache
+from services.json_provider import FastJSONProvider
+from services.metrics import server_timing_header
+from services.parallel import DEFAULT_CHUNK_SIZE, get_shared_pool
+from services.pipeline import (
+    batch_error, evaluate_batch, evaluate_many, evaluate_projected, evaluate_state, metrics,
+    parse_candidate, parse_fields, project_response
+)
+from services.startup import register_init, warm_up
+
+# Defined in services.pipeline; still importable from app, where it used to live
+from services.pipeline import transform_response_for_ui
 
 app = Flask(__name__)
+# orjson-backed JSON when installed (stdlib fallback); JSON_COMPACT=1 forces
+# compact output even in debug mode
+app.json = FastJSONProvider(app)
+if os.environ.get("JSON_COMPACT") == "1":
+    app.json.compact = True
 # Enable CORS globally for API access (required for frontend integration)
 CORS(app)
 
+# Upper bound on candidates per /api/evaluate/batch request
+BATCH_MAX_CANDIDATES = 10000
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/ndjson")
+
+# Worker processes for large /api/evaluate/batch requests (0 or 1: in-process)
+EVAL_WORKERS = int(os.environ.get("EVAL_WORKERS", 0))
+
+# Memoized /api/evaluate responses (EVAL_CACHE_SIZE=0 disables the cache)
+evaluation_cache = EvaluationCache(
+    maxsize=int(os.environ.get("EVAL_CACHE_SIZE", 1024)),
+    ttl=float(os.environ["EVAL_CACHE_TTL"]) if os.environ.get("EVAL_CACHE_TTL") else None
+)
+
+# Stage values of recent evaluations, the starting point for PATCH
+# /api/evaluate (EVAL_STATE_CACHE_SIZE=0 always re-evaluates from scratch)
+evaluation_states = EvaluationCache(
+    maxsize=int(os.environ.get("EVAL_STATE_CACHE_SIZE", 1024)),
+    ttl=float(os.environ["EVAL_CACHE_TTL"]) if os.environ.get("EVAL_CACHE_TTL") else None
+)
+
+# SERVER_TIMING=1 reports the stage costs recorded in the pipeline's metrics
+# registry (METRICS_ENABLED=0 turns it off) in a Server-Timing header
+SERVER_TIMING = os.environ.get("SERVER_TIMING") == "1"
+
+# Optional store of every evaluation result for later queries
+# (RESULT_STORE_PATH=results.db enables it); written by a background thread
+RESULT_STORE_PATH = os.environ.get("RESULT_STORE_PATH")
+result_store = None
+if RESULT_STORE_PATH:
+    from services.result_store import ResultStore
+    result_store = ResultStore(RESULT_STORE_PATH)
+
+# Negotiated gzip (and brotli, when installed) compression of JSON responses
+# of at least COMPRESS_MIN_BYTES; streamed batch responses are always
+# compressed when the client accepts it (RESPONSE_COMPRESSION=0 disables it)
+RESPONSE_COMPRESSION = os.environ.get("RESPONSE_COMPRESSION", "1") != "0"
+COMPRESS_MIN_BYTES = int(os.environ.get("COMPRESS_MIN_BYTES", 1400))
+
 # NOTE: This is a pure API-only backend. All routes return JSON responses only.
 # The app is WSGI-compatible and works with Vercel's @vercel/python runtime.
 
 
+@app.before_request
+def start_request_timer():
+    if metrics.enabled:
+        g.request_start = perf_counter()
+        if SERVER_TIMING:
+            metrics.begin_request()
+
+
+@app.after_request
+def record_request_metrics(response):
+    start = g.pop("request_start", None)
+    if start is None:
+        return response
+
+    elapsed = perf_counter() - start
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    metrics.observe("request_duration_seconds", (("endpoint", endpoint),), elapsed)
+    metrics.increment("requests_total", endpoint=endpoint, status=response.status_code)
+
+    if SERVER_TIMING:
+        response.headers["Server-Timing"] = server_timing_header(metrics.end_request(), elapsed)
+        response.headers["Timing-Allow-Origin"] = "*"
+    return response
+
+
+@app.after_request
+def compress_response(response):
+    """
+    Negotiated gzip/brotli compression of JSON responses. Streamed (batch)
+    responses stay streamed; whole bodies below COMPRESS_MIN_BYTES are sent
+    as they are. Registered after record_request_metrics, so it runs first
+    and its cost is part of the request duration.
+    """
+    if (not RESPONSE_COMPRESSION or response.status_code != 200
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES or "Content-Encoding" in response.headers):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop("Content-Length", None)
+    else:
+        body = response.get_data()
+        if len(body) < COMPRESS_MIN_BYTES:
+            return response
+        with metrics.timer("compress"):
+            response.set_data(compress(body, encoding))
+
+    response.headers["Content-Encoding"] = encoding
+    # The strong ETag names the uncompressed representation
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
 @app.route("/", methods=["GET"])
 def health_check():
     """
@@ -29,277 +150,111 @@ def health_check():
         "version": "1.0.0",
         "endpoints": {
             "evaluate": "/api/evaluate",
+            "evaluate_batch": "/api/evaluate/batch",
             "requirements": "/api/requirements",
-            "skill_weights": "/api/skill-weights"
+            "skill_weights": "/api/skill-weights",
+            "roles_match": "/api/roles/match",
+            "what_if": "/api/what-if",
+            "cohort_summary": "/api/cohort/summary",
+            "evaluations": "/api/evaluations",
+            "cache_stats": "/api/cache/stats",
+            "metrics": "/api/metrics"
         }
     }), 200
 
 
-def transform_response_for_ui(readiness, scores, weights, recommended, rejected, strengths, gaps, plan, actions):
-    """
-    Transform Flask API response to match UI's expected format.
-    This function maintains backward compatibility with existing frontend.
-    """
-    # Transform readiness
-    readiness_ui = {
-        "status": readiness["status"],
-        "score": int(readiness["final_score"]),
-        "reasoning": readiness.get("reasons", []),
-        "improvements": readiness.get("suggestions", []),
-        "skillBreakdown": [
-            {
-                "skill": skill,
-                "score": score,
-                "status": "Excellent" if score >= 80 else "Good" if score >= 70 else "Average" if score >= 50 else "Needs Improvement"
-            }
-            for skill, score in scores.items()
-        ]
-    }
-    
-    # Transform role suitability
-    role_suitability_ui = {
-        "recommended": [
-            {
-                "role": role,
-                "matchScore": 85,  # Default match score
-                "strengths": [f"Strong {skill}" for skill in scores.keys() if scores[skill] >= 70]
-            }
-            for role in recommended
-        ],
-        "notRecommended": [
-            {
-                "role": role,
-                "gaps": gap_list
-            }
-            for role, gap_list in rejected.items()
-        ]
-    }
-    
-    # Create detailed gap analysis for rejected roles
-    gap_analysis_ui = []
-    for role, gap_list in rejected.items():
-        if role in ROLE_REQUIREMENTS:
-            role_requirements = ROLE_REQUIREMENTS[role]
-            skill_gaps = []
-            total_gap = 0
-            
-            for skill_name in gap_list:
-                # Find the actual skill name (handle variations)
-                actual_skill = None
-                for skill_key in scores.keys():
-                    if skill_name.lower() in skill_key.lower() or skill_key.lower() in skill_name.lower():
-                        actual_skill = skill_key
-                        break
-                
-                if actual_skill and actual_skill in role_requirements:
-                    candidate_score = scores[actual_skill]
-                    required_score = role_requirements[actual_skill]
-                    gap = required_score - candidate_score
-                    
-                    skill_gaps.append({
-                        "skill": actual_skill,
-                        "candidateScore": candidate_score,
-                        "requiredScore": required_score,
-                        "gap": gap
-                    })
-                    total_gap += gap
-            
-            if skill_gaps:
-                gap_analysis_ui.append({
-                    "role": role,
-                    "gaps": skill_gaps,
-                    "totalGap": total_gap
-                })
-    
-    # Transform feedback analysis
-    feedback_analysis_ui = {
-        "strengths": strengths if strengths else ["Basic understanding of core concepts"],
-        "areasToImprove": gaps if gaps else ["No major technical gaps identified"]
-    }
-    
-    # Transform preparation plan with detailed activities
-    def get_detailed_activities(day_num, focus_text):
-        """Generate detailed activities based on day and focus."""
-        focus_lower = focus_text.lower()
-        
-        # Special handling for mock interview day
-        if "mock interview" in focus_lower or "interview" in focus_lower:
-            return [
-                "Review technical concepts and coding problems",
-                "Practice STAR method for behavioral questions",
-                "Prepare questions to ask the interviewer",
-                "Set up interview environment and test equipment",
-                "Review your projects and be ready to explain them"
-            ]
-        
-        # SQL focused days
-        if "sql" in focus_lower:
-            return [
-                "Practice complex joins and subqueries",
-                "Work on query optimization techniques",
-                "Solve SQL problems on LeetCode/HackerRank",
-                "Build a mini-project using SQL"
-            ]
-        
-        # Python focused days
-        if "python" in focus_lower:
-            return [
-                "Solve data structures and algorithms problems",
-                "Practice debugging and code review",
-                "Work on Python-specific projects",
-                "Review Python best practices and patterns"
-            ]
-        
-        # Communication/Behavioral days
-        if "communication" in focus_lower or "explain" in focus_lower:
-            return [
-                "Practice explaining technical concepts clearly",
-                "Record yourself and review for improvement",
-                "Practice STAR method storytelling",
-                "Work on clarity and structure in explanations"
-            ]
-        
-        # Statistics days
-        if "statistics" in focus_lower or "probability" in focus_lower:
-            return [
-                "Review core statistical concepts",
-                "Practice probability problems",
-                "Work on case studies and analysis",
-                "Apply statistics to real-world scenarios"
-            ]
-        
-        # ML days
-        if "machine learning" in focus_lower or "ml" in focus_lower:
-            return [
-                "Review ML algorithms and concepts",
-                "Work on a mini ML project",
-                "Practice model evaluation techniques",
-                "Study real-world ML applications"
-            ]
-        
-        # Resume/Preparation days
-        if "resume" in focus_lower or "confidence" in focus_lower:
-            return [
-                "Update resume with recent projects",
-                "Prepare portfolio and GitHub profile",
-                "Practice confidence-building exercises",
-                "Review and refine your preparation"
-            ]
-        
-        # Default activities
-        return [
-            "Review core concepts related to today's focus",
-            "Practice hands-on exercises and problems",
-            "Apply learning through mini-projects",
-            "Document progress and plan next steps"
-        ]
-    
-    preparation_plan_ui = []
-    for i, plan_item in enumerate(plan, 1):
-        # Parse plan string (e.g., "Day 1: Communication drills...")
-        if ":" in plan_item:
-            day_part, activity_part = plan_item.split(":", 1)
-            day_num = int(day_part.replace("Day", "").strip())
-            focus = activity_part.strip()
-        else:
-            day_num = i
-            focus = plan_item
-        
-        # Get detailed activities for this day
-        activities = get_detailed_activities(day_num, focus)
-        
-        preparation_plan_ui.append({
-            "day": day_num,
-            "focus": focus,
-            "activities": activities
-        })
-    
-    # Ensure we always have exactly 7 days, sorted by day number
-    # If somehow we have fewer, this ensures all days are present
-    if len(preparation_plan_ui) < 7:
-        # Create a set of existing day numbers
-        existing_days = {item["day"] for item in preparation_plan_ui}
-        
-        # Default plans for missing days
-        default_plans = {
-            1: {"day": 1, "focus": "Communication and fundamentals mastery", "activities": get_detailed_activities(1, "communication")},
-            2: {"day": 2, "focus": "SQL mastery and database skills", "activities": get_detailed_activities(2, "sql")},
-            3: {"day": 3, "focus": "Python and problem-solving mastery", "activities": get_detailed_activities(3, "python")},
-            4: {"day": 4, "focus": "Statistics and probability mastery", "activities": get_detailed_activities(4, "statistics")},
-            5: {"day": 5, "focus": "Machine learning and advanced skills", "activities": get_detailed_activities(5, "machine learning")},
-            6: {"day": 6, "focus": "Full mock interview (technical + HR)", "activities": get_detailed_activities(6, "mock interview")},
-            7: {"day": 7, "focus": "Resume refinement and confidence preparation", "activities": get_detailed_activities(7, "resume")}
-        }
-        
-        # Add missing days
-        for day_num in range(1, 8):
-            if day_num not in existing_days:
-                preparation_plan_ui.append(default_plans[day_num])
-    
-    # Sort by day number to ensure correct order
-    preparation_plan_ui.sort(key=lambda x: x["day"])
-    
-    # Create detailed gap analysis for rejected roles
-    gap_analysis_ui = []
-    for role, gap_list in rejected.items():
-        if role in ROLE_REQUIREMENTS:
-            role_requirements = ROLE_REQUIREMENTS[role]
-            skill_gaps = []
-            total_gap = 0
-            
-            for skill_name in gap_list:
-                # Find the actual skill name (handle variations)
-                actual_skill = None
-                for skill_key in scores.keys():
-                    if skill_name.lower() in skill_key.lower() or skill_key.lower() in skill_name.lower():
-                        actual_skill = skill_key
-                        break
-                
-                if actual_skill and actual_skill in role_requirements:
-                    candidate_score = scores[actual_skill]
-                    required_score = role_requirements[actual_skill]
-                    gap = required_score - candidate_score
-                    
-                    skill_gaps.append({
-                        "skill": actual_skill,
-                        "candidateScore": candidate_score,
-                        "requiredScore": required_score,
-                        "gap": gap
-                    })
-                    total_gap += gap
-            
-            if skill_gaps:
-                gap_analysis_ui.append({
-                    "role": role,
-                    "gaps": skill_gaps,
-                    "totalGap": total_gap
-                })
-    
-    # Transform action summary
-    priority = "High" if readiness["status"] == "Ready" else "Medium" if readiness["status"] == "Almost Ready" else "Low"
-    recommendation = (
-        "Candidate is ready for placement. Schedule final interviews with partner companies."
-        if readiness["status"] == "Ready"
-        else "Candidate shows promise. Recommend 2-week intensive training before placement."
-        if readiness["status"] == "Almost Ready"
-        else "Candidate needs foundational work. Enroll in 4-week bootcamp program."
+def candidate_id(data):
+    """The optional "candidateId" of a request payload, as a string (or None)."""
+    value = data.get("candidateId")
+    return None if value is None else str(value)
+
+
+def evaluate_and_remember(candidate, feedback_text):
+    """evaluate_candidate(), also keeping the stage values for PATCH requests."""
+    values, _ = evaluate_state(candidate, feedback_text)
+    evaluation_states.put(candidate, feedback_text, values)
+    return values["transform"]
+
+
+def evaluate_and_remember_many(entries):
+    """evaluate_and_remember() for many (candidate, feedback_text) pairs at once."""
+    responses = []
+    for (candidate, feedback_text), values in zip(entries, evaluate_many(entries)):
+        evaluation_states.put(candidate, feedback_text, values)
+        responses.append(values["transform"])
+    return responses
+
+
+# Opt-in micro-batching of concurrent /api/evaluate calls (for threaded
+# servers): MICRO_BATCH_WINDOW_MS > 0 holds each call up to that long to
+# evaluate it together with others (at most MICRO_BATCH_MAX_SIZE at once);
+# identical concurrent calls share one evaluation
+MICRO_BATCH_WINDOW_MS = float(os.environ.get("MICRO_BATCH_WINDOW_MS", 0))
+micro_batcher = None
+if MICRO_BATCH_WINDOW_MS > 0:
+    from services.micro_batcher import MicroBatcher
+    micro_batcher = MicroBatcher(
+        evaluate_and_remember_many,
+        window=MICRO_BATCH_WINDOW_MS / 1000,
+        max_batch=int(os.environ.get("MICRO_BATCH_MAX_SIZE", 32)),
+        metrics=metrics
     )
-    
-    action_summary_ui = {
-        "priority": priority,
-        "recommendation": recommendation,
-        "actionItems": actions if actions else ["Complete the 7-day preparation plan"]
-    }
-    
-    return {
-        "readiness": readiness_ui,
-        "roleSuitability": role_suitability_ui,
-        "feedbackAnalysis": feedback_analysis_ui,
-        "preparationPlan": preparation_plan_ui,
-        "actionSummary": action_summary_ui,
-        "gapAnalysis": gap_analysis_ui,
-        "candidateScores": scores
-    }
+
+
+def evaluate_batched(candidate, feedback_text):
+    """evaluate_and_remember(), run in a micro-batch with concurrent requests."""
+    return micro_batcher.submit((candidate, feedback_text))
+
+
+def evaluate_request(data, candidate, feedback_text, fields=None):
+    """
+    The /api/evaluate response for a parsed request payload `data`; shared
+    by the Flask view and asgi.py, so both servers cache, micro-batch,
+    remember and store results the same way.
+    `fields`: optional projection from parse_fields().
+    """
+    if fields is not None and result_store is None:
+        # A cached full response is projected; otherwise only the
+        # requested sections are built (and not cached)
+        ui_response = evaluation_cache.get(candidate, feedback_text)
+        if ui_response is not None:
+            return project_response(ui_response, fields)
+        return evaluate_projected(candidate, feedback_text, fields)
+
+    ui_response = evaluation_cache.get_or_compute(
+        candidate, feedback_text, evaluate_batched if micro_batcher is not None else evaluate_and_remember
+    )
+    if result_store is not None:
+        result_store.submit(candidate_id(data), feedback_text, ui_response)
+    return ui_response if fields is None else project_response(ui_response, fields)
+
+
+def parse_batch_payload():
+    """
+    Read the candidates of a batch request, in input order.
+    Accepts a JSON array (or {"candidates": [...]}) or an NDJSON body
+    (Content-Type: application/x-ndjson), one candidate per line.
+    Malformed NDJSON lines are kept in place as ValueError instances.
+    """
+    if request.mimetype in NDJSON_MIMETYPES:
+        candidates = []
+        for line in request.get_data(as_text=True).splitlines():
+            if not line.strip():
+                continue
+            try:
+                candidates.append(app.json.loads(line))
+            except ValueError as e:
+                candidates.append(ValueError(f"Malformed NDJSON line: {e}"))
+        return candidates
+
+    data = request.get_json(silent=True)
+    if isinstance(data, dict):
+        data = data.get("candidates")
+
+    if not isinstance(data, list):
+        raise ValueError("Request body must be a JSON array of candidates or NDJSON")
+
+    return data
 
 
 @app.route("/api/evaluate", methods=["POST"])
@@ -312,9 +267,16 @@ def api_evaluate():
     Request body should contain:
     - excel, sql, python, stats, ml, bi (0-100 scores)
     - feedback (string)
+    - candidateId (optional, stored with the result when RESULT_STORE_PATH is set)
+    
+    Optional query parameter `fields` (e.g. ?fields=readiness.status,gapAnalysis)
+    returns only those sections/sub-fields, and only the agents they need run.
     """
     try:
-        data = request.get_json()
+        fields = parse_fields(",".join(request.args.getlist("fields")))
+
+        with metrics.timer("json_parse"):
+            data = request.get_json()
         
         if not data:
             return jsonify({
@@ -323,33 +285,139 @@ def api_evaluate():
                 "message": "Please send a JSON payload with candidate data"
             }), 400
         
-        # Extract scores from JSON
-        scores = {
-            "Excel": int(data.get("excel", 0)),
-            "SQL": int(data.get("sql", 0)),
-            "Python": int(data.get("python", 0)),
-            "Statistics & Probability": int(data.get("stats", 0)),
-            "Machine Learning": int(data.get("ml", 0)),
-            "Tableau & Power BI": int(data.get("bi", 0))
-        }
-        
-        feedback_text = data.get("feedback", "")
-        
-        # Run agent workflows (business logic unchanged)
-        readiness = evaluate_readiness(scores, feedback_text)
-        recommended, rejected = recommend_roles(scores)
-        strengths, gaps, plan = analyze_feedback(feedback_text)
-        actions = generate_next_actions(readiness, recommended)
-        
-        # Transform for UI
-        ui_response = transform_response_for_ui(
-            readiness, scores, SKILL_WEIGHTS, recommended, rejected,
-            strengths, gaps, plan, actions
-        )
+        with metrics.timer("validate"):
+            candidate, feedback_text = parse_candidate(data)
+
+        ui_response = evaluate_request(data, candidate, feedback_text, fields)
         
         # Return JSON response
-        return jsonify(ui_response), 200
+        with metrics.timer("serialize"):
+            return jsonify(ui_response), 200
+    
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+@app.route("/api/evaluate", methods=["PATCH"])
+def api_evaluate_patch():
+    """
+    API endpoint for incremental re-evaluation after a small change.
+    Accepts {"previous": <an /api/evaluate request>, "delta": {<changed fields>}}.
+    Returns the same response as POSTing the updated candidate, re-running
+    only the agents affected by the changed fields when the previous
+    evaluation is still known to the server.
+    
+    The re-run stages are listed in the X-Recomputed-Stages header.
+    """
+    try:
+        data = request.get_json()
+
+        previous = data.get("previous") if isinstance(data, dict) else None
+        delta = data.get("delta") if isinstance(data, dict) else None
+        if not isinstance(previous, dict) or not isinstance(delta, dict):
+            return jsonify({
+                "success": False,
+                "error": "Request body must be JSON",
+                "message": "Please send {\"previous\": {...}, \"delta\": {...}} with candidate data"
+            }), 400
+
+        unknown = sorted(set(delta) - set(REQUEST_FIELDS) - {"feedback"})
+        if unknown:
+            raise ValueError(f"Unknown fields in delta: {', '.join(unknown)}")
+
+        previous_candidate, previous_feedback = parse_candidate(previous)
+        candidate, feedback_text = parse_candidate({**previous, **delta})
+
+        values, recomputed = evaluate_state(
+            candidate, feedback_text,
+            previous=evaluation_states.get(previous_candidate, previous_feedback)
+        )
+        evaluation_states.put(candidate, feedback_text, values)
+
+        response = jsonify(values["transform"])
+        response.headers["X-Recomputed-Stages"] = ",".join(recomputed) or "none"
+        response.headers["Access-Control-Expose-Headers"] = "X-Recomputed-Stages"
+        return response, 200
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+@app.route("/api/evaluate/batch", methods=["POST"])
+def api_evaluate_batch():
+    """
+    API endpoint for cohort evaluation.
+    Accepts a JSON array (or NDJSON stream) of candidates in the same format
+    as /api/evaluate and evaluates all of them in one request.
     
+    All candidates are validated first; the valid ones are then evaluated
+    together (one batched scoring engine call per batch, or per chunk with
+    EVAL_WORKERS). Results are returned in input order. A candidate that
+    fails validation gets its error object in place instead of failing the
+    whole batch.
+    The `fields` query parameter projects every result as for /api/evaluate.
+    """
+    try:
+        fields = parse_fields(",".join(request.args.getlist("fields")))
+        # Stored results are always complete; they are projected afterwards
+        evaluate_fields = fields if result_store is None else None
+
+        with metrics.timer("batch_parse"):
+            candidates = parse_batch_payload()
+
+        if len(candidates) > BATCH_MAX_CANDIDATES:
+            return jsonify({
+                "success": False,
+                "error": "Batch too large",
+                "message": f"A batch may contain at most {BATCH_MAX_CANDIDATES} candidates"
+            }), 413
+
+        if EVAL_WORKERS > 1 and len(candidates) > DEFAULT_CHUNK_SIZE:
+            results = list(get_shared_pool(EVAL_WORKERS).evaluate(candidates, fields=evaluate_fields))
+        else:
+            results = evaluate_batch(candidates, evaluate_fields)
+
+        if result_store is not None:
+            for data, result in zip(candidates, results):
+                if result.get("success") is not False:
+                    result_store.submit(candidate_id(data), data.get("feedback", ""), result)
+            if fields is not None:
+                results = [
+                    project_response(result, fields) if result.get("success") is not False else result
+                    for result in results
+                ]
+
+        # Stream the encoded results one by one instead of building one big
+        # string; keys in the same (sorted) order as jsonify. The status is
+        # sent before the results are encoded, so a result that cannot be
+        # encoded becomes an error object in place.
+        body = chain(
+            (b'{"count":%d,"results":' % len(results),),
+            app.json.iter_array(results, on_error=lambda result, e: batch_error("Internal server error", e)),
+            (b',"success":true}\n',)
+        )
+        return app.response_class(body, status=200, mimetype="application/json")
+
     except ValueError as e:
         return jsonify({
             "success": False,
@@ -364,6 +432,350 @@ def api_evaluate():
         }), 500
 
 
+def result_store_disabled():
+    return jsonify({
+        "success": False,
+        "error": "Result store disabled",
+        "message": "Set RESULT_STORE_PATH to store and query evaluation results"
+    }), 503
+
+
+@app.route("/api/evaluations", methods=["GET"])
+def api_evaluations():
+    """
+    API endpoint for querying stored evaluation results (newest first),
+    without re-evaluating anything. All filters are optional:
+    - status: "Ready", "Almost Ready" or "Not Ready"
+    - minScore, maxScore: readiness score range (inclusive)
+    - gap: a skill below the minimum of at least one role (e.g. "SQL")
+    - feedbackGap: an area to improve from the interview feedback
+    - candidateId
+    - limit: page size (default 50, at most 500)
+    - cursor: the nextCursor of the previous page
+    """
+    if result_store is None:
+        return result_store_disabled()
+
+    try:
+        args = request.args
+        min_score = args.get("minScore", type=int)
+        max_score = args.get("maxScore", type=int)
+        if "minScore" in args and min_score is None or "maxScore" in args and max_score is None:
+            raise ValueError("minScore and maxScore must be integers")
+
+        rows, next_cursor = result_store.query(
+            status=args.get("status"),
+            min_score=min_score,
+            max_score=max_score,
+            gap=args.get("gap"),
+            feedback_gap=args.get("feedbackGap"),
+            candidate_id=args.get("candidateId"),
+            limit=args.get("limit", 50),
+            cursor=args.get("cursor")
+        )
+        return jsonify({
+            "success": True,
+            "count": len(rows),
+            "results": rows,
+            "nextCursor": next_cursor
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+@app.route("/api/evaluations/<int:evaluation_id>", methods=["GET"])
+def api_evaluation(evaluation_id):
+    """API endpoint returning one stored evaluation result by id."""
+    if result_store is None:
+        return result_store_disabled()
+
+    row = result_store.get(evaluation_id)
+    if row is None:
+        return jsonify({
+            "success": False,
+            "error": "Not found",
+            "message": f"No stored evaluation with id {evaluation_id}"
+        }), 404
+    return jsonify({"success": True, **row}), 200
+
+
+# Defaults for /api/roles/match
+ROLE_MATCH_WITHIN_POINTS = 10
+ROLE_MATCH_TOP = 3
+
+
+@app.route("/api/roles/match", methods=["POST"])
+def api_roles_match():
+    """
+    API endpoint for matching a candidate against the role catalogue.
+    Accepts the /api/evaluate skill scores, plus optional:
+    - within: roles where no requirement is more than this many points away (default 10)
+    - top: number of closest roles by total gap to return (default 3)
+    """
+    try:
+        data = request.get_json()
+
+        if not isinstance(data, dict) or not data:
+            return jsonify({
+                "success": False,
+                "error": "Request body must be JSON",
+                "message": "Please send a JSON payload with candidate data"
+            }), 400
+
+        scores = CandidateScores.from_request(data).as_dict()
+        within_points = int(data.get("within", ROLE_MATCH_WITHIN_POINTS))
+        top = int(data.get("top", ROLE_MATCH_TOP))
+        rules = rule_store.current
+        index = role_index.get_role_index(rules)
+
+        return jsonify({
+            "success": True,
+            "ruleVersion": rules.version,
+            "eligible": index.eligible(scores),
+            "within": {
+                "points": within_points,
+                "roles": index.within(scores, within_points)
+            },
+            "closest": [
+                {
+                    "role": role,
+                    "totalGap": total_gap,
+                    "matchScore": index.match_score(role, scores)
+                }
+                for role, total_gap in index.closest(scores, top)
+            ]
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+def improvement_plan_ui(plan):
+    return {
+        "pointsNeeded": plan.points,
+        "increments": dict(plan.increments),
+        "statusAfter": plan.status
+    }
+
+
+@app.route("/api/what-if", methods=["POST"])
+def api_what_if():
+    """
+    API endpoint for "how many points do I need, and where?".
+    Accepts the /api/evaluate skill scores and returns, for each readiness
+    tier and each role, the fewest extra points that reach it (null when
+    unreachable on the 0-100 scale), computed from the weights and
+    minimums in one call instead of re-evaluating nudged scores.
+    """
+    try:
+        data = request.get_json()
+
+        if not isinstance(data, dict) or not data:
+            return jsonify({
+                "success": False,
+                "error": "Request body must be JSON",
+                "message": "Please send a JSON payload with candidate data"
+            }), 400
+
+        tables = scoring_engine.get_tables()
+        analysis = improvement_plans(CandidateScores.from_request(data), tables)
+
+        return jsonify({
+            "success": True,
+            "ruleVersion": tables.version,
+            "current": {
+                "status": analysis.status,
+                "score": analysis.score
+            },
+            "readiness": [
+                {
+                    "target": plan.target,
+                    "threshold": threshold,
+                    "reached": plan.points == 0,
+                    **improvement_plan_ui(plan),
+                    "singleSkill": {skill_plan.target: skill_plan.points for skill_plan in single_skill}
+                }
+                for plan, threshold, single_skill in zip(analysis.tiers, tables.thresholds, analysis.single_skill)
+            ],
+            "roles": [
+                {
+                    "role": plan.target,
+                    "eligible": plan.points == 0,
+                    **improvement_plan_ui(plan)
+                }
+                for plan in analysis.roles
+            ]
+        }), 200
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+# Upper bound on candidates per /api/cohort/summary request (the response
+# size does not grow with the cohort, only the request body does)
+COHORT_SUMMARY_MAX_CANDIDATES = 100000
+
+
+@app.route("/api/cohort/summary", methods=["POST"])
+def api_cohort_summary():
+    """
+    API endpoint for cohort dashboards.
+    Accepts the same body as /api/evaluate/batch and returns aggregates in
+    one pass over the candidates: readiness status counts and score
+    distribution, per-skill mean/std/percentiles, role eligibility counts
+    and the most common feedback gaps (?top=N, default 10).
+    
+    Invalid candidates are counted in "errors" and otherwise skipped.
+    """
+    # Imported here so NumPy is only loaded once a summary is requested
+    from services import cohort_summary
+
+    try:
+        with metrics.timer("batch_parse"):
+            candidates = parse_batch_payload()
+        top_gaps = int(request.args.get("top", cohort_summary.DEFAULT_TOP_GAPS))
+
+        if len(candidates) > COHORT_SUMMARY_MAX_CANDIDATES:
+            return jsonify({
+                "success": False,
+                "error": "Cohort too large",
+                "message": f"A cohort summary may cover at most {COHORT_SUMMARY_MAX_CANDIDATES} candidates"
+            }), 413
+
+        with metrics.timer("cohort_summary"):
+            if EVAL_WORKERS > 1 and len(candidates) > DEFAULT_CHUNK_SIZE:
+                summary = get_shared_pool(EVAL_WORKERS).summarize(candidates)
+            else:
+                summary = cohort_summary.summarize_cohort(candidates)
+
+        return jsonify({"success": True, **summary.as_dict(top_gaps)}), 200
+
+    except ValueError as e:
+        return jsonify({
+            "success": False,
+            "error": "Invalid input",
+            "message": str(e)
+        }), 400
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": "Internal server error",
+            "message": str(e)
+        }), 500
+
+
+ROLE_DESCRIPTIONS = {
+    "Data Analyst": "Analyze data to provide actionable business insights",
+    "Business Analyst": "Create dashboards and reports for business decision-making",
+    "Data Scientist": "Build predictive models and derive insights from complex data",
+    "Junior ML Engineer": "Deploy and maintain machine learning models in production",
+    "BI Analyst": "Design and implement business intelligence solutions"
+}
+
+# Display names used by the UI for the long skill names
+SKILL_DISPLAY_NAMES = {
+    "Statistics & Probability": "Statistics",
+    "Tableau & Power BI": "BI Tools"
+}
+
+STATIC_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+def build_static_payloads(rules):
+    """
+    Serialize the /api/requirements and /api/skill-weights payloads once
+    per rule snapshot, so steady state GETs do no JSON encoding at all.
+    Returns {name: (serialized JSON body, strong ETag)}.
+    """
+    # Transform to UI format
+    requirements_ui = [
+        {
+            "role": role,
+            "description": ROLE_DESCRIPTIONS.get(role, f"Requirements for {role}"),
+            "requirements": [
+                {
+                    "skill": SKILL_DISPLAY_NAMES.get(skill, skill),
+                    "minimum": minimum
+                }
+                for skill, minimum in skills.items()
+            ]
+        }
+        for role, skills in rules.role_requirements.items()
+    ]
+
+    skill_weights_ui = {
+        "success": True,
+        "skill_weights": dict(rules.skill_weights)
+    }
+
+    payloads = {}
+    for name, payload in (("requirements", requirements_ui), ("skill_weights", skill_weights_ui)):
+        body = app.json.dumps_bytes(payload) + b"\n"
+        payloads[name] = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+
+    return payloads
+
+
+get_static_payloads = compiled(build_static_payloads)
+
+# Tables are built on first use, which keeps cold starts (serverless) cheap.
+# EAGER_INIT=1 builds them at import instead, e.g. for a preforking server.
+register_init("feedback_matcher", get_skill_matcher)
+register_init("scoring_tables", scoring_engine.get_tables)
+register_init("role_index", role_index.get_role_index)
+register_init("static_payloads", get_static_payloads)
+
+if os.environ.get("EAGER_INIT") == "1":
+    warm_up()
+
+
+def static_json_response(name):
+    """
+    Serve a precomputed payload with a strong ETag.
+    Answers If-None-Match with 304 Not Modified when the client is current.
+    """
+    body, etag = get_static_payloads()[name]
+
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, status=200, mimetype="application/json")
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+    return response
+
+
 @app.route("/api/requirements", methods=["GET"])
 def api_requirements():
     """
@@ -371,31 +783,7 @@ def api_requirements():
     Returns all role requirements with minimum skill thresholds.
     """
     try:
-        # Transform to UI format
-        role_descriptions = {
-            "Data Analyst": "Analyze data to provide actionable business insights",
-            "Business Analyst": "Create dashboards and reports for business decision-making",
-            "Data Scientist": "Build predictive models and derive insights from complex data",
-            "Junior ML Engineer": "Deploy and maintain machine learning models in production",
-            "BI Analyst": "Design and implement business intelligence solutions"
-        }
-        
-        requirements_ui = [
-            {
-                "role": role,
-                "description": role_descriptions.get(role, f"Requirements for {role}"),
-                "requirements": [
-                    {
-                        "skill": skill.replace("Statistics & Probability", "Statistics").replace("Tableau & Power BI", "BI Tools"),
-                        "minimum": minimum
-                    }
-                    for skill, minimum in skills.items()
-                ]
-            }
-            for role, skills in ROLE_REQUIREMENTS.items()
-        ]
-        
-        return jsonify(requirements_ui), 200
+        return static_json_response("requirements")
     
     except Exception as e:
         return jsonify({
@@ -412,10 +800,7 @@ def api_skill_weights():
     Returns skill weights used in the evaluation algorithm.
     """
     try:
-        return jsonify({
-            "success": True,
-            "skill_weights": SKILL_WEIGHTS
-        }), 200
+        return static_json_response("skill_weights")
     
     except Exception as e:
         return jsonify({
@@ -425,6 +810,71 @@ def api_skill_weights():
         }), 500
 
 
+@app.route("/api/cache/stats", methods=["GET"])
+def api_cache_stats():
+    """
+    API endpoint to inspect the evaluation cache.
+    Returns size, hit/miss/eviction counters and the current rule-set version.
+    """
+    return jsonify({
+        "success": True,
+        "cache": evaluation_cache.stats()
+    }), 200
+
+
+def cache_metrics():
+    stats = evaluation_cache.stats()
+    return [
+        ("eval_cache_hits_total", "counter", stats["hits"]),
+        ("eval_cache_misses_total", "counter", stats["misses"]),
+        ("eval_cache_evictions_total", "counter", stats["evictions"]),
+        ("eval_cache_entries", "gauge", stats["size"])
+    ]
+
+
+metrics.add_collector(cache_metrics)
+
+
+def result_store_metrics():
+    stats = result_store.stats()
+    return [
+        ("result_store_pending", "gauge", stats["pending"]),
+        ("result_store_written_total", "counter", stats["written"]),
+        ("result_store_dropped_total", "counter", stats["dropped"]),
+        ("result_store_write_errors_total", "counter", stats["write_errors"])
+    ]
+
+
+if result_store is not None:
+    metrics.add_collector(result_store_metrics)
+
+
+def micro_batch_metrics():
+    return [
+        ("micro_batches_total", "counter", micro_batcher.batches),
+        ("micro_batch_items_total", "counter", micro_batcher.items),
+        ("micro_batch_coalesced_total", "counter", micro_batcher.coalesced)
+    ]
+
+
+if micro_batcher is not None:
+    metrics.add_collector(micro_batch_metrics)
+
+
+@app.route("/api/metrics", methods=["GET"])
+def api_metrics():
+    """
+    API endpoint exposing latency histograms (with p50/p95/p99 estimates)
+    per endpoint and pipeline stage, request counters and cache counters,
+    in Prometheus text format.
+    """
+    return app.response_class(
+        metrics.render_prometheus(),
+        status=200,
+        mimetype="text/plain; version=0.0.4"
+    )
+
+
 @app.route('/<path:path>')
 def catch_all(path):
     """
@@ -439,8 +889,15 @@ def catch_all(path):
         "message": "This is an API-only backend. Use /api/* endpoints.",
         "available_endpoints": [
             "/api/evaluate",
+            "/api/evaluate/batch",
             "/api/requirements",
-            "/api/skill-weights"
+            "/api/skill-weights",
+            "/api/roles/match",
+            "/api/what-if",
+            "/api/cohort/summary",
+            "/api/evaluations",
+            "/api/cache/stats",
+            "/api/metrics"
         ]
     }), 404
 
@@ -451,7 +908,14 @@ if __name__ == "__main__":
     print("\n📋 Available API endpoints:")
     print("   GET  / - Health check")
     print("   POST /api/evaluate - Candidate evaluation")
+    print("   POST /api/evaluate/batch - Cohort evaluation (JSON array or NDJSON)")
     print("   GET  /api/requirements - Role requirements")
     print("   GET  /api/skill-weights - Skill weights")
+    print("   POST /api/roles/match - Eligible, near-miss and closest roles")
+    print("   POST /api/what-if - Fewest extra points to reach each tier and role")
+    print("   POST /api/cohort/summary - Cohort aggregates (readiness, skills, roles, gaps)")
+    print("   GET  /api/evaluations - Stored results, filtered and paginated (RESULT_STORE_PATH)")
+    print("   GET  /api/cache/stats - Evaluation cache counters")
+    print("   GET  /api/metrics - Latency histograms and counters (Prometheus)")
     
     app.run(debug=True)
@@ -0,0 +1,275 @@
+"""
+ASGI entry point for the evaluation API.
+
+Serves the same /api/evaluate, /api/requirements and /api/skill-weights
+contracts as the Flask app (same status codes and byte-identical JSON
+bodies), plus /api/metrics, without holding a worker per connection:
+requests are parsed on the event loop and the CPU-bound agent work runs
+in a bounded thread pool. When the pool is saturated, /api/evaluate
+answers 503 with a Retry-After header instead of queueing without limit.
+
+Run with any ASGI server, e.g.:
+    uvicorn asgi:app --host 0.0.0.0 --port 8000
+
+Environment:
+    ASGI_EVAL_THREADS     evaluation threads (default: one per CPU)
+    ASGI_MAX_PENDING      evaluations accepted at once, running + queued
+                          (default: 8 per thread)
+    ASGI_RETRY_AFTER      Retry-After seconds on 503 responses (default: 1)
+    ASGI_MAX_BODY_BYTES   largest accepted request body (default: 1 MiB)
+    RESPONSE_COMPRESSION, COMPRESS_MIN_BYTES
+                          as for the Flask app (gzip/brotli of JSON bodies)
+    EVAL_CACHE_SIZE, RESULT_STORE_PATH, MICRO_BATCH_WINDOW_MS
+                          as for the Flask app: /api/evaluate runs through
+                          the same app.evaluate_request()
+"""
+import os
+from time import perf_counter
+from urllib.parse import parse_qs
+
+from app import (
+    COMPRESS_MIN_BYTES, RESPONSE_COMPRESSION, STATIC_CACHE_CONTROL, app as flask_app, evaluate_request,
+    get_static_payloads, metrics, parse_candidate, parse_fields
+)
+from services.bounded_executor import BoundedExecutor, ExecutorBusy
+from services.compression import choose_encoding, compress
+
+executor = BoundedExecutor(
+    workers=int(os.environ.get("ASGI_EVAL_THREADS", 0)),
+    max_pending=int(os.environ.get("ASGI_MAX_PENDING", 0))
+)
+
+
+def executor_metrics():
+    return [
+        ("asgi_pending_evaluations", "gauge", executor.pending),
+        ("asgi_rejected_total", "counter", executor.rejected)
+    ]
+
+
+metrics.add_collector(executor_metrics)
+
+RETRY_AFTER = os.environ.get("ASGI_RETRY_AFTER", "1")
+MAX_BODY_BYTES = int(os.environ.get("ASGI_MAX_BODY_BYTES", 1024 * 1024))
+
+# Messages of the Werkzeug exceptions raised by Flask's request.get_json(),
+# which the Flask views report as 500 errors
+BAD_JSON_MESSAGE = "400 Bad Request: The browser (or proxy) sent a request that this server could not understand."
+NOT_JSON_MESSAGE = (
+    "415 Unsupported Media Type: Did not attempt to load JSON data because the "
+    "request Content-Type was not 'application/json'."
+)
+
+AVAILABLE_ENDPOINTS = ["/api/evaluate", "/api/requirements", "/api/skill-weights", "/api/metrics"]
+
+# Methods advertised in CORS preflight responses (same as flask-cors)
+CORS_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+def json_body(payload):
+    return flask_app.json.dumps_bytes(payload) + b"\n"
+
+
+def error_body(error, message):
+    return json_body({"success": False, "error": error, "message": message})
+
+
+def is_json_mimetype(content_type):
+    mimetype = content_type.split(";", 1)[0].strip().lower()
+    return mimetype == "application/json" or (
+        mimetype.startswith("application/") and mimetype.endswith("+json")
+    )
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header value against an ETag."""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+async def read_body(receive):
+    """Read the full request body; None if it exceeds MAX_BODY_BYTES."""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+    return b"".join(chunks)
+
+
+async def evaluate(scope, headers, receive):
+    """POST /api/evaluate; returns (status, body, extra headers)."""
+    body = await read_body(receive)
+    if body is None:
+        return 413, error_body(
+            "Request too large", f"Request bodies are limited to {MAX_BODY_BYTES} bytes"
+        ), []
+
+    try:
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        fields = parse_fields(",".join(query.get("fields", ())))
+
+        if not is_json_mimetype(headers.get(b"content-type", b"").decode("latin-1")):
+            raise RuntimeError(NOT_JSON_MESSAGE)
+        try:
+            data = flask_app.json.loads(body)
+        except ValueError:
+            raise RuntimeError(BAD_JSON_MESSAGE) from None
+
+        if not data:
+            return 400, json_body({
+                "success": False,
+                "error": "Request body must be JSON",
+                "message": "Please send a JSON payload with candidate data"
+            }), []
+
+        candidate, feedback_text = parse_candidate(data)
+        ui_response = await executor.run(evaluate_request, data, candidate, feedback_text, fields)
+        return 200, json_body(ui_response), []
+
+    except ExecutorBusy:
+        metrics.increment("rejected_total", endpoint="/api/evaluate")
+        return 503, error_body(
+            "Server busy", "Too many evaluations in progress, retry shortly"
+        ), [(b"retry-after", RETRY_AFTER.encode())]
+    except ValueError as e:
+        return 400, error_body("Invalid input", str(e)), []
+    except Exception as e:
+        return 500, error_body("Internal server error", str(e)), []
+
+
+def static_response(name, headers):
+    """GET /api/requirements and /api/skill-weights (precomputed, with ETag)."""
+    body, etag = get_static_payloads()[name]
+    extra = [
+        (b"etag", f'"{etag}"'.encode()),
+        (b"cache-control", STATIC_CACHE_CONTROL.encode())
+    ]
+    if etag_matches(headers.get(b"if-none-match", b"").decode("latin-1"), etag):
+        return 304, b"", extra
+    return 200, body, extra
+
+
+STATIC_ROUTES = {
+    "/api/requirements": "requirements",
+    "/api/skill-weights": "skill_weights"
+}
+
+
+async def handle(scope, receive, headers):
+    """Route one request; returns (endpoint label, status, body, extra headers)."""
+    path = scope["path"]
+    method = scope["method"]
+
+    if path == "/api/evaluate" and method == "POST":
+        return (path, *await evaluate(scope, headers, receive))
+
+    if path in STATIC_ROUTES and method in ("GET", "HEAD"):
+        return (path, *static_response(STATIC_ROUTES[path], headers))
+
+    if path == "/api/metrics" and method in ("GET", "HEAD"):
+        return path, 200, metrics.render_prometheus().encode(), [
+            (b"content-type", b"text/plain; version=0.0.4; charset=utf-8")
+        ]
+
+    if path == "/api/evaluate" or path in STATIC_ROUTES or path == "/api/metrics":
+        allowed = "OPTIONS, POST" if path == "/api/evaluate" else "GET, HEAD, OPTIONS"
+        return "unmatched", 405, error_body(
+            "Method not allowed", f"{method} is not supported on {path}"
+        ), [(b"allow", allowed.encode())]
+
+    return "unmatched", 404, json_body({
+        "success": False,
+        "error": "Not found",
+        "message": "This is an API-only backend. Use /api/* endpoints.",
+        "available_endpoints": AVAILABLE_ENDPOINTS
+    }), []
+
+
+def cors_headers(headers):
+    """Same CORS headers as flask-cors with its defaults (any origin)."""
+    origin = headers.get(b"origin")
+    if origin is None:
+        return [(b"access-control-allow-origin", b"*")]
+    return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+
+
+async def http(scope, receive, send):
+    start = perf_counter()
+    headers = dict((name.lower(), value) for name, value in scope["headers"])
+
+    if scope["method"] == "OPTIONS":
+        # CORS preflight
+        response_headers = cors_headers(headers) + [(b"access-control-allow-methods", CORS_ALLOW_METHODS)]
+        if b"access-control-request-headers" in headers:
+            response_headers.append((b"access-control-allow-headers", headers[b"access-control-request-headers"]))
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": response_headers + [(b"content-length", b"0")]
+        })
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    endpoint, status, body, extra = await handle(scope, receive, headers)
+
+    is_json = not any(name == b"content-type" for name, _ in extra)
+    if RESPONSE_COMPRESSION and status == 200 and is_json:
+        extra.append((b"vary", b"Accept-Encoding"))
+        encoding = len(body) >= COMPRESS_MIN_BYTES and choose_encoding(
+            headers.get(b"accept-encoding", b"").decode("latin-1")
+        )
+        if encoding:
+            body = compress(body, encoding)
+            # The strong ETag names the uncompressed representation
+            extra = [(name, b"W/" + value if name == b"etag" else value) for name, value in extra]
+            extra.append((b"content-encoding", encoding.encode()))
+
+    response_headers = extra + cors_headers(headers)
+    if is_json and status != 304:
+        response_headers.append((b"content-type", b"application/json"))
+    if status != 304:
+        response_headers.append((b"content-length", str(len(body)).encode()))
+    if scope["method"] == "HEAD":
+        body = b""
+
+    await send({"type": "http.response.start", "status": status, "headers": response_headers})
+    await send({"type": "http.response.body", "body": body})
+
+    if metrics.enabled:
+        metrics.observe("request_duration_seconds", (("endpoint", endpoint),), perf_counter() - start)
+        metrics.increment("requests_total", endpoint=endpoint, status=status)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            executor.shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI 3 application callable."""
+    if scope["type"] == "http":
+        await http(scope, receive, send)
+    elif scope["type"] == "lifespan":
+        await lifespan(receive, send)
@@ -0,0 +1,67 @@
+"""
+Benchmark: batched vs per-candidate evaluation.
+
+"scalar" scores each candidate on its own, as /api/evaluate does
+(scoring_engine.evaluate_candidate, or evaluate_state for the whole
+pipeline). "batched" scores a whole cohort with one matrix evaluation
+(scoring_engine.evaluate_candidates, or pipeline.evaluate_many), as the batch
+endpoint, the micro-batcher and EvaluationService do. Both columns are
+microseconds per candidate, best of --repeat interleaved runs.
+
+Run from the repository root:
+    python benchmarks/bench_batch_engine.py [--repeat 15]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.cohort import make_cohort
+from agents import scoring_engine
+from services.pipeline import evaluate_many, evaluate_state, parse_candidate
+
+
+def best_per_candidate(cases, size, repeat):
+    """{name: best µs per candidate}, running the cases in turn on every repeat."""
+    best = dict.fromkeys(cases, float("inf"))
+    for _ in range(repeat):
+        for name, fn in cases.items():
+            best[name] = min(best[name], timeit.timeit(fn, number=1) / size * 1e6)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+
+    tables = scoring_engine.get_tables()
+    print(f"{'cohort':>7} {'engine scalar':>14} {'engine batched':>15} {'pipeline scalar':>16} {'pipeline batched':>17}")
+    for size in args.sizes:
+        entries = [parse_candidate(data) for data in make_cohort(size)]
+        candidates = [candidate for candidate, _ in entries]
+        # Small cohorts are timed many times over to stay above timer resolution
+        copies = max(1, 1000 // size)
+
+        best = best_per_candidate({
+            "engine scalar": lambda: [
+                scoring_engine.evaluate_candidate(candidate, tables) for _ in range(copies) for candidate in candidates
+            ],
+            "engine batched": lambda: [
+                scoring_engine.evaluate_candidates(candidates, tables) for _ in range(copies)
+            ],
+            "pipeline scalar": lambda: [
+                evaluate_state(candidate, feedback_text) for _ in range(copies) for candidate, feedback_text in entries
+            ],
+            "pipeline batched": lambda: [evaluate_many(entries, tables) for _ in range(copies)]
+        }, size * copies, args.repeat)
+
+        print(f"{size:>7} {best['engine scalar']:>14.2f} {best['engine batched']:>15.2f} "
+              f"{best['pipeline scalar']:>16.1f} {best['pipeline batched']:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Cold-start benchmark: wall time from launching a fresh interpreter to the
+first complete response, as on a serverless cold start.
+
+Each run starts a new process that imports the app and serves one request
+through the WSGI test client, then exits. Lazy table builds (the default)
+are compared with EAGER_INIT=1.
+
+Run from the repository root:
+    python benchmarks/bench_cold_start.py [--runs 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, os, sys
+from time import perf_counter
+start = perf_counter()
+from app import app
+imported = perf_counter() - start
+client = app.test_client()
+if {path!r} == "/api/evaluate":
+    response = client.post("/api/evaluate", json={{"excel": 72, "sql": 66, "python": 70, "stats": 68,
+                                                  "ml": 55, "bi": 70, "feedback": "Clear communication"}})
+else:
+    response = client.get({path!r})
+assert response.status_code == 200, response.status_code
+done = perf_counter() - start
+sys.stdout.write(json.dumps({{"import": imported, "first_response": done}}))
+sys.stdout.flush()
+os._exit(0)
+"""
+
+SCENARIOS = (
+    ("lazy", {}),
+    ("eager", {"EAGER_INIT": "1"}),
+)
+
+PATHS = ("/api/evaluate", "/api/requirements")
+
+
+def cold_start(path, env):
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-c", PROBE.format(path=path)],
+        cwd=ROOT, env={**os.environ, **env}, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+    probe = json.loads(process.stdout)
+    return wall, probe["import"], probe["first_response"]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'init':>6} {'first request':<22} {'wall ms':>8} {'import ms':>10} {'in-process ms':>14}")
+    for name, env in SCENARIOS:
+        for path in PATHS:
+            cold_start(path, env)  # warm the OS page cache and .pyc files
+            samples = [cold_start(path, env) for _ in range(args.runs)]
+            wall, imported, first = (statistics.median(column) * 1000 for column in zip(*samples))
+            method = "POST" if path == "/api/evaluate" else "GET"
+            print(f"{name:>6} {method + ' ' + path:<22} {wall:>8.1f} {imported:>10.1f} {first:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: compiled feedback matcher vs. the original nested substring scan.
+
+The two no longer agree on every text: the compiled matcher only matches
+whole words and handles negation (see bench_feedback_tokenizer.py for its
+cost per KB).
+
+Run from the repository root:
+    python benchmarks/bench_feedback.py
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.feedback_agent import analyze_feedback, SKILL_MAP
+
+
+def legacy_analyze_feedback(feedback_text):
+    """Original implementation: per-clause x skill x keyword substring scans."""
+    text = feedback_text.lower()
+    strengths = set()
+    gaps = set()
+
+    skill_map = {skill: dict(rules) for skill, rules in SKILL_MAP.items()}
+
+    clauses = re.split(r",|and|but|\.", text)
+    for clause in clauses:
+        for skill, rules in skill_map.items():
+            if any(k in clause for k in rules["keywords"]):
+                if any(p in clause for p in rules["positive"]):
+                    strengths.add(rules["strength_label"])
+                if any(n in clause for n in rules["negative"]):
+                    gaps.add(rules["gap_label"])
+
+    return strengths, gaps
+
+
+SENTENCES = [
+    "The candidate showed good communication but was nervous at the start.",
+    "SQL was weak and struggled with window functions, joins were basic.",
+    "Python code was clean, though a bit slow on the second problem.",
+    "Statistics understanding was average; probability questions confused them.",
+    "Machine learning knowledge is theoretical with no hands-on projects.",
+    "Built an impressive Power BI dashboard and a strong Tableau story.",
+    "Overall a pleasant conversation about their previous internship.",
+]
+
+
+def make_feedback(n_sentences):
+    return " ".join(SENTENCES[i % len(SENTENCES)] for i in range(n_sentences))
+
+
+def main():
+    # One sentence up to several pages (~500 words per page)
+    sizes = [1, 5, 20, 80, 250]
+    print(f"{'sentences':>9} {'chars':>7} {'legacy us':>10} {'compiled us':>12} {'speedup':>8}")
+    for n in sizes:
+        text = make_feedback(n)
+        number = max(10, 2000 // n)
+        legacy = timeit.timeit(lambda: legacy_analyze_feedback(text), number=number) / number
+        compiled = timeit.timeit(lambda: analyze_feedback(text), number=number) / number
+        print(f"{n:>9} {len(text):>7} {legacy * 1e6:>10.1f} {compiled * 1e6:>12.1f} {legacy / compiled:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
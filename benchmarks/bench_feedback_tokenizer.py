@@ -0,0 +1,59 @@
+"""
+Benchmark: feedback analysis cost per KB of text.
+
+Times assess_feedback() on realistic feedback from one sentence up to a
+pasted transcript well past MAX_FEEDBACK_CHARS, plus adversarial inputs
+(no punctuation, every word a term, every other word a negation). The
+cost per KB should stay flat as the text grows, and the cost of a whole
+call should stop growing once the text is truncated.
+
+Run from the repository root:
+    python benchmarks/bench_feedback_tokenizer.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.feedback_agent import MAX_FEEDBACK_CHARS, assess_feedback, get_skill_matcher
+
+SENTENCES = [
+    "The candidate showed good communication but was nervous at the start.",
+    "SQL was weak and struggled with window functions, joins were basic.",
+    "Python code was clean, though a bit slow on the second problem.",
+    "Statistics understanding was average; probability questions confused them.",
+    "Machine learning knowledge is theoretical with no hands-on projects.",
+    "Built an impressive Power BI dashboard and a strong Tableau story.",
+    "Communication was not very confident and the SQL wasn't strong.",
+    "Overall a pleasant conversation about their previous internship.",
+]
+
+
+def repeat_to(text, chars):
+    return (text * (chars // len(text) + 1))[:chars]
+
+
+def cases():
+    prose = " ".join(SENTENCES) + " "
+    for chars in (100, 1000, 5000, 20000, 100000, 1000000):
+        yield f"prose {chars}", repeat_to(prose, chars)
+    yield "no punctuation", repeat_to("the sql part was strong python clean overall ", 20000)
+    yield "all terms", repeat_to("sql strong weak python clean ml hands-on ", 20000)
+    yield "negations", repeat_to("not sql never strong no python hardly clean ", 20000)
+    yield "one long word", "x" * 100000
+
+
+def main():
+    get_skill_matcher()  # compile outside the timings
+    print(f"MAX_FEEDBACK_CHARS = {MAX_FEEDBACK_CHARS}\n")
+    print(f"{'case':>16} {'chars':>8} {'us/call':>10} {'us/KB':>8}")
+    for name, text in cases():
+        number = max(5, 200000 // len(text))
+        per_call = min(timeit.repeat(lambda: assess_feedback(text), number=number, repeat=5)) / number
+        analyzed_kb = min(len(text), MAX_FEEDBACK_CHARS) / 1024
+        print(f"{name:>16} {len(text):>8} {per_call * 1e6:>10.1f} {per_call * 1e6 / analyzed_kb:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
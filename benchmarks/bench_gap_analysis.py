@@ -0,0 +1,88 @@
+"""
+Micro-benchmark: role gap analysis per /api/evaluate request.
+
+"before" is the previous code path: recommend_roles() followed by the
+fuzzy skill-name lookup, which transform_response_for_ui ran twice.
+"after" is recommend_roles_detailed() plus one formatting pass.
+
+Run from the repository root:
+    python benchmarks/bench_gap_analysis.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.role_agent import recommend_roles, recommend_roles_detailed
+from rules.role_requirements import ROLE_REQUIREMENTS
+from rules.scoring_rules import SKILL_WEIGHTS
+
+
+def legacy_gap_analysis(scores, rejected):
+    gap_analysis_ui = []
+    for role, gap_list in rejected.items():
+        if role in ROLE_REQUIREMENTS:
+            role_requirements = ROLE_REQUIREMENTS[role]
+            skill_gaps = []
+            total_gap = 0
+            for skill_name in gap_list:
+                actual_skill = None
+                for skill_key in scores.keys():
+                    if skill_name.lower() in skill_key.lower() or skill_key.lower() in skill_name.lower():
+                        actual_skill = skill_key
+                        break
+                if actual_skill and actual_skill in role_requirements:
+                    candidate_score = scores[actual_skill]
+                    required_score = role_requirements[actual_skill]
+                    gap = required_score - candidate_score
+                    skill_gaps.append({
+                        "skill": actual_skill,
+                        "candidateScore": candidate_score,
+                        "requiredScore": required_score,
+                        "gap": gap
+                    })
+                    total_gap += gap
+            if skill_gaps:
+                gap_analysis_ui.append({"role": role, "gaps": skill_gaps, "totalGap": total_gap})
+    return gap_analysis_ui
+
+
+def before(scores):
+    _, rejected = recommend_roles(scores)
+    legacy_gap_analysis(scores, rejected)
+    return legacy_gap_analysis(scores, rejected)
+
+
+def after(scores):
+    _, _, role_gaps = recommend_roles_detailed(scores)
+    return [
+        {
+            "role": role,
+            "gaps": [
+                {"skill": skill, "candidateScore": actual, "requiredScore": required, "gap": gap}
+                for skill, required, actual, gap in skill_gaps
+            ],
+            "totalGap": sum(gap for _, _, _, gap in skill_gaps)
+        }
+        for role, skill_gaps in role_gaps.items()
+        if skill_gaps
+    ]
+
+
+def main(n=2000):
+    rng = random.Random(42)
+    cohort = [{skill: rng.randint(30, 100) for skill in SKILL_WEIGHTS} for _ in range(n)]
+
+    for scores in cohort[:200]:
+        assert before(scores) == after(scores)
+
+    t_before = timeit.timeit(lambda: [before(s) for s in cohort], number=3) / (3 * n)
+    t_after = timeit.timeit(lambda: [after(s) for s in cohort], number=3) / (3 * n)
+    print(f"gap analysis per request: before {t_before * 1e6:.1f} us, after {t_after * 1e6:.1f} us "
+          f"({t_before / t_after:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark: JSON encoding of evaluation responses.
+
+Compares Flask's default encoding (stdlib, compact and pretty-printed) with
+the FastJSONProvider path (orjson when installed) on realistic responses.
+
+Run from the repository root:
+    python benchmarks/bench_json.py
+"""
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.pipeline import evaluate_batch_item
+from services import json_provider
+
+FEEDBACK = [
+    "Good communication and strong SQL, python was slow.",
+    "Weak statistics and theoretical machine learning knowledge.",
+    "Impressive Power BI dashboard but nervous when explaining.",
+]
+
+
+def main(n=500):
+    rng = random.Random(7)
+    responses = [
+        evaluate_batch_item({
+            **{field: rng.randint(30, 100) for field in ("excel", "sql", "python", "stats", "ml", "bi")},
+            "feedback": rng.choice(FEEDBACK)
+        })
+        for _ in range(n)
+    ]
+
+    encoders = {
+        "stdlib pretty (debug)": lambda obj: json.dumps(obj, sort_keys=True, indent=2).encode(),
+        "stdlib compact": lambda obj: json.dumps(obj, sort_keys=True, separators=(",", ":")).encode(),
+        "provider compact": json_provider.dumps_bytes,
+    }
+    backend = "orjson" if json_provider.orjson is not None else "stdlib fallback"
+    print(f"FastJSONProvider backend: {backend}")
+    print(f"{'encoder':<24} {'us/response':>12} {'bytes/response':>15}")
+
+    for name, encode in encoders.items():
+        seconds = timeit.timeit(lambda: [encode(r) for r in responses], number=5) / (5 * n)
+        size = sum(len(encode(r)) for r in responses) / n
+        print(f"{name:<24} {seconds * 1e6:>12.1f} {size:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
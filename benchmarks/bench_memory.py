@@ -0,0 +1,98 @@
+"""
+Memory benchmark: tracemalloc peak for holding a cohort's intermediate
+results as dicts/lists (the agents' dict interface) versus the compact
+records in agents.models.
+
+Run from the repository root:
+    python benchmarks/bench_memory.py [--size 100000]
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.action_agent import generate_next_actions, next_actions
+from agents.feedback_agent import analyze_feedback, assess_feedback
+from agents.models import CandidateScores, REQUEST_FIELDS
+from agents.readiness_agent import assess_readiness, evaluate_readiness
+from agents.role_agent import match_roles, recommend_roles_detailed
+
+FEEDBACK = [
+    "Good communication and strong SQL, python was slow.",
+    "Weak statistics and theoretical machine learning knowledge.",
+    "Impressive Power BI dashboard but nervous when explaining.",
+    "",
+]
+
+
+def make_cohort(size, seed=42):
+    rng = random.Random(seed)
+    return [
+        {
+            **{field: rng.randint(30, 100) for field in REQUEST_FIELDS},
+            "feedback": rng.choice(FEEDBACK)
+        }
+        for _ in range(size)
+    ]
+
+
+def evaluate_dicts(cohort):
+    results = []
+    for data in cohort:
+        scores = CandidateScores.from_request(data).as_dict()
+        feedback = data["feedback"]
+        readiness = evaluate_readiness(scores, feedback)
+        recommended, rejected, role_gaps = recommend_roles_detailed(scores)
+        strengths, gaps, plan = analyze_feedback(feedback)
+        actions = generate_next_actions(readiness, recommended)
+        results.append((scores, readiness, (recommended, rejected, role_gaps), (strengths, gaps, plan), actions))
+    return results
+
+
+def evaluate_records(cohort):
+    results = []
+    for data in cohort:
+        candidate = CandidateScores.from_request(data)
+        feedback = data["feedback"]
+        readiness = assess_readiness(candidate, feedback)
+        match = match_roles(candidate)
+        analysis = assess_feedback(feedback)
+        actions = next_actions(readiness.status, match.recommended)
+        results.append((candidate, readiness, match, analysis, actions))
+    return results
+
+
+def measure(evaluate, cohort):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results = evaluate(cohort)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return current, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=100000)
+    args = parser.parse_args()
+
+    cohort = make_cohort(args.size)
+    print(f"{args.size:,} candidates")
+    print(f"{'model':>8} {'retained MiB':>13} {'peak MiB':>9} {'bytes/cand':>11} {'seconds':>8}")
+
+    for name, evaluate in (("dicts", evaluate_dicts), ("records", evaluate_records)):
+        current, peak, elapsed = measure(evaluate, cohort)
+        print(f"{name:>8} {current / 2**20:>13.1f} {peak / 2**20:>9.1f} "
+              f"{current / args.size:>11,.0f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Scaling benchmark: cohort throughput with 1..N worker processes.
+
+Run from the repository root:
+    python benchmarks/bench_parallel.py [--size 20000] [--max-workers N]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.parallel import DEFAULT_CHUNK_SIZE, EvaluationPool
+from services.pipeline import evaluate_batch_item
+
+FEEDBACK = [
+    "Good communication and strong SQL, python was slow.",
+    "Weak statistics and theoretical machine learning knowledge.",
+    "Impressive Power BI dashboard but nervous when explaining.",
+    "",
+]
+
+
+def make_cohort(size, seed=42):
+    rng = random.Random(seed)
+    return [
+        {
+            **{field: rng.randint(30, 100) for field in ("excel", "sql", "python", "stats", "ml", "bi")},
+            "feedback": rng.choice(FEEDBACK)
+        }
+        for _ in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=20000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    cohort = make_cohort(args.size)
+
+    start = time.perf_counter()
+    for data in cohort:
+        evaluate_batch_item(data)
+    baseline = args.size / (time.perf_counter() - start)
+    print(f"{'workers':>7} {'rows/sec':>10} {'speedup':>8}")
+    print(f"{'inline':>7} {baseline:>10,.0f} {1.0:>7.2f}x")
+
+    for workers in range(1, args.max_workers + 1):
+        with EvaluationPool(workers, args.chunk_size) as pool:
+            # Warm up: start the workers and load the pipeline in each
+            list(pool.evaluate(cohort[:workers * args.chunk_size]))
+
+            start = time.perf_counter()
+            for _ in pool.evaluate(cohort):
+                pass
+            rate = args.size / (time.perf_counter() - start)
+        print(f"{workers:>7} {rate:>10,.0f} {rate / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: bytes on the wire and server CPU per evaluation response.
+
+Posts realistic candidates to /api/evaluate and /api/evaluate/batch through
+the Flask test client, full and with a `fields` projection, each without
+compression and with every encoding services.compression supports. The
+CPU column is process time per response (evaluation, JSON encoding and
+compression, plus the test client's WSGI overhead, which dominates the
+single-request rows); the evaluation cache is disabled so every request
+evaluates.
+
+Run from the repository root:
+    python benchmarks/bench_response_size.py [--batch-size 500]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["EVAL_CACHE_SIZE"] = "0"
+
+from benchmarks.cohort import make_cohort
+from app import app
+from services.compression import ENCODINGS
+
+PROJECTIONS = {
+    "full": "",
+    "status+score": "readiness.status,readiness.score",
+    "readiness": "readiness",
+    "gapAnalysis": "gapAnalysis"
+}
+
+
+def measure(client, path, payloads, accept_encoding, repeat):
+    """(bytes per response, CPU µs per response): best of `repeat` passes."""
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+    best = None
+    for _ in range(repeat):
+        size = 0
+        start = time.process_time()
+        for payload in payloads:
+            response = client.post(path, json=payload, headers=headers)
+            size += len(response.get_data())
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return size / len(payloads), best * 1e6 / len(payloads)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--singles", type=int, default=300, help="candidates posted one by one")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    singles = make_cohort(args.singles)
+    batches = [make_cohort(args.batch_size)]
+    encodings = ("identity",) + ENCODINGS
+
+    print(f"{'request':>8} {'fields':>13} {'encoding':>9} {'bytes/resp':>11} {'cpu us/resp':>12}")
+    for label, path, payloads, per_request in (
+        ("single", "/api/evaluate", singles, 1),
+        ("batch", "/api/evaluate/batch", batches, args.batch_size)
+    ):
+        for name, fields in PROJECTIONS.items():
+            query = f"{path}?fields={fields}" if fields else path
+            for encoding in encodings:
+                size, cpu = measure(
+                    client, query, payloads, "" if encoding == "identity" else encoding, args.repeat
+                )
+                print(f"{label:>8} {name:>13} {encoding:>9} {size / per_request:>11,.0f} {cpu / per_request:>12,.1f}")
+
+
+if __name__ == "__main__":
+    main()
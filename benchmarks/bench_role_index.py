@@ -0,0 +1,85 @@
+"""
+Micro-benchmark: role matching against a large synthetic catalogue.
+
+"scan" checks every (role, skill) requirement like recommend_roles();
+"index" answers the same queries from agents.role_index.RoleIndex.
+
+Run from the repository root:
+    python benchmarks/bench_role_index.py [--roles 500] [--skills 40]
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.role_index import RoleIndex
+
+
+def make_catalogue(roles, skills, seed=7):
+    rng = random.Random(seed)
+    skill_names = [f"Skill {j}" for j in range(skills)]
+    return skill_names, {
+        f"Role {r}": {skill: rng.randint(40, 90) for skill in rng.sample(skill_names, rng.randint(2, 8))}
+        for r in range(roles)
+    }
+
+
+def scan_eligible(catalogue, scores):
+    return [
+        role for role, minimums in catalogue.items()
+        if all(scores.get(skill, 0) >= minimum for skill, minimum in minimums.items())
+    ]
+
+
+def scan_within(catalogue, scores, points):
+    return [
+        role for role, minimums in catalogue.items()
+        if all(scores.get(skill, 0) + points >= minimum for skill, minimum in minimums.items())
+    ]
+
+
+def scan_closest(catalogue, scores, n):
+    totals = [
+        (sum(max(0, minimum - scores.get(skill, 0)) for skill, minimum in minimums.items()), r, role)
+        for r, (role, minimums) in enumerate(catalogue.items())
+    ]
+    return [(role, total) for total, _, role in sorted(totals)[:n]]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--roles", type=int, default=500)
+    parser.add_argument("--skills", type=int, default=40)
+    parser.add_argument("--candidates", type=int, default=200)
+    args = parser.parse_args()
+
+    skill_names, catalogue = make_catalogue(args.roles, args.skills)
+    rng = random.Random(1)
+    cohort = [{skill: rng.randint(40, 100) for skill in skill_names} for _ in range(args.candidates)]
+
+    index = RoleIndex(catalogue)
+    build = timeit.timeit(lambda: RoleIndex(catalogue), number=3) / 3
+
+    for scores in cohort:
+        assert index.eligible(scores) == scan_eligible(catalogue, scores)
+        assert index.within(scores, 10) == scan_within(catalogue, scores, 10)
+        assert index.closest(scores, 5) == scan_closest(catalogue, scores, 5)
+
+    print(f"{args.roles} roles x {args.skills} skills, index built in {build * 1000:.1f} ms")
+    print(f"{'query':>14} {'scan us':>9} {'index us':>9} {'speedup':>8}")
+    queries = (
+        ("eligible", lambda s: scan_eligible(catalogue, s), index.eligible),
+        ("within 10", lambda s: scan_within(catalogue, s, 10), lambda s: index.within(s, 10)),
+        ("closest 5", lambda s: scan_closest(catalogue, s, 5), lambda s: index.closest(s, 5)),
+    )
+    for name, scan, indexed in queries:
+        scan_time = timeit.timeit(lambda: [scan(s) for s in cohort], number=3) / (3 * len(cohort))
+        index_time = timeit.timeit(lambda: [indexed(s) for s in cohort], number=3) / (3 * len(cohort))
+        print(f"{name:>14} {scan_time * 1e6:>9.1f} {index_time * 1e6:>9.1f} {scan_time / index_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Deterministic synthetic cohort generator for the benchmarks.
+
+Scores come from a per-candidate ability level plus per-skill spread, so
+cohorts have the usual mix of strong, borderline and weak candidates with
+correlated skills. Feedback texts are built from interviewer-style phrases
+and vary from empty to a few paragraphs.
+"""
+import random
+
+from agents.models import REQUEST_FIELDS
+
+# Mean offset of each skill from the candidate's overall level
+SKILL_OFFSETS = {"excel": 6, "sql": 2, "python": 0, "stats": -4, "ml": -8, "bi": 3}
+
+PHRASES = (
+    "Good communication and clear structure.",
+    "Explained the approach confidently.",
+    "Struggled to explain the reasoning behind the solution.",
+    "Strong SQL, wrote joins and subqueries without hesitation.",
+    "SQL fundamentals need work, especially aggregations.",
+    "Python was slow and the code needed debugging.",
+    "Solid Python problem-solving with clean functions.",
+    "Weak statistics, unsure about distributions and hypothesis tests.",
+    "Good grasp of probability.",
+    "Theoretical machine learning knowledge but no practical model evaluation.",
+    "Built a machine learning project end to end.",
+    "Impressive Power BI dashboard.",
+    "Tableau work was basic.",
+    "Nervous at the start but improved.",
+    "Excel skills are strong, comfortable with pivot tables.",
+    "Needs more practice with case questions.",
+)
+
+# Relative frequency of feedback lengths (number of phrases)
+LENGTH_WEIGHTS = {0: 2, 1: 4, 2: 6, 3: 6, 5: 4, 8: 2, 15: 1, 40: 1}
+
+
+def make_candidate(rng):
+    level = rng.gauss(66, 12)
+    candidate = {
+        field: max(0, min(100, round(level + SKILL_OFFSETS[field] + rng.gauss(0, 9))))
+        for field in REQUEST_FIELDS
+    }
+    length = rng.choices(list(LENGTH_WEIGHTS), weights=list(LENGTH_WEIGHTS.values()))[0]
+    candidate["feedback"] = " ".join(rng.choice(PHRASES) for _ in range(length))
+    return candidate
+
+
+def make_cohort(size, seed=42):
+    """`size` /api/evaluate payloads; the same seed always gives the same cohort."""
+    rng = random.Random(seed)
+    return [make_candidate(rng) for _ in range(size)]
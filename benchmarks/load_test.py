@@ -0,0 +1,213 @@
+"""
+Load test: the Flask (WSGI) app vs the ASGI entry point under the same
+concurrency, reporting requests/sec and latency percentiles for
+POST /api/evaluate.
+
+Both servers are started as subprocesses with the evaluation cache
+disabled (--cache keeps it on). The client is a dependency-free asyncio
+HTTP/1.1 keep-alive client with one connection per simulated user.
+
+Run from the repository root:
+    python benchmarks/load_test.py [--concurrency 16,64,256] [--duration 10]
+
+Target servers that are already running with --wsgi-url / --asgi-url.
+The default ASGI server command needs uvicorn (pip install uvicorn).
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WSGI_CMD = (
+    "{python} -c \"from werkzeug.serving import run_simple; from app import app; "
+    "run_simple('127.0.0.1', {port}, app, threaded=True)\""
+)
+ASGI_CMD = "{python} -m uvicorn asgi:app --port {port} --log-level warning --no-access-log"
+
+FEEDBACK = [
+    "Good communication and strong SQL, python was slow.",
+    "Weak statistics and theoretical machine learning knowledge.",
+    "Impressive Power BI dashboard but nervous when explaining.",
+    "",
+]
+
+
+def make_payloads(count, seed=42):
+    rng = random.Random(seed)
+    return [
+        json.dumps({
+            **{field: rng.randint(30, 100) for field in ("excel", "sql", "python", "stats", "ml", "bi")},
+            "feedback": rng.choice(FEEDBACK)
+        }).encode()
+        for _ in range(count)
+    ]
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+async def read_response(reader):
+    """Read one HTTP/1.x response; returns (status, keep_alive)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("server closed the connection")
+    status = int(status_line.split()[1])
+
+    length = None
+    keep_alive = status_line.startswith(b"HTTP/1.1")
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.partition(b":")
+        name = name.strip().lower()
+        if name == b"content-length":
+            length = int(value)
+        elif name == b"connection":
+            keep_alive = value.strip().lower() == b"keep-alive"
+
+    if length is not None:
+        await reader.readexactly(length)
+    elif status != 304:
+        await reader.read()
+        keep_alive = False
+    return status, keep_alive
+
+
+async def user(host, port, payloads, offset, deadline, results):
+    """One simulated client: sequential requests on a keep-alive connection."""
+    reader = writer = None
+    i = offset
+    while time.perf_counter() < deadline:
+        body = payloads[i % len(payloads)]
+        i += 1
+        request = (
+            b"POST /api/evaluate HTTP/1.1\r\nHost: %s\r\nContent-Type: application/json\r\n"
+            b"Content-Length: %d\r\n\r\n" % (host.encode(), len(body))
+        ) + body
+
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection(host, port)
+            writer.write(request)
+            status, keep_alive = await read_response(reader)
+        except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+            status, keep_alive = 0, False
+        results.append((time.perf_counter() - start, status))
+
+        if not keep_alive and writer is not None:
+            writer.close()
+            reader = writer = None
+
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(url, concurrency, duration, payloads):
+    parts = urlsplit(url)
+    results = []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        user(parts.hostname, parts.port, payloads, n * 97, deadline, results)
+        for n in range(concurrency)
+    ))
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    latencies = sorted(latency for latency, status in results if status == 200)
+    statuses = {}
+    for _, status in results:
+        statuses[status] = statuses.get(status, 0) + 1
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.50) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+        "max": (latencies[-1] if latencies else 0.0) * 1000,
+        "busy": statuses.get(503, 0),
+        "errors": sum(count for status, count in statuses.items() if status not in (200, 503))
+    }
+
+
+def wait_until_ready(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url + "/api/skill-weights", timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server at {url} did not come up")
+
+
+def start_server(command, port, env):
+    process = subprocess.Popen(
+        shlex.split(command.format(python=sys.executable, port=port)), cwd=ROOT, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(url)
+    except RuntimeError:
+        process.kill()
+        raise
+    return process, url
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", default="16,64,256",
+                        help="comma-separated numbers of concurrent connections")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--wsgi-url", help="use a running WSGI server instead of starting one")
+    parser.add_argument("--asgi-url", help="use a running ASGI server instead of starting one")
+    parser.add_argument("--wsgi-cmd", default=WSGI_CMD)
+    parser.add_argument("--asgi-cmd", default=ASGI_CMD)
+    parser.add_argument("--port", type=int, default=8731, help="first port for started servers")
+    parser.add_argument("--cache", action="store_true", help="keep the evaluation cache enabled")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",")]
+    payloads = make_payloads(5000)
+    env = dict(os.environ)
+    if not args.cache:
+        env["EVAL_CACHE_SIZE"] = "0"
+
+    targets = [("wsgi", args.wsgi_url, args.wsgi_cmd), ("asgi", args.asgi_url, args.asgi_cmd)]
+    print(f"{'server':>6} {'conc':>5} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'max ms':>8} {'503':>6} {'errors':>6}")
+
+    for n, (name, url, command) in enumerate(targets):
+        process = None
+        if url is None:
+            process, url = start_server(command, args.port + n, env)
+        try:
+            asyncio.run(run_load(url, levels[0], args.warmup, payloads))
+            for level in levels:
+                stats = summarize(*asyncio.run(run_load(url, level, args.duration, payloads)))
+                print(f"{name:>6} {level:>5} {stats['rps']:>8,.0f} {stats['p50']:>8.1f} {stats['p95']:>8.1f} "
+                      f"{stats['p99']:>8.1f} {stats['max']:>8.1f} {stats['busy']:>6} {stats['errors']:>6}")
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Stress check: one EvaluationService hammered from many threads.
+
+Every thread repeatedly evaluates random slices of a fixed cohort, alone
+(evaluate) or in batches (evaluate_many), and compares each response with
+the output of a plain single-threaded run under the same rules. Meanwhile
+one thread keeps rewriting a temporary copy of the rules file (RULES_FILE)
+with two alternating rule versions and reloading it, so the snapshot
+machinery is exercised too: every response must match the expected output
+for the version it reports, and every batch must use a single version.
+Exits with status 1 on any mismatch or error, or if no reload happened.
+
+Run from the repository root:
+    python benchmarks/stress_evaluation_service.py [--threads 16] [--seconds 10]
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The rule store must load the temporary copy: set before it is imported
+RULES_DIR = tempfile.mkdtemp(prefix="stress-rules-")
+RULES_FILE = os.path.join(RULES_DIR, "rules.json")
+shutil.copyfile(os.path.join(ROOT, "rules", "rules.json"), RULES_FILE)
+os.environ["RULES_FILE"] = RULES_FILE
+
+from benchmarks.cohort import make_cohort
+from rules.rule_store import rule_store
+from services.evaluation_service import EvaluationService
+from services.json_provider import dumps
+from services.pipeline import evaluate_candidate, parse_candidate
+
+
+def rule_variants():
+    """The rules file as shipped, and a second revision with other thresholds and minimums."""
+    with open(RULES_FILE, encoding="utf-8") as f:
+        original = json.load(f)
+
+    changed = json.loads(json.dumps(original))
+    changed["revision"] = original["revision"] + 1
+    changed["readiness_thresholds"] = {key: value - 10 for key, value in original["readiness_thresholds"].items()}
+    for minimums in changed["role_requirements"].values():
+        for skill in minimums:
+            minimums[skill] -= 5
+    return original, changed
+
+
+def write_rules(raw):
+    """Replace the rules file atomically, so a reload never reads a partial file."""
+    staging = RULES_FILE + ".tmp"
+    with open(staging, "w", encoding="utf-8") as f:
+        json.dump(raw, f)
+    os.replace(staging, RULES_FILE)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=16, help="caller threads")
+    parser.add_argument("--workers", type=int, default=4, help="service pool threads")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    args = parser.parse_args()
+
+    entries = [parse_candidate(data) for data in make_cohort(args.size)]
+
+    # Expected responses per rule version, from a plain single-threaded run
+    variants = rule_variants()
+    expected = {}
+    start = time.perf_counter()
+    for raw in variants:
+        write_rules(raw)
+        rules = rule_store.refresh(force=True)
+        expected[rules.version] = [
+            dumps(evaluate_candidate(candidate, feedback_text)) for candidate, feedback_text in entries
+        ]
+    serial_rate = len(variants) * len(entries) / (time.perf_counter() - start)
+    if len(expected) != len(variants):
+        sys.exit("the rule variants do not have distinct versions")
+    reloads_before = rule_store.reloads
+
+    service = EvaluationService(workers=args.workers, chunk_size=args.chunk_size)
+    deadline = time.monotonic() + args.seconds
+    lock = threading.Lock()
+    totals = {"evaluated": 0, "mismatches": 0, "mixed": 0, "errors": 0}
+
+    def hammer(seed):
+        rng = random.Random(seed)
+        evaluated = mismatches = mixed = errors = 0
+        while time.monotonic() < deadline:
+            lo = rng.randrange(len(entries))
+            try:
+                if rng.random() < 0.5:
+                    responses = [service.evaluate(*entries[lo])]
+                else:
+                    hi = min(len(entries), lo + rng.randint(1, 4 * args.chunk_size))
+                    responses = service.evaluate_many(entries[lo:hi])
+            except Exception:
+                errors += 1
+                continue
+            evaluated += len(responses)
+            versions = {response["ruleVersion"] for response in responses}
+            mixed += len(versions) > 1
+            mismatches += sum(
+                response["ruleVersion"] not in expected
+                or dumps(response) != expected[response["ruleVersion"]][lo + k]
+                for k, response in enumerate(responses)
+            )
+        with lock:
+            totals["evaluated"] += evaluated
+            totals["mismatches"] += mismatches
+            totals["mixed"] += mixed
+            totals["errors"] += errors
+
+    def reload_rules():
+        turn = 0
+        while time.monotonic() < deadline:
+            write_rules(variants[turn % len(variants)])
+            rule_store.refresh(force=True)
+            turn += 1
+            time.sleep(0.01)
+
+    threads = [threading.Thread(target=hammer, args=(seed,)) for seed in range(args.threads)]
+    threads.append(threading.Thread(target=reload_rules))
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    service.shutdown()
+    swaps = rule_store.reloads - reloads_before
+    shutil.rmtree(RULES_DIR, ignore_errors=True)
+
+    print(f"single-threaded: {serial_rate:,.0f} evaluations/s")
+    print(f"{args.threads} threads, {args.workers} workers: {totals['evaluated'] / elapsed:,.0f} evaluations/s "
+          f"({totals['evaluated']:,} in {elapsed:.1f}s)")
+    print(f"rule swaps: {swaps}")
+    print(f"mismatches: {totals['mismatches']}  mixed-version batches: {totals['mixed']}  errors: {totals['errors']}")
+    sys.exit(1 if totals["mismatches"] or totals["mixed"] or totals["errors"] or not swaps else 0)
+
+
+if __name__ == "__main__":
+    main()
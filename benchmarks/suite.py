@@ -0,0 +1,247 @@
+"""
+Benchmark and regression suite for the evaluation pipeline.
+
+Measures throughput and latency percentiles of each agent stage, the UI
+transform, the whole pipeline and the Flask endpoints (through the test
+client, evaluation cache off) on a deterministic synthetic cohort, and
+saves the results as a JSON baseline. `compare` flags regressions.
+
+Run from the repository root:
+    python benchmarks/suite.py run [--size 2000] [--only feedback] [-o benchmarks/baselines/main.json]
+    python benchmarks/suite.py compare benchmarks/baselines/main.json current.json [--threshold 0.15]
+    python benchmarks/suite.py run --compare benchmarks/baselines/main.json
+
+`compare` exits with status 1 when any case regressed by more than the
+threshold (throughput down or p95 latency up).
+"""
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Measure the pipeline, not response cache hits; keep every cohort
+# member's stage values so PATCH requests take the incremental path
+os.environ.setdefault("EVAL_CACHE_SIZE", "0")
+os.environ.setdefault("EVAL_STATE_CACHE_SIZE", "1000000")
+
+import numpy as np
+
+from agents.action_agent import generate_next_actions
+from agents.feedback_agent import analyze_feedback
+from agents.models import CandidateScores
+from agents.readiness_agent import evaluate_readiness
+from agents.role_agent import recommend_roles, recommend_roles_detailed
+from app import app, evaluate_and_remember
+from benchmarks.cohort import make_cohort
+from rules.rule_store import rule_store
+from services import json_provider
+from services.pipeline import evaluate_candidate, parse_candidate, transform_response_for_ui
+
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "baselines", "latest.json")
+BATCH_SIZE = 100
+
+
+def time_calls(fn, inputs):
+    """Call fn(*args) for every args tuple; returns per-call seconds."""
+    samples = []
+    for args in inputs:
+        start = perf_counter()
+        fn(*args)
+        samples.append(perf_counter() - start)
+    return samples
+
+
+def summarize(samples_per_repeat, items_per_call=1):
+    """Best-of-repeats throughput and latency percentiles over all samples."""
+    best_total = min(sum(samples) for samples in samples_per_repeat)
+    calls = len(samples_per_repeat[0])
+    latencies = np.array([sample for samples in samples_per_repeat for sample in samples])
+    p50, p95, p99 = np.percentile(latencies, (50, 95, 99)) * 1e6
+    return {
+        "calls": calls,
+        "ops_per_sec": calls * items_per_call / best_total,
+        "p50_us": p50,
+        "p95_us": p95,
+        "p99_us": p99
+    }
+
+
+def build_cases(cohort):
+    """[(name, fn, inputs, items per call)] for every benchmarked stage."""
+    parsed = [parse_candidate(data) for data in cohort]
+    score_dicts = [candidate.as_dict() for candidate, _ in parsed]
+    feedback = [feedback_text for _, feedback_text in parsed]
+
+    readiness = [evaluate_readiness(scores, text) for scores, text in zip(score_dicts, feedback)]
+    roles = [recommend_roles_detailed(scores) for scores in score_dicts]
+    analyses = [analyze_feedback(text) for text in feedback]
+    actions = [generate_next_actions(r, recommended) for r, (recommended, _, _) in zip(readiness, roles)]
+    weights = rule_store.current.skill_weights
+
+    transform_inputs = [
+        (r, scores, weights, recommended, rejected, strengths, gaps, plan, action_items, role_gaps)
+        for r, scores, (recommended, rejected, role_gaps), (strengths, gaps, plan), action_items
+        in zip(readiness, score_dicts, roles, analyses, actions)
+    ]
+
+    client = app.test_client()
+    bodies = [json_provider.dumps_bytes(data) for data in cohort]
+    batches = [
+        json_provider.dumps_bytes(cohort[i:i + BATCH_SIZE])
+        for i in range(0, len(cohort) - BATCH_SIZE + 1, BATCH_SIZE)
+    ]
+
+    # PATCH bodies change one score of an already evaluated candidate
+    for candidate, feedback_text in parsed:
+        evaluate_and_remember(candidate, feedback_text)
+    patches = [
+        json_provider.dumps_bytes({"previous": data, "delta": {"sql": (data["sql"] + 7) % 101}})
+        for data in cohort
+    ]
+
+    def post(path, body):
+        response = client.post(path, data=body, content_type="application/json")
+        assert response.status_code == 200, response.status_code
+
+    def patch(path, body):
+        response = client.patch(path, data=body, content_type="application/json")
+        assert response.status_code == 200, response.status_code
+
+    def get(path):
+        assert client.get(path).status_code == 200
+
+    return [
+        ("stage/evaluate_readiness", evaluate_readiness, list(zip(score_dicts, feedback)), 1),
+        ("stage/recommend_roles", recommend_roles, [(scores,) for scores in score_dicts], 1),
+        ("stage/analyze_feedback", analyze_feedback, [(text,) for text in feedback], 1),
+        ("stage/generate_next_actions", generate_next_actions,
+         [(r, recommended) for r, (recommended, _, _) in zip(readiness, roles)], 1),
+        ("stage/transform_response_for_ui",
+         lambda *args: transform_response_for_ui(*args[:9], role_gaps=args[9]), transform_inputs, 1),
+        ("pipeline/evaluate_candidate", evaluate_candidate,
+         [(CandidateScores.from_request(data), data["feedback"]) for data in cohort], 1),
+        ("endpoint/POST /api/evaluate", post, [("/api/evaluate", body) for body in bodies], 1),
+        ("endpoint/PATCH /api/evaluate", patch, [("/api/evaluate", body) for body in patches], 1),
+        (f"endpoint/POST /api/evaluate/batch x{BATCH_SIZE}", post,
+         [("/api/evaluate/batch", body) for body in batches], BATCH_SIZE),
+        ("endpoint/GET /api/requirements", get, [("/api/requirements",)] * len(cohort), 1),
+    ]
+
+
+def environment():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "orjson": json_provider.orjson is not None,
+        "commit": commit,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    }
+
+
+def run(size, repeat, seed, only=None):
+    cohort = make_cohort(size, seed)
+    results = {}
+    for name, fn, inputs, items_per_call in build_cases(cohort):
+        if only and not any(fnmatch.fnmatch(name, f"*{pattern}*") for pattern in only):
+            continue
+        time_calls(fn, inputs[:50])  # warm up
+        results[name] = summarize([time_calls(fn, inputs) for _ in range(repeat)], items_per_call)
+        stats = results[name]
+        print(f"{name:<44} {stats['ops_per_sec']:>11,.0f}/s  p50 {stats['p50_us']:>8.1f}us  "
+              f"p95 {stats['p95_us']:>8.1f}us  p99 {stats['p99_us']:>8.1f}us", file=sys.stderr)
+
+    return {
+        "environment": environment(),
+        "cohort": {"size": size, "seed": seed, "repeat": repeat},
+        "results": results
+    }
+
+
+def compare(baseline, current, threshold):
+    """
+    Print a comparison table; returns the names of regressed cases
+    (throughput down or p95 latency up by more than `threshold`).
+    """
+    regressions = []
+    print(f"{'case':<44} {'ops/s':>11} {'change':>8} {'p95 us':>9} {'change':>8}")
+    for name, stats in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:<44} {stats['ops_per_sec']:>11,.0f} {'new':>8} {stats['p95_us']:>9.1f}")
+            continue
+
+        throughput_change = stats["ops_per_sec"] / base["ops_per_sec"] - 1
+        p95_change = stats["p95_us"] / base["p95_us"] - 1
+        regressed = throughput_change < -threshold or p95_change > threshold
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<44} {stats['ops_per_sec']:>11,.0f} {throughput_change:>+8.1%} "
+              f"{stats['p95_us']:>9.1f} {p95_change:>+8.1%}{'  REGRESSION' if regressed else ''}")
+
+    if baseline["environment"].get("platform") != current["environment"].get("platform"):
+        print("\nnote: baseline was recorded on a different platform")
+    return regressions
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite and save the results")
+    run_parser.add_argument("--size", type=int, default=2000, help="candidates in the cohort")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--only", action="append", help="run cases whose name contains this (repeatable)")
+    run_parser.add_argument("-o", "--output", default=DEFAULT_BASELINE)
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare against a saved baseline")
+    run_parser.add_argument("--threshold", type=float, default=0.15)
+
+    compare_parser = commands.add_parser("compare", help="compare two saved results")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.15,
+                                help="relative change that counts as a regression (default: 0.15)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        results = run(args.size, args.repeat, args.seed, args.only)
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"saved {args.output}", file=sys.stderr)
+        if not args.compare:
+            return
+        baseline, current = load(args.compare), results
+    else:
+        baseline, current = load(args.baseline), load(args.current)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
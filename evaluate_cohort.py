@@ -0,0 +1,153 @@
+"""
+Offline cohort evaluation.
+
+Streams a CSV or NDJSON export of candidate scores through the same agent
+pipeline as /api/evaluate and writes one NDJSON result per input row, in
+input order. Rows are processed in chunks of --chunk-size (each chunk
+scored with one batched engine call), so memory use does not grow with the
+size of the input.
+
+Usage:
+    python evaluate_cohort.py scores.csv -o results.ndjson
+    python evaluate_cohort.py scores.csv --map sql=SQL_Score --map feedback=Interviewer_Notes
+    cat scores.ndjson | python evaluate_cohort.py - --format ndjson > results.ndjson
+    python evaluate_cohort.py scores.csv -o results.ndjson --workers 0   # all cores
+    python evaluate_cohort.py scores.csv --summary -o summary.json      # cohort aggregates only
+"""
+import argparse
+import csv
+import sys
+import time
+
+from services.cohort_summary import summarize_cohort
+from services.json_provider import dumps, loads
+from services.parallel import DEFAULT_CHUNK_SIZE, EvaluationPool, chunked
+from services.pipeline import evaluate_batch
+
+# Request fields understood by /api/evaluate
+FIELDS = ("excel", "sql", "python", "stats", "ml", "bi", "feedback")
+
+
+def read_rows(stream, input_format):
+    """Yield raw rows (dicts) from a CSV or NDJSON stream."""
+    if input_format == "csv":
+        csv.field_size_limit(2 ** 31 - 1)  # long interviewer notes
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            yield loads(line)
+        except ValueError as e:
+            yield ValueError(f"Malformed NDJSON line: {e}")
+
+
+def map_rows(rows, column_map):
+    """
+    Rename source columns to the /api/evaluate fields.
+    Columns are matched case-insensitively; empty cells count as missing.
+    """
+    for row in rows:
+        if not isinstance(row, dict):
+            yield row
+            continue
+
+        lookup = {str(key).strip().lower(): value for key, value in row.items()}
+        candidate = {}
+        for field in FIELDS:
+            value = lookup.get(column_map.get(field, field).lower())
+            if value is not None and value != "":
+                candidate[field] = value
+        yield candidate
+
+
+def evaluate_rows(candidates, pool=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield evaluation results (or in-place error objects) in input order,
+    optionally spread across a process pool.
+    """
+    if pool is not None:
+        yield from pool.evaluate(candidates)
+        return
+
+    for chunk in chunked(candidates, chunk_size):
+        yield from evaluate_batch(chunk)
+
+
+def write_results(results, stream):
+    """Write results as NDJSON; returns (rows, errors)."""
+    rows = errors = 0
+    for result in results:
+        stream.write(dumps(result))
+        stream.write("\n")
+        rows += 1
+        if result.get("success") is False:
+            errors += 1
+    return rows, errors
+
+
+def parse_column_map(pairs):
+    column_map = {}
+    for pair in pairs:
+        field, sep, column = pair.partition("=")
+        field = field.strip().lower()
+        if not sep or field not in FIELDS or not column.strip():
+            raise SystemExit(f"Invalid --map '{pair}', expected FIELD=COLUMN with FIELD in {', '.join(FIELDS)}")
+        column_map[field] = column.strip()
+    return column_map
+
+
+def detect_format(path):
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a cohort through the placement evaluation pipeline.")
+    parser.add_argument("input", help="CSV or NDJSON file ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="NDJSON output file (default: stdout)")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="input format (default: from file extension)")
+    parser.add_argument("--map", action="append", default=[], metavar="FIELD=COLUMN",
+                        help="map an input column to a field (excel, sql, python, stats, ml, bi, feedback)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (default: 1, 0 = one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"candidates per worker task or in-process batch (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--summary", action="store_true",
+                        help="write cohort aggregates (as /api/cohort/summary) instead of per-row results")
+    args = parser.parse_args(argv)
+
+    column_map = parse_column_map(args.map)
+    input_format = args.format or ("ndjson" if args.input == "-" else detect_format(args.input))
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    pool = EvaluationPool(args.workers or None, args.chunk_size) if args.workers != 1 else None
+
+    start = time.perf_counter()
+    try:
+        candidates = map_rows(read_rows(source, input_format), column_map)
+        if args.summary:
+            summary = pool.summarize(candidates) if pool is not None else summarize_cohort(candidates, args.chunk_size)
+            sink.write(dumps(summary.as_dict(), indent=True))
+            sink.write("\n")
+            rows, errors = summary.count + summary.errors, summary.errors
+        else:
+            rows, errors = write_results(evaluate_rows(candidates, pool, args.chunk_size), sink)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = time.perf_counter() - start
+
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"Evaluated {rows} rows ({errors} errors) in {elapsed:.2f}s - {rate:,.0f} rows/sec", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
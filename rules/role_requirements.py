@@ -1,29 +1,6 @@
-ROLE_REQUIREMENTS = {
-    "Data Analyst": {
-        "Excel": 70,
-        "SQL": 70,
-        "Statistics & Probability": 65,
-        "Tableau & Power BI": 65
-    },
-    "Business Analyst": {
-        "Excel": 75,
-        "SQL": 60,
-        "Tableau & Power BI": 70
-    },
-    "Data Scientist": {
-        "Python": 75,
-        "Statistics & Probability": 75,
-        "Machine Learning": 70,
-        "SQL": 60
-    },
-    "Junior ML Engineer": {
-        "Python": 80,
-        "Machine Learning": 75,
-        "Statistics & Probability": 70
-    },
-    "BI Analyst": {
-        "Excel": 75,
-        "SQL": 65,
-        "Tableau & Power BI": 75
-    }
-}
+# rules/role_requirements.py
+
+# Loaded from rules/rules.json; see rules/scoring_rules.py
+from rules.rule_store import rule_store
+
+ROLE_REQUIREMENTS = rule_store.current.role_requirements
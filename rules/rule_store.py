@@ -0,0 +1,191 @@
+# rules/rule_store.py
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules.json")
+
+READINESS_THRESHOLD_KEYS = ("READY", "ALMOST_READY")
+
+
+class RuleSet(NamedTuple):
+    """
+    One immutable snapshot of the evaluation rules.
+
+    version: "<revision>-<content hash>"; changes whenever any value changes
+    revision: the rule file's own revision number
+    """
+    version: str
+    revision: int
+    skill_weights: Mapping[str, float]
+    readiness_thresholds: Mapping[str, float]
+    min_skill_score: float
+    role_requirements: Mapping[str, Mapping[str, float]]
+
+
+def _number(value, what):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{what} must be a number, got {value!r}")
+    return value
+
+
+def compile_rules(raw):
+    """
+    Validate a rules document ({"revision", "skill_weights",
+    "readiness_thresholds", "min_skill_score", "role_requirements"}) and
+    freeze it into a RuleSet. Raises ValueError on malformed input.
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("Rules document must be a JSON object")
+
+    try:
+        revision = raw["revision"]
+        skill_weights = {
+            skill: _number(weight, f"Weight of {skill}") for skill, weight in raw["skill_weights"].items()
+        }
+        thresholds = {
+            key: _number(raw["readiness_thresholds"][key], f"Readiness threshold {key}")
+            for key in READINESS_THRESHOLD_KEYS
+        }
+        min_skill_score = _number(raw["min_skill_score"], "min_skill_score")
+        role_requirements = {
+            role: MappingProxyType({
+                skill: _number(minimum, f"{role} minimum for {skill}") for skill, minimum in minimums.items()
+            })
+            for role, minimums in raw["role_requirements"].items()
+        }
+    except (KeyError, AttributeError, TypeError) as e:
+        raise ValueError(f"Malformed rules document: {e!r}") from None
+
+    if thresholds["ALMOST_READY"] > thresholds["READY"]:
+        raise ValueError("ALMOST_READY threshold must not exceed READY")
+
+    content = json.dumps(
+        [skill_weights, thresholds, min_skill_score, {role: dict(m) for role, m in role_requirements.items()}],
+        sort_keys=True
+    )
+    digest = hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
+
+    return RuleSet(
+        version=f"{revision}-{digest}",
+        revision=revision,
+        skill_weights=MappingProxyType(skill_weights),
+        readiness_thresholds=MappingProxyType(thresholds),
+        min_skill_score=min_skill_score,
+        role_requirements=MappingProxyType(role_requirements)
+    )
+
+
+def load_rules(path):
+    with open(path, encoding="utf-8") as f:
+        return compile_rules(json.load(f))
+
+
+class RuleStore:
+    """
+    Holds the active RuleSet and hot-reloads it when the rules file changes.
+
+    Reading `current` costs an attribute lookup; at most once per
+    `check_interval` seconds it also stats the file. A changed file is
+    parsed and validated off to the side and then published with a single
+    reference assignment, so in-flight requests keep the snapshot they
+    already hold and nobody waits on the reload. A file that fails to
+    load is logged and the previous rules stay active.
+    """
+
+    def __init__(self, path, check_interval=2.0, clock=time.monotonic):
+        self.path = path
+        self.check_interval = check_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._signature = self._stat()
+        self._current = load_rules(path)
+        self._next_check = clock() + (check_interval or 0)
+        self.reloads = 0
+        self.reload_errors = 0
+
+    @property
+    def current(self):
+        if self.check_interval is not None and self._clock() >= self._next_check:
+            return self.refresh()
+        return self._current
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def refresh(self, force=False):
+        """
+        Reload the rules if the file changed (or `force`); returns the
+        active RuleSet. Never blocks: if another thread is already
+        reloading, the snapshot in use is returned.
+        """
+        if not self._lock.acquire(blocking=False):
+            return self._current
+
+        try:
+            self._next_check = self._clock() + (self.check_interval or 0)
+            try:
+                signature = self._stat()
+                if signature == self._signature and not force:
+                    return self._current
+                self._signature = signature
+                rules = load_rules(self.path)
+            except (OSError, ValueError) as e:
+                self.reload_errors += 1
+                logger.warning("Keeping rules %s, reload of %s failed: %s", self._current.version, self.path, e)
+                return self._current
+
+            if rules.version == self._current.version:
+                return self._current
+
+            self._current = rules
+            self.reloads += 1
+            logger.info("Loaded rules %s from %s", rules.version, self.path)
+            return rules
+        finally:
+            self._lock.release()
+
+
+# Rule-set snapshots compiled() keeps values for: the active one, plus a
+# few that callers pinned (e.g. an EvaluationService)
+COMPILED_SNAPSHOTS = 4
+
+
+def compiled(build):
+    """
+    Memoize build(rules) for the latest few rule-set snapshots.
+
+    The returned function takes an optional RuleSet (default: the active
+    one) and rebuilds only when handed a snapshot it has not built for
+    recently. Concurrent first calls may each build; the results are
+    equivalent and the last one is kept.
+    """
+    built = ()  # ((rules, value), ...), most recently built first
+
+    def get(rules=None):
+        nonlocal built
+        if rules is None:
+            rules = rule_store.current
+        for built_for, value in built:
+            if built_for is rules:
+                return value
+        value = build(rules)
+        built = ((rules, value),) + built[:COMPILED_SNAPSHOTS - 1]
+        return value
+
+    return get
+
+
+rule_store = RuleStore(
+    os.environ.get("RULES_FILE", DEFAULT_RULES_FILE),
+    check_interval=float(os.environ.get("RULES_CHECK_INTERVAL", 2.0))
+)
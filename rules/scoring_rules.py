@@ -1,20 +1,17 @@
 # rules/scoring_rules.py
 
+# The rule values live in rules/rules.json and are served by the rule store
+# (rules/rule_store.py), which hot-reloads them. These names hold the values
+# loaded at import time, for scripts; the service reads rule_store.current.
+from rules.rule_store import rule_store
+
+_rules = rule_store.current
+
 # Weightage of each skill in overall readiness
-SKILL_WEIGHTS = {
-    "Excel": 0.15,
-    "SQL": 0.20,
-    "Python": 0.20,
-    "Statistics & Probability": 0.20,
-    "Machine Learning": 0.15,
-    "Tableau & Power BI": 0.10
-}
+SKILL_WEIGHTS = _rules.skill_weights
 
 # Readiness thresholds
-READINESS_THRESHOLDS = {
-    "READY": 75,
-    "ALMOST_READY": 60
-}
+READINESS_THRESHOLDS = _rules.readiness_thresholds
 
 # Minimum acceptable score per skill
-MIN_SKILL_SCORE = 50
+MIN_SKILL_SCORE = _rules.min_skill_score
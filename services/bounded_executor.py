@@ -0,0 +1,40 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ExecutorBusy(Exception):
+    """Raised when a BoundedExecutor already holds its maximum pending work."""
+
+
+class BoundedExecutor:
+    """
+    Thread pool for offloading CPU-bound evaluation from an asyncio event
+    loop, with a cap on the work it accepts (running + queued).
+
+    run() raises ExecutorBusy immediately once `max_pending` calls are in
+    flight, so callers can shed load (e.g. answer 503) instead of letting
+    the queue and the tail latency grow without bound. The pending counter
+    is only touched from the event loop thread and needs no lock.
+    """
+
+    def __init__(self, workers=None, max_pending=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 8
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="eval")
+
+    async def run(self, fn, *args):
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise ExecutorBusy(f"{self.pending} evaluations already pending")
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
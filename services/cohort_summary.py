@@ -0,0 +1,266 @@
+"""
+One-pass cohort aggregates: readiness distribution, per-skill statistics,
+role eligibility counts and the most common feedback gaps.
+
+Every aggregate is a mergeable accumulator (counts, Welford moments,
+fixed-bin histograms), so a cohort can be summarized in chunks, on any
+number of workers, and the partial summaries combined with merge() give
+the same result as a single pass.
+"""
+from collections import Counter
+
+import numpy as np
+
+from agents import scoring_engine
+from agents.feedback_agent import NO_GAPS_LABEL, assess_feedback
+from agents.models import CandidateScores, SKILL_NAMES
+from services.parallel import DEFAULT_CHUNK_SIZE, chunked
+
+# Histogram bins: one per point on the 0-100 scale (out-of-range values
+# land in the end bins; min/max stay exact)
+HISTOGRAM_BINS = 101
+
+QUANTILES = (("p25", 0.25), ("p50", 0.5), ("p75", 0.75), ("p90", 0.9))
+
+DEFAULT_TOP_GAPS = 10
+
+
+class Moments:
+    """Count, mean, variance (Welford / Chan et al. pairwise merge), min and max."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def add_array(self, values):
+        """Fold in a 1-D array of values."""
+        if not len(values):
+            return
+        chunk = Moments()
+        chunk.count = len(values)
+        chunk.mean = float(values.mean())
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other):
+        if not other.count:
+            return
+        if not self.count:
+            self.count, self.mean, self.m2, self.min, self.max = (
+                other.count, other.mean, other.m2, other.min, other.max
+            )
+            return
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def std(self):
+        """Population standard deviation."""
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+class Histogram:
+    """
+    Counts per whole point on the 0-100 scale. Quantiles are exact for
+    integer values in range and within one point otherwise.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts = np.zeros(HISTOGRAM_BINS, dtype=np.int64)
+
+    def add_array(self, values):
+        bins = np.clip(np.floor(values), 0, HISTOGRAM_BINS - 1).astype(np.intp)
+        self.counts += np.bincount(bins, minlength=HISTOGRAM_BINS)
+
+    def merge(self, other):
+        self.counts += other.counts
+
+    def quantile(self, q):
+        """Nearest-rank q-quantile (the bin holding the ceil(q * n)-th value)."""
+        total = int(self.counts.sum())
+        if not total:
+            return None
+        rank = max(1, int(np.ceil(q * total)))
+        return int(np.searchsorted(np.cumsum(self.counts), rank))
+
+
+def _plain(value):
+    """Whole-number floats as ints, for readable JSON."""
+    return int(value) if float(value).is_integer() else value
+
+
+class Distribution:
+    """Moments plus a histogram for one 0-100 measure."""
+
+    __slots__ = ("moments", "histogram")
+
+    def __init__(self):
+        self.moments = Moments()
+        self.histogram = Histogram()
+
+    def add_array(self, values):
+        self.moments.add_array(values)
+        self.histogram.add_array(values)
+
+    def merge(self, other):
+        self.moments.merge(other.moments)
+        self.histogram.merge(other.histogram)
+
+    def as_dict(self):
+        moments = self.moments
+        if not moments.count:
+            return {"mean": None, "std": None, "min": None, "max": None, **{name: None for name, _ in QUANTILES}}
+
+        summary = {
+            "mean": round(moments.mean, 2),
+            "std": round(moments.std, 2),
+            "min": _plain(moments.min),
+            "max": _plain(moments.max)
+        }
+        for name, q in QUANTILES:
+            # A bin's lower edge can lie below the exact minimum of a
+            # non-integer measure; keep quantiles inside [min, max]
+            summary[name] = _plain(min(max(self.histogram.quantile(q), moments.min), moments.max))
+        return summary
+
+
+class CohortSummary:
+    """
+    Mergeable aggregates over evaluated candidates, for one rule set.
+
+    add() folds in a chunk of (CandidateScores, feedback text) pairs using
+    the vectorized scoring engine; merge() combines partial summaries
+    (also ones computed in other processes, it only holds plain data).
+    """
+
+    def __init__(self, tables=None):
+        if tables is None:
+            tables = scoring_engine.get_tables()
+        self.rule_version = tables.version
+        self.roles = tables.roles
+        self.count = 0
+        self.errors = 0
+        self.status_counts = np.zeros(len(scoring_engine.STATUS_LABELS), dtype=np.int64)
+        self.readiness = Distribution()
+        self.skills = [Distribution() for _ in SKILL_NAMES]
+        self.eligible_counts = np.zeros(len(tables.roles), dtype=np.int64)
+        self.gap_counts = Counter()
+
+    def add(self, entries, tables):
+        """Fold in a list of (CandidateScores, feedback text) pairs, scored with `tables`."""
+        if tables.version != self.rule_version:
+            raise ValueError(f"Summary of rules {self.rule_version} cannot take results of {tables.version}")
+        if not entries:
+            return
+        candidates = [candidate for candidate, _ in entries]
+
+        result = scoring_engine.evaluate_matrix(scoring_engine.candidate_matrix(candidates, tables), tables)
+        # Rounded like the final_score of /api/evaluate
+        self.readiness.add_array(np.round(result["weighted"], 2))
+        self.status_counts += np.bincount(result["status"], minlength=len(scoring_engine.STATUS_LABELS))
+        self.eligible_counts += result["eligible"].sum(axis=0)
+
+        scores = np.array(candidates, dtype=float)
+        for j, distribution in enumerate(self.skills):
+            distribution.add_array(scores[:, j])
+
+        for _, feedback_text in entries:
+            self.gap_counts.update(gap for gap in assess_feedback(feedback_text).gaps if gap != NO_GAPS_LABEL)
+
+        self.count += len(entries)
+
+    def merge(self, other):
+        """Combine another partial summary (computed with the same rules) into this one."""
+        if other.rule_version != self.rule_version:
+            raise ValueError(f"Cannot merge summaries of rules {other.rule_version} and {self.rule_version}")
+        self.count += other.count
+        self.errors += other.errors
+        self.status_counts += other.status_counts
+        self.readiness.merge(other.readiness)
+        for distribution, other_distribution in zip(self.skills, other.skills):
+            distribution.merge(other_distribution)
+        self.eligible_counts += other.eligible_counts
+        self.gap_counts.update(other.gap_counts)
+        return self
+
+    def as_dict(self, top_gaps=DEFAULT_TOP_GAPS):
+        count = self.count
+        # Ties broken by name so merged summaries report the same order
+        gaps = sorted(self.gap_counts.items(), key=lambda item: (-item[1], item[0]))[:top_gaps]
+        return {
+            "count": count,
+            "errors": self.errors,
+            "readiness": {
+                "statusCounts": {
+                    label: int(n) for label, n in zip(scoring_engine.STATUS_LABELS, self.status_counts)
+                },
+                "score": self.readiness.as_dict()
+            },
+            "skills": {skill: distribution.as_dict() for skill, distribution in zip(SKILL_NAMES, self.skills)},
+            "roles": {
+                role: {"eligible": int(n), "share": round(int(n) / count, 4) if count else 0.0}
+                for role, n in zip(self.roles, self.eligible_counts)
+            },
+            "feedbackGaps": [{"gap": gap, "count": n} for gap, n in gaps],
+            "ruleVersion": self.rule_version
+        }
+
+
+def parse_entry(data):
+    """
+    (CandidateScores, feedback text) for one /api/evaluate payload, or None
+    when the entry is not a valid candidate.
+    """
+    if not isinstance(data, dict) or not data:
+        return None
+    feedback_text = data.get("feedback", "")
+    if not isinstance(feedback_text, str):
+        return None
+    try:
+        return CandidateScores.from_request(data), feedback_text
+    except (ValueError, TypeError):
+        return None
+
+
+def summarize_chunk(chunk, tables=None):
+    """CohortSummary of one list of /api/evaluate payloads (invalid ones counted as errors)."""
+    if tables is None:
+        tables = scoring_engine.get_tables()
+    summary = CohortSummary(tables)
+    entries = []
+    for data in chunk:
+        entry = parse_entry(data)
+        if entry is None:
+            summary.errors += 1
+        else:
+            entries.append(entry)
+    summary.add(entries, tables)
+    return summary
+
+
+def summarize_cohort(candidates, chunk_size=DEFAULT_CHUNK_SIZE, tables=None):
+    """
+    Summarize any iterable of /api/evaluate payloads in one streaming pass;
+    memory use is bounded by `chunk_size`, not the cohort size.
+    """
+    if tables is None:
+        tables = scoring_engine.get_tables()
+    summary = CohortSummary(tables)
+    for chunk in chunked(candidates, chunk_size):
+        summary.merge(summarize_chunk(chunk, tables))
+    return summary
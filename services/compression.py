@@ -0,0 +1,78 @@
+"""
+Negotiated response compression: gzip, plus brotli when the optional
+`brotli` package is installed.
+"""
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional dependency, gzip only without it
+    brotli = None
+
+# Fast settings: responses are compressed per request, so CPU per byte
+# matters more than the last few percent of size
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+# Server preference when the client accepts several equally
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# Mimetypes worth compressing
+COMPRESSIBLE_MIMETYPES = ("application/json", "application/x-ndjson", "application/ndjson")
+
+
+def choose_encoding(accept_encoding):
+    """
+    The best of ENCODINGS for an Accept-Encoding header value, or None.
+    Honours q-values ("gzip;q=0" refuses gzip) and "*".
+    """
+    preferences = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        preferences[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = preferences.get(encoding, preferences.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _gzip_compressor():
+    # wbits 31: gzip container
+    return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+def compress(body, encoding):
+    """Compress a whole response body."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    compressor = _gzip_compressor()
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_stream(chunks, encoding):
+    """Compress a streamed response body chunk by chunk, keeping it streamed."""
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        process, finish = compressor.process, compressor.finish
+    else:
+        compressor = _gzip_compressor()
+        process, finish = compressor.compress, compressor.flush
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = process(chunk)
+        if data:
+            yield data
+    yield finish()
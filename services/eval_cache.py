@@ -0,0 +1,127 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from rules.rule_store import rule_store
+
+
+def make_cache_key(candidate, feedback_text, rules_version):
+    """
+    Canonical hash of the normalized scores (a CandidateScores record, in
+    its fixed field order), the feedback text and the rule-set version.
+    """
+    canonical = "\x1f".join([
+        rules_version,
+        ",".join(map(str, candidate)),
+        feedback_text
+    ])
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+class EvaluationCache:
+    """
+    Bounded LRU cache (with optional TTL) for evaluation results: full
+    responses, or the stage values kept for incremental re-evaluation.
+
+    Entries are keyed on make_cache_key(); the whole cache is dropped as
+    soon as the rule values change. Cached responses are shared between
+    requests and must not be mutated by callers.
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._rules_version = rule_store.current.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self):
+        return self.maxsize > 0
+
+    def _check_rules(self):
+        version = rule_store.current.version
+        if version != self._rules_version:
+            self._entries.clear()
+            self._rules_version = version
+            self.invalidations += 1
+        return version
+
+    def get_or_compute(self, candidate, feedback_text, compute):
+        """Return the cached response for this candidate, computing it on a miss."""
+        if not self.enabled:
+            return compute(candidate, feedback_text)
+
+        with self._lock:
+            key = make_cache_key(candidate, feedback_text, self._check_rules())
+            value = self._lookup(key)
+        if value is not None:
+            return value
+
+        value = compute(candidate, feedback_text)
+        self._store(key, value)
+        return value
+
+    def get(self, candidate, feedback_text):
+        """Return the cached value for this candidate, or None."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            return self._lookup(make_cache_key(candidate, feedback_text, self._check_rules()))
+
+    def put(self, candidate, feedback_text, value):
+        if not self.enabled:
+            return
+
+        with self._lock:
+            key = make_cache_key(candidate, feedback_text, self._check_rules())
+        self._store(key, value)
+
+    def _lookup(self, key):
+        # Caller holds the lock
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if expires_at is None or expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+            self.expirations += 1
+        self.misses += 1
+        return None
+
+    def _store(self, key, value):
+        with self._lock:
+            expires_at = self._clock() + self.ttl if self.ttl else None
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "rules_version": self._rules_version
+            }
@@ -0,0 +1,86 @@
+"""
+Thread-safe evaluation of candidates for embedding the pipeline in other
+programs (scripts, notebooks, other servers).
+
+Everything an evaluation reads is immutable once built and shared by all
+threads without locks:
+- the rule snapshot: a RuleSet of mappingproxies (rules/rule_store.py)
+- the scoring engine tables and the role index built from it: tuples,
+  mappingproxies and read-only NumPy arrays
+- SKILL_MAP and the feedback matcher compiled from it: mappingproxies and
+  tuples
+
+Hot reloads never modify a snapshot; they publish a new one. The metrics
+registry, the only shared mutable state on this path, takes its own lock.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from agents import role_index, scoring_engine
+from agents.feedback_agent import get_skill_matcher
+from services.parallel import DEFAULT_CHUNK_SIZE, chunked
+from services.pipeline import evaluate_many
+
+
+class EvaluationService:
+    """
+    Evaluates (CandidateScores, feedback text) pairs into /api/evaluate
+    responses; one instance can be shared by any number of threads.
+
+    With `rules` (a RuleSet), every evaluation uses that snapshot.
+    Otherwise each call takes the active snapshot once, so a hot reload
+    applies between calls but never within one. The tables are built when
+    the service is created, not by the first callers.
+
+    evaluate() runs in the calling thread. evaluate_many() splits its input
+    into chunks of `chunk_size` and evaluates them on a pool of `workers`
+    threads, each chunk with one scoring engine call. Threads share the
+    interpreter lock, so use services.parallel.EvaluationPool (processes)
+    to use more CPU cores for large cohorts.
+    """
+
+    def __init__(self, rules=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.tables = scoring_engine.get_tables(rules) if rules is not None else None
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="evaluation-service")
+
+        tables = self.current_tables()
+        role_index.get_role_index(tables.rules)
+        get_skill_matcher()
+
+    def current_tables(self):
+        """The ScoringTables the next evaluation will use."""
+        return self.tables if self.tables is not None else scoring_engine.get_tables()
+
+    def _evaluate_chunk(self, entries, tables):
+        return [values["transform"] for values in evaluate_many(entries, tables)]
+
+    def evaluate(self, candidate, feedback_text=""):
+        """The /api/evaluate response for one candidate."""
+        return self._evaluate_chunk([(candidate, feedback_text)], self.current_tables())[0]
+
+    def evaluate_many(self, entries):
+        """
+        Responses for (candidate, feedback_text) pairs, in input order. All
+        of them are evaluated with the same rule snapshot.
+        """
+        entries = list(entries)
+        tables = self.current_tables()
+        if self.workers == 1 or len(entries) <= self.chunk_size:
+            return self._evaluate_chunk(entries, tables)
+
+        futures = [
+            self._executor.submit(self._evaluate_chunk, chunk, tables)
+            for chunk in chunked(entries, self.chunk_size)
+        ]
+        return [response for future in futures for response in future.result()]
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
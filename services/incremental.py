@@ -0,0 +1,70 @@
+from contextlib import nullcontext
+from operator import itemgetter
+
+
+class EvaluationGraph:
+    """
+    Dependency graph over the evaluation stages, for re-evaluating a
+    candidate after a small change without re-running every stage.
+
+    `nodes` is a sequence of (name, inputs, compute) in dependency order;
+    `inputs` names graph inputs or earlier nodes, and compute() receives
+    their values positionally. Given the values of a previous run, a node
+    is recomputed only if one of its inputs changed. A recomputed node
+    whose value comes out equal to the previous one does not invalidate
+    its dependents (early cutoff), so e.g. a readiness result with the
+    same status and reasons leaves the action plan untouched.
+    """
+
+    def __init__(self, nodes, timer=None):
+        self.nodes = tuple(nodes)
+        self.timer = timer
+        # Only values that something depends on are worth comparing
+        self._has_dependents = frozenset(dep for _, inputs, _ in self.nodes for dep in inputs)
+        # Per node, a getter for its input values (a tuple, or the value itself
+        # for a single input): cheaper than looking them up one by one
+        self._getters = tuple(itemgetter(*inputs) for _, inputs, _ in self.nodes)
+
+    def required(self, targets):
+        """Names of the nodes (and inputs) needed to compute `targets`."""
+        needed = set(targets)
+        for name, inputs, _ in reversed(self.nodes):
+            if name in needed:
+                needed.update(inputs)
+        return needed
+
+    def evaluate(self, inputs, previous=None, targets=None):
+        """
+        Evaluate the graph for `inputs` ({input name: value}).
+
+        previous: the values dict returned by an earlier evaluate() call,
+        or None to compute everything.
+        targets: node names to compute (with what they depend on); the
+        other nodes are skipped and absent from the values. Default: all.
+        Returns (values, recomputed): every input and node value, and the
+        names of the nodes that were actually recomputed.
+        """
+        needed = self.required(targets) if targets is not None else None
+        values = dict(inputs)
+        if previous is None:
+            changed = None
+        else:
+            changed = {name for name, value in inputs.items() if previous.get(name) != value}
+
+        recomputed = []
+        for (name, node_inputs, compute), get_inputs in zip(self.nodes, self._getters):
+            if needed is not None and name not in needed:
+                continue
+            if changed is not None and name in previous and changed.isdisjoint(node_inputs):
+                values[name] = previous[name]
+                continue
+
+            with self.timer(name) if self.timer else nullcontext():
+                value = compute(*get_inputs(values)) if len(node_inputs) > 1 else compute(get_inputs(values))
+            values[name] = value
+            recomputed.append(name)
+
+            if changed is not None and name in self._has_dependents and previous.get(name) != value:
+                changed.add(name)
+
+        return values, recomputed
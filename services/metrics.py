@@ -0,0 +1,209 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Latency histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+# Bucket upper bounds for size histograms (e.g. requests per batch)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram (Prometheus semantics)."""
+
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimate a quantile by linear interpolation inside the bucket that
+        contains it, like PromQL's histogram_quantile().
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+
+class _StageTimer:
+    __slots__ = ("registry", "stage", "labels", "start")
+
+    def __init__(self, registry, stage, labels):
+        self.registry = registry
+        self.stage = stage
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        seconds = perf_counter() - self.start
+        self.registry.observe("stage_duration_seconds", self.labels, seconds)
+
+        timings = getattr(self.registry._local, "timings", None)
+        if timings is not None:
+            timings.append((self.stage, seconds))
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class MetricsRegistry:
+    """
+    Latency histograms and counters for the API.
+
+    When disabled, timer() returns a shared no-op context manager and
+    nothing is recorded, so instrumented hot paths cost one attribute check.
+    Stage timings of the current request are also kept per thread so they
+    can be reported in a Server-Timing header.
+    """
+
+    def __init__(self, enabled=True, prefix="placement"):
+        self.enabled = enabled
+        self.prefix = prefix
+        self._histograms = {}
+        self._counters = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def timer(self, stage, **labels):
+        """Context manager timing one pipeline stage."""
+        if not self.enabled:
+            return NULL_TIMER
+        labels["stage"] = stage
+        return _StageTimer(self, stage, tuple(sorted(labels.items())))
+
+    def observe(self, name, labels, seconds, bounds=LATENCY_BUCKETS):
+        """
+        Record one latency sample; `labels` is a sorted tuple of pairs.
+        `bounds` applies when the histogram is created (e.g. SIZE_BUCKETS).
+        """
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(bounds)
+            histogram.observe(seconds)
+
+    def increment(self, name, amount=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def add_collector(self, collect):
+        """
+        Register a callable returning [(name, type, value), ...] for metrics
+        owned elsewhere (e.g. cache counters); rendered with the rest.
+        """
+        self._collectors.append(collect)
+
+    def begin_request(self):
+        """Start collecting stage timings for the current thread's request."""
+        self._local.timings = []
+
+    def end_request(self):
+        """Stop collecting and return [(stage, seconds), ...] for this request."""
+        timings = getattr(self._local, "timings", None) or []
+        self._local.timings = None
+        return timings
+
+    def render_prometheus(self):
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+
+            for name in sorted({name for (name, _), _ in histograms}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (h_name, labels), histogram in histograms:
+                    if h_name != name:
+                        continue
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.bounds + ("+Inf",), histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{metric}_bucket{_labels(labels, le=bound)} {cumulative}")
+                    lines.append(f"{metric}_sum{_labels(labels)} {histogram.sum:.9f}")
+                    lines.append(f"{metric}_count{_labels(labels)} {histogram.count}")
+
+                lines.append(f"# TYPE {metric}_quantile gauge")
+                for (h_name, labels), histogram in histograms:
+                    if h_name != name:
+                        continue
+                    for q in QUANTILES:
+                        lines.append(f"{metric}_quantile{_labels(labels, quantile=q)} {histogram.quantile(q):.9f}")
+
+            for name in sorted({name for (name, _), _ in counters}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for (c_name, labels), value in counters:
+                    if c_name == name:
+                        lines.append(f"{metric}{_labels(labels)} {value}")
+
+        for collect in self._collectors:
+            for name, metric_type, value in collect():
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} {metric_type}")
+                lines.append(f"{metric} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels, **extra):
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def server_timing_header(timings, total=None):
+    """Format [(stage, seconds), ...] as a Server-Timing header value (ms)."""
+    entries = [f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings]
+    if total is not None:
+        entries.append(f"total;dur={total * 1000:.3f}")
+    return ", ".join(entries)
@@ -0,0 +1,103 @@
+import threading
+from concurrent.futures import Future
+from time import perf_counter
+
+from services.metrics import SIZE_BUCKETS
+
+
+class MicroBatcher:
+    """
+    Collects concurrent single-item calls into batches for a batched
+    implementation, and collapses identical in-flight calls into one.
+
+    submit() blocks the calling (request) thread until its result is ready.
+    A dispatcher thread takes the queued items once the oldest has waited
+    `window` seconds or `max_batch` items are queued, whichever comes
+    first, and runs process(items) -> results (same order) on them. If that
+    raises, the items are processed one by one, so only the callers whose
+    own item fails get the exception. An item
+    equal to one already queued or being processed waits for that result
+    instead of being queued again (single-flight), so items must be
+    hashable and equal items must give equal results.
+
+    With a metrics registry, every batch records its size
+    (micro_batch_size) and every item the time it waited before its batch
+    started (micro_batch_queue_delay_seconds), the two numbers to trade
+    off when tuning `window` against tail latency.
+    """
+
+    def __init__(self, process, window=0.002, max_batch=32, metrics=None):
+        self.process = process
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = metrics if metrics is not None and metrics.enabled else None
+        self._ready = threading.Condition(threading.Lock())
+        self._queue = []       # (item, future, enqueued at)
+        self._in_flight = {}   # item -> future, queued or being processed
+        self.batches = 0
+        self.items = 0
+        self.coalesced = 0
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="micro-batcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, item):
+        """Return process([item])[0], computed in a batch with other callers' items."""
+        with self._ready:
+            future = self._in_flight.get(item)
+            if future is not None:
+                self.coalesced += 1
+            else:
+                future = self._in_flight[item] = Future()
+                self._queue.append((item, future, perf_counter()))
+                self._ready.notify()
+        return future.result()
+
+    def _next_batch(self):
+        with self._ready:
+            while not self._queue:
+                self._ready.wait()
+            deadline = self._queue[0][2] + self.window
+            while len(self._queue) < self.max_batch:
+                remaining = deadline - perf_counter()
+                if remaining <= 0:
+                    break
+                self._ready.wait(remaining)
+
+            batch = self._queue[:self.max_batch]
+            del self._queue[:self.max_batch]
+            return batch
+
+    def _process_one(self, item, future):
+        """(settle, outcome) for `future`, processing its item on its own."""
+        try:
+            return future.set_result, self.process([item])[0]
+        except Exception as e:
+            return future.set_exception, e
+
+    def _dispatch_loop(self):
+        while True:
+            batch = self._next_batch()
+            started = perf_counter()
+            self.batches += 1
+            self.items += len(batch)
+            if self.metrics is not None:
+                self.metrics.observe("micro_batch_size", (), len(batch), bounds=SIZE_BUCKETS)
+                for _, _, enqueued in batch:
+                    self.metrics.observe("micro_batch_queue_delay_seconds", (), started - enqueued)
+
+            try:
+                results = self.process([item for item, _, _ in batch])
+            except Exception as e:
+                if len(batch) == 1:
+                    outcomes = [(batch[0][1].set_exception, e)]
+                else:
+                    outcomes = [self._process_one(item, future) for item, future, _ in batch]
+            else:
+                outcomes = [(future.set_result, result) for (_, future, _), result in zip(batch, results)]
+
+            # Later identical calls start a fresh computation
+            with self._ready:
+                for item, _, _ in batch:
+                    del self._in_flight[item]
+            for settle, outcome in outcomes:
+                settle(outcome)
@@ -0,0 +1,130 @@
+import os
+import threading
+from collections import deque
+from itertools import islice
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Chunks queued per worker; bounds memory when the input is a stream
+INFLIGHT_CHUNKS_PER_WORKER = 2
+
+_evaluate_batch = None
+
+
+def _init_worker():
+    """
+    Worker initializer: import the pipeline once per process, which loads
+    the rules and builds the scoring engine and feedback matcher tables.
+    Only services.pipeline is imported, not the web app: a worker never
+    starts the app's result store or micro-batcher.
+    """
+    global _evaluate_batch
+
+    from services.pipeline import evaluate_batch
+    _evaluate_batch = evaluate_batch
+
+
+def _evaluate_chunk(chunk, fields=None):
+    return _evaluate_batch(chunk, fields)
+
+
+def _summarize_chunk(chunk):
+    from services.cohort_summary import summarize_chunk
+    return summarize_chunk(chunk)
+
+
+def chunked(iterable, size):
+    """Yield lists of up to `size` items from any iterable."""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class EvaluationPool:
+    """
+    Process pool for cohort evaluation.
+
+    Workers load the evaluation pipeline once (see _init_worker) and
+    evaluate candidates in chunks. `spawn` is the default start method:
+    it is safe from multi-threaded servers, where forking can deadlock.
+    """
+
+    def __init__(self, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, mp_context=None):
+        # Imported here: they are slow to import and most processes that
+        # import this module (e.g. the API on a cold start) never build a pool
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context or multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+
+    def evaluate(self, candidates, fields=None):
+        """
+        Yield results in input order (same per-item format as
+        evaluate_batch, projected to `fields` if given). Chunks are dispatched with a bounded number
+        in flight, so `candidates` may be an arbitrarily long stream.
+        """
+        max_inflight = self.workers * INFLIGHT_CHUNKS_PER_WORKER
+        pending = deque()
+
+        for chunk in chunked(candidates, self.chunk_size):
+            pending.append(self._executor.submit(_evaluate_chunk, chunk, fields))
+            if len(pending) >= max_inflight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+    def summarize(self, candidates):
+        """
+        CohortSummary of `candidates`: each worker summarizes whole chunks
+        and the partial summaries are merged here as they complete.
+        """
+        from services.cohort_summary import CohortSummary
+
+        max_inflight = self.workers * INFLIGHT_CHUNKS_PER_WORKER
+        pending = deque()
+        summary = None
+
+        for chunk in chunked(candidates, self.chunk_size):
+            pending.append(self._executor.submit(_summarize_chunk, chunk))
+            if len(pending) >= max_inflight:
+                part = pending.popleft().result()
+                summary = part if summary is None else summary.merge(part)
+
+        while pending:
+            part = pending.popleft().result()
+            summary = part if summary is None else summary.merge(part)
+
+        return summary if summary is not None else CohortSummary()
+
+    def shutdown(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_shared_pool(workers, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Lazily created process-wide pool (used by the batch API)."""
+    global _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = EvaluationPool(workers, chunk_size)
+        return _shared_pool
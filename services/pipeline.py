@@ -0,0 +1,440 @@
+"""
+The evaluation pipeline behind /api/evaluate, without the web server: the
+agent workflow as an evaluation graph, the UI response built from it, and
+the batch entry points.
+
+app.py, asgi.py, the process pool workers (services/parallel.py),
+EvaluationService and the offline tools all evaluate through this module.
+Importing it loads no web framework and starts nothing: no result store,
+micro-batcher or process pool, which stay with the API processes.
+"""
+import os
+from operator import attrgetter
+from types import MappingProxyType
+
+from agents.models import CandidateScores
+from agents.readiness_agent import readiness_from_result
+from agents.role_agent import role_gap_details, roles_from_result
+from agents import role_index
+from agents.feedback_agent import assess_feedback
+from agents.action_agent import next_actions
+from agents.preparation_plan import DAY_ACTIVITIES, DEFAULT_PLAN, PlanDay, parse_plan_item
+from agents import scoring_engine
+from rules.rule_store import rule_store
+from services.incremental import EvaluationGraph
+from services.metrics import MetricsRegistry
+
+# Per-stage latency histograms, shared with the API's request counters
+# (METRICS_ENABLED=0 turns them off)
+metrics = MetricsRegistry(enabled=os.environ.get("METRICS_ENABLED", "1") != "0")
+
+
+def transform_response_for_ui(readiness, scores, weights, recommended, rejected, strengths, gaps, plan, actions,
+                              role_gaps=None, rules=None, fields=None):
+    """
+    Transform Flask API response to match UI's expected format.
+    This function maintains backward compatibility with existing frontend.
+    
+    role_gaps: optional {role: [(skill, required, actual, gap), ...]} from
+    recommend_roles_detailed(); derived from `rejected` when omitted.
+    rules: the RuleSet the evaluation used (default: the active rules);
+    reported as "ruleVersion" so cached results can be validated.
+    fields: optional projection from parse_fields(); only those sections
+    are built, and the arguments no requested section needs may be None.
+    """
+    if rules is None:
+        rules = rule_store.current
+    sections = RESPONSE_FIELDS if fields is None else fields
+    response = {}
+
+    # Transform readiness
+    if "readiness" in sections:
+        response["readiness"] = {
+            "status": readiness["status"],
+            "score": int(readiness["final_score"]),
+            "reasoning": readiness.get("reasons", []),
+            "improvements": readiness.get("suggestions", []),
+            "skillBreakdown": [
+                {
+                    "skill": skill,
+                    "score": score,
+                    "status": "Excellent" if score >= 80 else "Good" if score >= 70 else "Average" if score >= 50 else "Needs Improvement"
+                }
+                for skill, score in scores.items()
+            ]
+        }
+    
+    # Transform role suitability
+    if "roleSuitability" in sections:
+        match_index = role_index.get_role_index(rules)
+        response["roleSuitability"] = {
+            "recommended": [
+                {
+                    "role": role,
+                    "matchScore": match_index.match_score(role, scores),
+                    "strengths": [f"Strong {skill}" for skill in scores.keys() if scores[skill] >= 70]
+                }
+                for role in recommended
+            ],
+            "notRecommended": [
+                {
+                    "role": role,
+                    "gaps": gap_list
+                }
+                for role, gap_list in rejected.items()
+            ]
+        }
+    
+    # Transform feedback analysis
+    if "feedbackAnalysis" in sections:
+        response["feedbackAnalysis"] = {
+            "strengths": strengths if strengths else ["Basic understanding of core concepts"],
+            "areasToImprove": gaps if gaps else ["No major technical gaps identified"]
+        }
+    
+    # Transform preparation plan: structured PlanDay records map straight to
+    # precomputed activity tables; legacy "Day N: ..." strings are parsed
+    if "preparationPlan" in sections:
+        preparation_plan_ui = []
+        for position, plan_day in enumerate(plan, 1):
+            if not isinstance(plan_day, PlanDay):
+                plan_day = parse_plan_item(plan_day, position)
+            
+            preparation_plan_ui.append({
+                "day": plan_day.day,
+                "focus": plan_day.focus,
+                "activities": DAY_ACTIVITIES[plan_day.focus_key]
+            })
+        
+        # Ensure we always have exactly 7 days, sorted by day number
+        # If somehow we have fewer, this ensures all days are present
+        if len(preparation_plan_ui) < 7:
+            existing_days = {item["day"] for item in preparation_plan_ui}
+            
+            for default_day in DEFAULT_PLAN:
+                if default_day.day not in existing_days:
+                    preparation_plan_ui.append({
+                        "day": default_day.day,
+                        "focus": default_day.focus,
+                        "activities": DAY_ACTIVITIES[default_day.focus_key]
+                    })
+        
+        # Sort by day number to ensure correct order
+        preparation_plan_ui.sort(key=lambda x: x["day"])
+        response["preparationPlan"] = preparation_plan_ui
+    
+    # Detailed gap analysis for rejected roles (single pass over precomputed gaps)
+    if "gapAnalysis" in sections:
+        if role_gaps is None:
+            role_gaps = role_gap_details(scores, rejected, rules)
+
+        response["gapAnalysis"] = [
+            {
+                "role": role,
+                "gaps": [
+                    {
+                        "skill": skill,
+                        "candidateScore": actual,
+                        "requiredScore": required,
+                        "gap": gap
+                    }
+                    for skill, required, actual, gap in skill_gaps
+                ],
+                "totalGap": sum(gap for _, _, _, gap in skill_gaps)
+            }
+            for role, skill_gaps in role_gaps.items()
+            if skill_gaps
+        ]
+    
+    # Transform action summary
+    if "actionSummary" in sections:
+        priority = "High" if readiness["status"] == "Ready" else "Medium" if readiness["status"] == "Almost Ready" else "Low"
+        recommendation = (
+            "Candidate is ready for placement. Schedule final interviews with partner companies."
+            if readiness["status"] == "Ready"
+            else "Candidate shows promise. Recommend 2-week intensive training before placement."
+            if readiness["status"] == "Almost Ready"
+            else "Candidate needs foundational work. Enroll in 4-week bootcamp program."
+        )
+        
+        response["actionSummary"] = {
+            "priority": priority,
+            "recommendation": recommendation,
+            "actionItems": actions if actions else ["Complete the 7-day preparation plan"]
+        }
+    
+    if "candidateScores" in sections:
+        response["candidateScores"] = scores
+    if "ruleVersion" in sections:
+        response["ruleVersion"] = rules.version
+
+    return response if fields is None else project_response(response, fields)
+
+
+# Sections of an /api/evaluate response, with the sub-fields a `fields`
+# projection can select from each (the others are selected whole)
+RESPONSE_FIELDS = MappingProxyType({
+    "readiness": ("status", "score", "reasoning", "improvements", "skillBreakdown"),
+    "roleSuitability": ("recommended", "notRecommended"),
+    "feedbackAnalysis": ("strengths", "areasToImprove"),
+    "preparationPlan": (),
+    "actionSummary": ("priority", "recommendation", "actionItems"),
+    "gapAnalysis": (),
+    "candidateScores": (),
+    "ruleVersion": ()
+})
+
+# Evaluation graph stages each response section is built from
+SECTION_STAGES = MappingProxyType({
+    "readiness": ("readiness",),
+    "roleSuitability": ("roles",),
+    "feedbackAnalysis": ("feedback",),
+    "preparationPlan": ("feedback",),
+    "actionSummary": ("readiness", "actions"),
+    "gapAnalysis": ("roles",),
+    "candidateScores": (),
+    "ruleVersion": ()
+})
+
+
+def parse_fields(value):
+    """
+    Parse a `fields` query parameter, e.g. "readiness.status,readiness.score",
+    into {section: tuple of sub-fields, or None for the whole section}.
+    Returns None (no projection) when the parameter is absent or empty.
+    Raises ValueError on an unknown field.
+    """
+    fields = {}
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        section, _, sub_field = item.partition(".")
+        if section not in RESPONSE_FIELDS or (sub_field and sub_field not in RESPONSE_FIELDS[section]):
+            raise ValueError(f"Unknown field: {item}")
+        if not sub_field:
+            fields[section] = None
+        elif fields.get(section, ()) is not None:
+            fields[section] = (*fields.get(section, ()), sub_field)
+    return fields or None
+
+
+def project_response(response, fields):
+    """The sections and sub-fields selected by `fields` of a full /api/evaluate response."""
+    return {
+        section: response[section] if sub_fields is None else {key: response[section][key] for key in sub_fields}
+        for section, sub_fields in fields.items()
+    }
+
+
+def parse_candidate(data):
+    """
+    Extract the six skill scores (as a CandidateScores record) and the
+    feedback text from a request payload.
+    Raises ValueError when a score cannot be converted to an integer or
+    the feedback is not a string.
+    """
+    candidate = CandidateScores.from_request(data)
+
+    feedback_text = data.get("feedback", "")
+    if not isinstance(feedback_text, str):
+        raise ValueError("feedback must be a string")
+
+    return candidate, feedback_text
+
+
+def build_ui_response(candidate, readiness, match, analysis, actions, tables, fields=None):
+    """
+    Convert the agents' records into the UI response (dicts only from here on).
+    With a `fields` projection, the records no requested section needs may be None.
+    """
+    strengths, gaps, plan = analysis if analysis is not None else ((), (), ())
+    return transform_response_for_ui(
+        None if readiness is None else readiness.as_dict(), candidate.as_dict(), tables.rules.skill_weights,
+        None if match is None else list(match.recommended), None if match is None else match.rejected_dict(),
+        list(strengths), list(gaps), plan, None if actions is None else list(actions),
+        role_gaps=None if match is None else match.role_gaps_dict(), rules=tables.rules, fields=fields
+    )
+
+
+# The agent workflow as a dependency graph over the two request inputs
+# ("candidate" scores and "feedback_text") and the scoring "tables" of one
+# rule snapshot, so PATCH /api/evaluate can re-run only the stages a change
+# affects and every stage of an evaluation sees the same rules. The engine
+# scores the candidate once; readiness and role matching both read its result
+evaluation_graph = EvaluationGraph([
+    ("engine", ("candidate", "tables"), scoring_engine.evaluate_candidate),
+    ("readiness", ("candidate", "feedback_text", "engine", "tables"), readiness_from_result),
+    ("roles", ("candidate", "engine", "tables"), roles_from_result),
+    ("feedback", ("feedback_text",), assess_feedback),
+    # Actions only read the status and the recommended roles; projecting them
+    # lets an unchanged status/role list stop the invalidation early
+    ("status", ("readiness",), attrgetter("status")),
+    ("recommended", ("roles",), attrgetter("recommended")),
+    ("actions", ("status", "recommended"), next_actions),
+    ("transform", ("candidate", "readiness", "roles", "feedback", "actions", "tables"), build_ui_response)
+], timer=metrics.timer)
+
+# The same graph without per-stage timers, for batches: evaluate_many()
+# times the batch as a whole instead of every stage of every candidate
+batch_evaluation_graph = EvaluationGraph(evaluation_graph.nodes)
+
+
+def evaluate_state(candidate, feedback_text, previous=None):
+    """
+    Run the agent workflow through the evaluation graph.
+    Returns (stage values, names of the recomputed stages); the UI response
+    is values["transform"].
+    """
+    inputs = {"candidate": candidate, "feedback_text": feedback_text, "tables": scoring_engine.get_tables()}
+    return evaluation_graph.evaluate(inputs, previous)
+
+
+def evaluate_candidate(candidate, feedback_text):
+    """
+    Run the full agent workflow for a single candidate and return the
+    UI-compatible response dict. The agents work on compact records;
+    dicts are only built for the response.
+    """
+    values, _ = evaluate_state(candidate, feedback_text)
+    return values["transform"]
+
+
+def section_stages(fields):
+    """The evaluation graph stages the sections of a `fields` projection are built from."""
+    return {stage for section in fields for stage in SECTION_STAGES[section]}
+
+
+def evaluate_projected(candidate, feedback_text, fields):
+    """
+    The `fields` projection of the /api/evaluate response, running only the
+    stages the requested sections are built from (readiness.status alone
+    skips role matching and feedback analysis, for example).
+    """
+    tables = scoring_engine.get_tables()
+    values, _ = evaluation_graph.evaluate(
+        {"candidate": candidate, "feedback_text": feedback_text, "tables": tables}, targets=section_stages(fields)
+    )
+    with metrics.timer("transform"):
+        return build_ui_response(
+            candidate, values.get("readiness"), values.get("roles"), values.get("feedback"),
+            values.get("actions"), tables, fields=fields
+        )
+
+
+def evaluate_many(entries, tables=None, targets=None):
+    """
+    Stage values for many (candidate, feedback_text) pairs, like
+    evaluate_state() for each: the engine scores all of them in one call,
+    then each candidate's remaining stages run through the evaluation
+    graph with its engine result given.
+    tables: the ScoringTables to evaluate with (default: the active rules').
+    targets: the stages to compute, as for EvaluationGraph.evaluate()
+    (default: all).
+    """
+    if tables is None:
+        tables = scoring_engine.get_tables()
+    if targets is not None and "engine" not in batch_evaluation_graph.required(targets):
+        # e.g. only the feedback sections were requested
+        results = [None] * len(entries)
+    else:
+        with metrics.timer("batch_engine"):
+            results = scoring_engine.evaluate_candidates([candidate for candidate, _ in entries], tables)
+
+    states = []
+    with metrics.timer("batch_stages"):
+        for (candidate, feedback_text), result in zip(entries, results):
+            inputs = {"candidate": candidate, "feedback_text": feedback_text, "tables": tables}
+            values, _ = batch_evaluation_graph.evaluate(inputs, previous={**inputs, "engine": result}, targets=targets)
+            states.append(values)
+    return states
+
+
+def evaluate_entries(entries, fields=None):
+    """
+    The /api/evaluate responses (their `fields` projection if given) for
+    (candidate, feedback_text) pairs, from one evaluate_many() call.
+    """
+    tables = scoring_engine.get_tables()
+    if fields is None:
+        return [values["transform"] for values in evaluate_many(entries, tables)]
+
+    return [
+        build_ui_response(
+            candidate, values.get("readiness"), values.get("roles"), values.get("feedback"),
+            values.get("actions"), tables, fields=fields
+        )
+        for (candidate, _), values in zip(entries, evaluate_many(entries, tables, section_stages(fields)))
+    ]
+
+
+def batch_error(error, exception):
+    """An in-place error result (same shape as the single-candidate error responses)."""
+    return {
+        "success": False,
+        "error": error,
+        "message": str(exception)
+    }
+
+
+def parse_batch_item(data):
+    """
+    (candidate, feedback_text) of one entry of a batch request.
+    Raises ValueError when the entry is not a valid candidate.
+    """
+    if isinstance(data, ValueError):
+        # Placeholder for an entry that could not be parsed
+        raise data
+    if not isinstance(data, dict) or not data:
+        raise ValueError("Each candidate must be a non-empty JSON object")
+
+    return parse_candidate(data)
+
+
+def evaluate_entry(entry, fields=None):
+    """evaluate_entries() for one (candidate, feedback_text) pair, with its error returned in place."""
+    try:
+        return evaluate_entries([entry], fields)[0]
+    except ValueError as e:
+        return batch_error("Invalid input", e)
+    except Exception as e:
+        return batch_error("Internal server error", e)
+
+
+def evaluate_batch(items, fields=None):
+    """
+    Evaluate the entries of a batch request (their `fields` projection if
+    given), in input order. Every entry is validated first, then the valid
+    ones are evaluated together with one evaluate_many() call.
+    Errors are returned in place (same shape as the single-candidate error
+    responses) so one bad candidate never fails the whole batch.
+    """
+    results = []
+    entries, positions = [], []
+    for data in items:
+        try:
+            entries.append(parse_batch_item(data))
+        except ValueError as e:
+            results.append(batch_error("Invalid input", e))
+            continue
+        except Exception as e:
+            results.append(batch_error("Internal server error", e))
+            continue
+        positions.append(len(results))
+        results.append(None)
+
+    try:
+        responses = evaluate_entries(entries, fields)
+    except Exception:
+        # A candidate the agents reject (e.g. a non-string feedback) fails
+        # the shared call: evaluate one by one so only its entry fails
+        responses = [evaluate_entry(entry, fields) for entry in entries]
+
+    for position, response in zip(positions, responses):
+        results[position] = response
+    return results
+
+
+def evaluate_batch_item(data, fields=None):
+    """evaluate_batch() for a single entry of a batch request."""
+    return evaluate_batch([data], fields)[0]
@@ -0,0 +1,249 @@
+"""
+Optional persistence of evaluation results in a local SQLite database.
+
+Requests never touch the database on the write path: submit() only puts
+the response on a bounded queue, and a single background thread writes
+queued results in batches (one transaction per batch). The database runs
+in WAL mode, so queries read a consistent snapshot while the writer
+appends, and neither blocks the other.
+"""
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+from agents.feedback_agent import NO_GAPS_LABEL
+from services.json_provider import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    candidate_id TEXT,
+    evaluated_at REAL NOT NULL,
+    rule_version TEXT NOT NULL,
+    status TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    feedback TEXT NOT NULL,
+    result TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evaluation_gaps (
+    evaluation_id INTEGER NOT NULL REFERENCES evaluations (id),
+    source TEXT NOT NULL,
+    gap TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evaluations_status ON evaluations (status, id);
+CREATE INDEX IF NOT EXISTS evaluations_score ON evaluations (score, id);
+CREATE INDEX IF NOT EXISTS evaluations_candidate ON evaluations (candidate_id, id);
+CREATE INDEX IF NOT EXISTS evaluation_gaps_gap ON evaluation_gaps (gap, source, evaluation_id);
+"""
+
+# evaluation_gaps.source values
+ROLE_GAP = "role"          # a skill below some role's minimum
+FEEDBACK_GAP = "feedback"  # an area to improve found in the interview feedback
+
+MAX_PAGE_SIZE = 500
+
+
+def connect(path):
+    connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+    connection.execute("PRAGMA journal_mode=WAL")
+    # WAL keeps the database consistent with NORMAL; only the last
+    # transactions before a power loss can be lost
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+
+def result_gaps(result):
+    """(source, gap) pairs of one /api/evaluate response, for the gap index."""
+    gaps = {
+        (ROLE_GAP, skill)
+        for role in result["roleSuitability"]["notRecommended"]
+        for skill in role["gaps"]
+    }
+    gaps.update(
+        (FEEDBACK_GAP, gap) for gap in result["feedbackAnalysis"]["areasToImprove"] if gap != NO_GAPS_LABEL
+    )
+    return sorted(gaps)
+
+
+class ResultStore:
+    """
+    Evaluation results in SQLite, with indexes on status, score and gaps.
+
+    submit() is the non-blocking write path: results wait on a queue of at
+    most `max_pending` entries for the writer thread, which wakes up at
+    most every `flush_interval` seconds and stores up to `batch_size` of
+    them per transaction. When the queue is full a result is dropped (and
+    counted) rather than making the request wait.
+    """
+
+    def __init__(self, path, max_pending=10000, batch_size=500, flush_interval=0.1, clock=time.time):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._queue = queue.Queue(max_pending)
+        self._local = threading.local()
+        self.written = 0
+        self.dropped = 0
+        self.write_errors = 0
+
+        connection = connect(path)
+        connection.executescript(SCHEMA)
+        connection.close()
+
+        self._writer = threading.Thread(target=self._write_loop, name="result-store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    @property
+    def pending(self):
+        return self._queue.qsize()
+
+    def submit(self, candidate_id, feedback_text, result):
+        """Queue one /api/evaluate response for storage; never blocks."""
+        try:
+            self._queue.put_nowait((candidate_id, self._clock(), feedback_text, result))
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Wait until everything submitted so far is written."""
+        self._queue.join()
+
+    def close(self):
+        """Write what is queued and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    def _write_loop(self):
+        connection = connect(self.path)
+        while True:
+            item = self._queue.get()
+            if item is not None and self.flush_interval:
+                # Let a batch build up instead of waking per request
+                time.sleep(self.flush_interval)
+            batch = [item]
+            while item is not None and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    self._write(connection, records)
+                    self.written += len(records)
+            except Exception:
+                self.write_errors += len(records)
+                logger.exception("Failed to store %d evaluation results in %s", len(records), self.path)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if item is None:
+                connection.close()
+                return
+
+    @staticmethod
+    def _write(connection, records):
+        with connection:
+            # IMMEDIATE takes the write lock up front, so the ids assigned
+            # here stay free even with several processes sharing the file
+            connection.execute("BEGIN IMMEDIATE")
+            (last_id,) = connection.execute("SELECT coalesce(max(id), 0) FROM evaluations").fetchone()
+            evaluations = []
+            gaps = []
+            for evaluation_id, (candidate_id, evaluated_at, feedback_text, result) in enumerate(records, last_id + 1):
+                evaluations.append((
+                    evaluation_id, candidate_id, evaluated_at, result["ruleVersion"],
+                    result["readiness"]["status"], result["readiness"]["score"], feedback_text, dumps(result)
+                ))
+                gaps.extend((evaluation_id, source, gap) for source, gap in result_gaps(result))
+
+            connection.executemany(
+                "INSERT INTO evaluations (id, candidate_id, evaluated_at, rule_version, status, score, feedback, result)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                evaluations
+            )
+            connection.executemany("INSERT INTO evaluation_gaps (evaluation_id, source, gap) VALUES (?, ?, ?)", gaps)
+
+    def _connection(self):
+        # One read connection per thread (sqlite3 connections are not shared)
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = connect(self.path)
+        return connection
+
+    def query(self, status=None, min_score=None, max_score=None, gap=None, feedback_gap=None,
+              candidate_id=None, limit=50, cursor=None):
+        """
+        Stored evaluations matching all given filters, newest first, as
+        (rows, next cursor). Pass the returned cursor to get the next page;
+        it is None on the last page. Every filter is served by an index.
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        conditions = []
+        params = []
+
+        for column, value in (("status", status), ("candidate_id", candidate_id)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if min_score is not None:
+            conditions.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            conditions.append("score <= ?")
+            params.append(max_score)
+        for source, value in ((ROLE_GAP, gap), (FEEDBACK_GAP, feedback_gap)):
+            if value is not None:
+                conditions.append("id IN (SELECT evaluation_id FROM evaluation_gaps WHERE gap = ? AND source = ?)")
+                params.extend((value, source))
+        if cursor is not None:
+            conditions.append("id < ?")
+            params.append(int(cursor))
+
+        sql = "SELECT id, candidate_id, evaluated_at, feedback, result FROM evaluations"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self._connection().execute(sql, params).fetchall()
+        next_cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return [self._row(row) for row in rows[:limit]], next_cursor
+
+    def get(self, evaluation_id):
+        row = self._connection().execute(
+            "SELECT id, candidate_id, evaluated_at, feedback, result FROM evaluations WHERE id = ?",
+            (evaluation_id,)
+        ).fetchone()
+        return self._row(row) if row is not None else None
+
+    @staticmethod
+    def _row(row):
+        evaluation_id, candidate_id, evaluated_at, feedback_text, result = row
+        return {
+            "id": evaluation_id,
+            "candidateId": candidate_id,
+            "evaluatedAt": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(evaluated_at)),
+            "feedback": feedback_text,
+            "result": loads(result)
+        }
+
+    def stats(self):
+        return {
+            "path": self.path,
+            "pending": self.pending,
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors
+        }
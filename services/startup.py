@@ -0,0 +1,120 @@
+"""
+Startup profile: per-module import cost (from `python -X importtime`) and
+the cost of building each lazily initialized table.
+
+Run from the repository root:
+    python -m services.startup [--entry app] [--top 25] [--json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> zero-argument callable building (and caching) one table
+_init_steps = {}
+
+
+def register_init(name, build):
+    """
+    Register a lazily built table. Nothing runs at registration; warm_up()
+    builds every registered table (for preloading servers and profiling).
+    """
+    _init_steps[name] = build
+
+
+def warm_up():
+    """Build every registered table now; returns [(name, seconds)]."""
+    timings = []
+    for name, build in _init_steps.items():
+        start = perf_counter()
+        build()
+        timings.append((name, perf_counter() - start))
+    return timings
+
+
+def parse_importtime(stderr):
+    """
+    Parse `python -X importtime` output into
+    [(module, self microseconds, cumulative microseconds, depth)].
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+# Run in the profiled interpreter: import the entry module, time its
+# import as a whole, then build the lazy tables one by one
+_PROBE = """
+import json, sys
+from time import perf_counter
+start = perf_counter()
+import {entry}
+imported = perf_counter() - start
+from services.startup import warm_up
+print(json.dumps({{"import_seconds": imported, "init": warm_up()}}))
+"""
+
+
+def profile_startup(entry="app"):
+    """Profile a fresh interpreter importing `entry` and warming it up."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(entry=entry)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    probe = json.loads(process.stdout.strip().splitlines()[-1])
+    return {
+        "import_seconds": probe["import_seconds"],
+        "init": probe["init"],
+        "modules": parse_importtime(process.stderr)
+    }
+
+
+def by_package(modules):
+    """Self import time summed per top-level package, in microseconds."""
+    totals = {}
+    for name, self_us, _, _ in modules:
+        package = name.split(".")[0]
+        totals[package] = totals.get(package, 0) + self_us
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report import and init cost per module.")
+    parser.add_argument("--entry", default="app", help="module to import (default: app)")
+    parser.add_argument("--top", type=int, default=25, help="modules/packages to list")
+    parser.add_argument("--json", action="store_true", help="print the raw profile as JSON")
+    args = parser.parse_args()
+
+    profile = profile_startup(args.entry)
+    if args.json:
+        print(json.dumps(profile, indent=2))
+        return
+
+    modules = profile["modules"]
+    print(f"import {args.entry}: {profile['import_seconds'] * 1000:.1f} ms "
+          f"({len(modules)} modules)\n")
+
+    print(f"{'package':<32} {'self ms':>8}")
+    for package, self_us in by_package(modules)[:args.top]:
+        print(f"{package:<32} {self_us / 1000:>8.1f}")
+
+    print(f"\n{'module':<40} {'self ms':>8} {'cumul ms':>9}")
+    for name, self_us, cumulative_us, _ in sorted(modules, key=lambda m: m[2], reverse=True)[:args.top]:
+        print(f"{name:<40} {self_us / 1000:>8.1f} {cumulative_us / 1000:>9.1f}")
+
+    print(f"\n{'lazy table':<32} {'build ms':>8}")
+    for name, seconds in profile["init"]:
+        print(f"{name:<32} {seconds * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
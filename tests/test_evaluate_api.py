@@ -0,0 +1,57 @@
+"""
+/api/evaluate and /api/evaluate/batch input validation.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import os
+
+os.environ.setdefault("EVAL_CACHE_SIZE", "0")
+
+import pytest
+
+from app import app
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_non_string_feedback_is_invalid_input(client):
+    response = client.post("/api/evaluate", json={"sql": 70, "feedback": 42})
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid input"
+
+
+@pytest.mark.parametrize("score", ["99999999999999999999999", 101, -1])
+def test_out_of_range_score_is_invalid_input(client, score):
+    response = client.post("/api/evaluate", json={"python": score})
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid input"
+
+
+def test_cohort_summary_counts_out_of_range_score_as_error(client):
+    response = client.post("/api/cohort/summary", json=[{"sql": 70}, {"python": "99999999999999999999999"}])
+    assert response.status_code == 200
+    assert response.get_json()["errors"] == 1
+
+
+def test_batch_reports_invalid_entries_in_place(client):
+    batch = [{"sql": 70}, {"python": "99999999999999999999999"}, {"sql": 50, "feedback": 42}, {"ml": 80}]
+    response = client.post("/api/evaluate/batch", json=batch)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["count"] == 4 and body["success"] is True
+    assert [result.get("success", True) for result in body["results"]] == [True, False, False, True]
+    assert all(result["error"] == "Invalid input" for result in body["results"][1:3])
+
+
+def test_batch_result_that_cannot_be_encoded_is_an_error_in_place(client, monkeypatch):
+    monkeypatch.setattr("app.evaluate_batch", lambda candidates, fields: [{"success": True}, {"value": object()}])
+    response = client.post("/api/evaluate/batch", json=[{"sql": 70}, {"sql": 50}])
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["count"] == 2 and body["success"] is True
+    assert body["results"][0] == {"success": True}
+    assert body["results"][1]["error"] == "Internal server error"
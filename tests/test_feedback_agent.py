@@ -0,0 +1,46 @@
+"""
+Feedback analysis edge cases: hyphenated compounds and negation.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+from agents.feedback_agent import NO_GAPS_LABEL, SKILL_MAP, assess_feedback
+
+SQL_STRENGTH = SKILL_MAP["sql"]["strength_label"]
+SQL_GAP = SKILL_MAP["sql"]["gap_label"]
+ML_STRENGTH = SKILL_MAP["machine learning"]["strength_label"]
+ML_GAP = SKILL_MAP["machine learning"]["gap_label"]
+
+
+def test_hyphen_joins_skill_and_sentiment():
+    analysis = assess_feedback("sql-strong")
+    assert SQL_STRENGTH in analysis.strengths
+    assert analysis.gaps == (NO_GAPS_LABEL,)
+
+
+def test_hyphenated_skill_keyword():
+    assert ML_GAP in assess_feedback("Machine-learning was weak").gaps
+    assert ML_STRENGTH in assess_feedback("Strong machine-learning intuition").strengths
+
+
+def test_hyphenated_term_matches_with_or_without_hyphen():
+    assert ML_STRENGTH in assess_feedback("Very hands-on with ML").strengths
+    assert ML_STRENGTH in assess_feedback("Very hands on with ML").strengths
+    assert ML_GAP in assess_feedback("ML: no hands-on projects").gaps
+
+
+def test_negated_negative_is_neutral():
+    analysis = assess_feedback("sql was not weak but not strong either")
+    assert SQL_STRENGTH not in analysis.strengths
+    assert SQL_GAP not in analysis.gaps
+
+
+def test_negated_positive_is_a_gap():
+    analysis = assess_feedback("SQL wasn't very strong")
+    assert SQL_GAP in analysis.gaps
+    assert SQL_STRENGTH not in analysis.strengths
+
+
+def test_terms_match_whole_words_only():
+    analysis = assess_feedback("Strong HTML skills")
+    assert ML_STRENGTH not in analysis.strengths
@@ -0,0 +1,27 @@
+"""
+JSON encoding: values orjson cannot encode fall back to the stdlib encoder.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import json
+
+from app import app
+from services.json_provider import dumps_bytes
+
+BIG = 99999999999999999999999
+
+
+def test_dumps_bytes_encodes_integers_beyond_64_bits():
+    assert json.loads(dumps_bytes({"b": BIG, "a": 1})) == {"a": 1, "b": BIG}
+
+
+def test_iter_array_encodes_integers_beyond_64_bits():
+    body = b"".join(app.json.iter_array([{"score": 1}, {"score": BIG}]))
+    assert json.loads(body) == [{"score": 1}, {"score": BIG}]
+
+
+def test_iter_array_replaces_items_that_cannot_be_encoded():
+    items = [{"score": 1}, {"score": object()}, {"score": 3}]
+    body = b"".join(app.json.iter_array(items, on_error=lambda item, e: {"error": type(e).__name__}))
+    assert json.loads(body) == [{"score": 1}, {"error": "TypeError"}, {"score": 3}]
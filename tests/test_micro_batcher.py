@@ -0,0 +1,51 @@
+"""
+Micro-batching: one failing item must not fail the rest of its batch.
+
+Run from the repository root:
+    python -m pytest tests
+"""
+import threading
+
+import pytest
+
+from services.micro_batcher import MicroBatcher
+
+
+def square_all(items):
+    if any(item < 0 for item in items):
+        raise ValueError("negative item")
+    return [item * item for item in items]
+
+
+def submit_together(batcher, items):
+    """submit() every item from its own thread; {item: result or exception}."""
+    outcomes = {}
+
+    def call(item):
+        try:
+            outcomes[item] = batcher.submit(item)
+        except Exception as e:
+            outcomes[item] = e
+
+    threads = [threading.Thread(target=call, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_failing_item_only_fails_its_own_caller():
+    batcher = MicroBatcher(square_all, window=0.2, max_batch=len(range(-1, 5)))
+    outcomes = submit_together(batcher, range(-1, 5))
+
+    assert batcher.batches == 1
+    assert isinstance(outcomes.pop(-1), ValueError)
+    assert outcomes == {item: item * item for item in range(5)}
+
+
+def test_single_failing_item_raises():
+    batcher = MicroBatcher(square_all, window=0)
+    with pytest.raises(ValueError):
+        batcher.submit(-3)
+    assert batcher.submit(3) == 9